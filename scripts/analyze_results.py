@@ -26,6 +26,7 @@ import numpy as np
 from typing import Dict, List
 import json
 
+from solana_rl_bot.data.processors import load_features
 from solana_rl_bot.environment import TradingEnv
 from solana_rl_bot.agents import PPOAgent
 from solana_rl_bot.utils import get_logger
@@ -248,9 +249,9 @@ def main():
     logger.info("Lade Test-Daten...")
 
     try:
-        df = pd.read_csv("data/processed/sol_usdt_features.csv", index_col=0, parse_dates=True)
+        df = load_features()
         train_size = int(len(df) * 0.8)
-        test_df = df[train_size:].copy()
+        test_df = df.iloc[train_size:]
         logger.info(f"Test-Daten geladen: {len(test_df)} Candles\n")
     except FileNotFoundError:
         logger.error("Keine Daten gefunden!")
@@ -0,0 +1,154 @@
+"""
+Gemeinsame Helfer für die Environment-Test-Scripts.
+
+Wird von scripts/test_trading_env.py und scripts/test_reward_functions.py
+importiert (scripts/ liegt beim Aufruf als Script auf sys.path).
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from rich.console import Console
+
+console = Console()
+
+MARKET_DATA_CACHE_DIR = Path("logs/test")
+MARKET_DATA_TTL = 3600  # Sekunden
+
+
+@lru_cache(maxsize=1)
+def _load_market_data(symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+    """Lade Marktdaten mit Features aus dem Cache oder von Binance.
+
+    Innerhalb eines Prozesses wird dasselbe DataFrame wiederverwendet, zwischen
+    Läufen dient eine Pickle-Datei in logs/test/ als Cache (TTL: MARKET_DATA_TTL).
+    Das zurückgegebene DataFrame ist geteilt und darf nicht verändert werden,
+    Aufrufer gehen über get_market_data().
+    """
+    cache_path = MARKET_DATA_CACHE_DIR / (
+        f"market_data_{symbol.replace('/', '_')}_{timeframe}_{limit}.pkl"
+    )
+
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < MARKET_DATA_TTL:
+        df_features = pd.read_pickle(cache_path)
+        console.print(f"[green]✅ {len(df_features)} Candles aus Cache geladen[/green]")
+        return df_features
+
+    # Erst bei Cache-Miss importieren (ccxt, pandas-ta)
+    from solana_rl_bot.data.collectors import BinanceConnector
+    from solana_rl_bot.data.features import FeatureCalculator
+
+    api_key = os.getenv("BINANCE_API_KEY")
+    api_secret = os.getenv("BINANCE_API_SECRET")
+    testnet = os.getenv("BINANCE_TESTNET", "false").lower() == "true"
+
+    with BinanceConnector(api_key, api_secret, testnet) as connector:
+        # Hole OHLCV Daten
+        df = connector.fetch_ohlcv(
+            symbol=symbol,
+            timeframe=timeframe,
+            limit=limit,
+        )
+
+        console.print(f"[green]✅ {len(df)} OHLCV Candles abgerufen[/green]")
+
+        # Berechne Features
+        calculator = FeatureCalculator()
+        df_features = calculator.calculate_all_features(df, symbol=symbol)
+
+        console.print(f"[green]✅ {len(df_features.columns)} Features berechnet[/green]")
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    df_features.to_pickle(cache_path)
+
+    return df_features
+
+
+def get_market_data(symbol: str = "SOL/USDT", timeframe: str = "5m", limit: int = 500):
+    """Hole echte Marktdaten mit Features.
+
+    Jeder Aufrufer bekommt eine eigene Kopie des gecachten DataFrames.
+    """
+    console.print("\n[bold cyan]Hole Marktdaten...[/bold cyan]")
+
+    try:
+        return _load_market_data(symbol, timeframe, limit).copy()
+
+    except Exception as e:
+        console.print(f"[red]❌ Fehler beim Datenabruf: {e}[/red]")
+        return None
+
+
+_worker_df = None
+_worker_envs = {}
+
+
+def _init_worker(df: pd.DataFrame) -> None:
+    """Übergebe das Markt-DataFrame einmal pro Worker-Prozess."""
+    global _worker_df
+    _worker_df = df
+
+
+def _run_episode(reward_type: str, seed: int) -> dict:
+    """
+    Laufe eine Random-Agent Episode in einem Worker-Prozess.
+
+    Args:
+        reward_type: Typ der Reward Function
+        seed: Seed für Environment-Reset und Actions
+
+    Returns:
+        Dictionary mit Episode-Ergebnissen
+    """
+    from solana_rl_bot.environment import TradingEnv
+    from solana_rl_bot.utils import logging_disabled
+
+    env = _worker_envs.get(reward_type)
+    if env is None:
+        env = TradingEnv(df=_worker_df, initial_balance=10000.0, reward_type=reward_type)
+        _worker_envs[reward_type] = env
+
+    observation, info = env.reset(seed=seed)
+
+    n_steps = len(_worker_df) - env.window_size - 1
+    actions = env.np_random.integers(0, env.action_space.n, size=n_steps, dtype=np.int8)
+
+    with logging_disabled():
+        rewards, done = env.step_batch(actions)
+
+    episode_reward = float(rewards.sum())
+
+    stats = env.trade_stats
+
+    return {
+        "total_return": env.total_return,
+        "episode_reward": episode_reward,
+        "win_rate": stats.win_rate,
+        "completed_trades": stats.n_completed,
+    }
+
+
+@contextmanager
+def episode_pool(df: pd.DataFrame):
+    """
+    Prozess-Pool für Random-Agent Episodes.
+
+    Pro Script einmal öffnen: das DataFrame geht über den Initializer einmal an
+    jeden Worker, und die Worker behalten ihre Envs pro Reward-Typ über alle
+    run_episodes()-Aufrufe hinweg.
+    """
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1, initializer=_init_worker, initargs=(df,)
+    ) as executor:
+        yield executor
+
+
+def run_episodes(pool: ProcessPoolExecutor, reward_type: str, n_episodes: int) -> list:
+    """Laufe unabhängige Episodes parallel im Pool aus episode_pool()."""
+    return list(pool.map(partial(_run_episode, reward_type), range(n_episodes)))
@@ -19,6 +19,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pandas as pd
+from solana_rl_bot.data.processors import load_features
 from solana_rl_bot.environment import TradingEnv
 from solana_rl_bot.agents import PPOAgent
 from solana_rl_bot.utils import get_logger
@@ -126,7 +127,7 @@ def main():
     logger.info("Lade Training-Daten...")
 
     try:
-        df = pd.read_csv("data/processed/sol_usdt_features.csv", index_col=0, parse_dates=True)
+        df = load_features()
         logger.info(f"Daten geladen: {len(df)} Candles\n")
     except FileNotFoundError:
         logger.error("Keine Daten gefunden! Bitte zuerst download_real_data.py ausführen.")
@@ -134,8 +135,8 @@ def main():
 
     # 2. Split Train/Test
     train_size = int(len(df) * 0.8)
-    train_df = df[:train_size].copy()
-    test_df = df[train_size:].copy()
+    train_df = df.iloc[:train_size]
+    test_df = df.iloc[train_size:]
 
     logger.info(f"Train: {len(train_df)} Candles")
     logger.info(f"Test: {len(test_df)} Candles\n")
@@ -131,9 +131,8 @@ class DatabaseTester:
         """Test inserting OHLCV data."""
         try:
             # Generate sample data
-            timestamps = pd.date_range(
-                start=datetime.now() - timedelta(days=7), periods=100, freq="5min"
-            )
+            start = np.datetime64(datetime.now() - timedelta(days=7), "ns")
+            timestamps = start + np.arange(100, dtype=np.int64) * np.timedelta64(5, "m")
 
             df = pd.DataFrame(
                 {
@@ -179,9 +178,8 @@ class DatabaseTester:
     def test_insert_features(self) -> bool:
         """Test inserting feature data."""
         try:
-            timestamps = pd.date_range(
-                start=datetime.now() - timedelta(days=7), periods=50, freq="5min"
-            )
+            start = np.datetime64(datetime.now() - timedelta(days=7), "ns")
+            timestamps = start + np.arange(50, dtype=np.int64) * np.timedelta64(5, "m")
 
             df = pd.DataFrame(
                 {
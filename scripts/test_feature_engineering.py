@@ -33,9 +33,20 @@ load_dotenv()
 from solana_rl_bot.data.features import FeatureCalculator, FeaturePipeline
 from solana_rl_bot.data.collectors import BinanceConnector, DataCollector
 from solana_rl_bot.data.storage.db_manager import DatabaseManager
-from solana_rl_bot.utils import LoggerSetup
+from solana_rl_bot.utils import LoggerSetup, get_logger
 
 console = Console()
+logger = get_logger(__name__)
+
+_db = None
+
+
+def get_db() -> DatabaseManager:
+    """Gemeinsamer DatabaseManager für alle Tests (lazy, ein Connection-Pool)."""
+    global _db
+    if _db is None:
+        _db = DatabaseManager()
+    return _db
 
 
 def test_feature_calculator():
@@ -107,8 +118,7 @@ def test_feature_calculator():
 
     except Exception as e:
         console.print(f"[red]❌ FeatureCalculator Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        logger.exception("test failed")
         return False
 
 
@@ -148,8 +158,7 @@ def test_feature_importance():
 
     except Exception as e:
         console.print(f"[red]❌ Feature Importance Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        logger.exception("test failed")
         return False
 
 
@@ -167,7 +176,7 @@ def test_feature_pipeline():
             df = connector.fetch_ohlcv("BTC/USDT", "5m", limit=300)
 
             # Initialisiere Pipeline
-            db = DatabaseManager()
+            db = get_db()
             pipeline = FeaturePipeline(db_manager=db)
 
             # Verarbeite Daten (mit DB-Save)
@@ -197,8 +206,7 @@ def test_feature_pipeline():
 
     except Exception as e:
         console.print(f"[red]❌ FeaturePipeline Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        logger.exception("test failed")
         return False
 
 
@@ -216,7 +224,7 @@ def test_feature_quality_analysis():
             df = connector.fetch_ohlcv("ETH/USDT", "5m", limit=300)
 
             # Berechne Features
-            db = DatabaseManager()
+            db = get_db()
             pipeline = FeaturePipeline(db_manager=db)
             df_features = pipeline.process_ohlcv_data(
                 df, "ETH/USDT", "5m", save_to_db=False
@@ -250,8 +258,7 @@ def test_feature_quality_analysis():
 
     except Exception as e:
         console.print(f"[red]❌ Quality Analysis Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        logger.exception("test failed")
         return False
 
 
@@ -266,7 +273,7 @@ def test_database_integration():
         testnet = os.getenv("BINANCE_TESTNET", "false").lower() == "true"
 
         with BinanceConnector(api_key, api_secret, testnet) as connector:
-            db = DatabaseManager()
+            db = get_db()
 
             # Sammle OHLCV
             collector = DataCollector(connector, db)
@@ -310,8 +317,7 @@ def test_database_integration():
 
     except Exception as e:
         console.print(f"[red]❌ DB Integration Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        logger.exception("test failed")
         return False
 
 
@@ -349,6 +355,9 @@ def main():
             console.print(f"[red]❌ {name} crashed: {e}[/red]")
             results.append((name, False))
 
+    if _db is not None:
+        _db.close()
+
     # Summary
     console.print("\n" + "=" * 60)
     console.print("[bold cyan]Test Summary[/bold cyan]")
@@ -166,7 +166,7 @@ def test_log_levels():
     console.print("\n[bold cyan]Testing Log Levels...[/bold cyan]")
 
     # Test that DEBUG messages appear when log level is DEBUG
-    LoggerSetup.setup(log_level="DEBUG", log_to_file=False)
+    LoggerSetup.set_level("DEBUG")
 
     logger = get_logger(__name__)
     logger.debug("This DEBUG message should appear")
@@ -174,8 +174,7 @@ def test_log_levels():
 
     # Change to INFO level
     console.print("\n[yellow]Changing log level to INFO...[/yellow]")
-    LoggerSetup._initialized = False  # Reset to allow re-initialization
-    LoggerSetup.setup(log_level="INFO", log_to_file=False)
+    LoggerSetup.set_level("INFO")
 
     logger.debug("This DEBUG message should NOT appear")
     logger.info("This INFO message should appear")
@@ -12,7 +12,6 @@ Usage:
 """
 
 import sys
-import os
 from pathlib import Path
 import numpy as np
 import pandas as pd
@@ -24,59 +23,29 @@ sys.path.insert(0, str(project_root / "src"))
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import track
+from rich.progress import Progress
 
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
-from solana_rl_bot.environment import TradingEnv, RewardFactory
-from solana_rl_bot.data.collectors import BinanceConnector
-from solana_rl_bot.data.features import FeatureCalculator
-from solana_rl_bot.utils import LoggerSetup
+from solana_rl_bot.utils import LoggerSetup, get_logger, logging_disabled
 
-console = Console()
-
-
-def get_market_data():
-    """Hole echte Marktdaten mit Features."""
-    console.print("\n[bold cyan]Hole Marktdaten...[/bold cyan]")
-
-    try:
-        api_key = os.getenv("BINANCE_API_KEY")
-        api_secret = os.getenv("BINANCE_API_SECRET")
-        testnet = os.getenv("BINANCE_TESTNET", "false").lower() == "true"
-
-        with BinanceConnector(api_key, api_secret, testnet) as connector:
-            # Hole OHLCV Daten
-            df = connector.fetch_ohlcv(
-                symbol="SOL/USDT",
-                timeframe="5m",
-                limit=500,
-            )
-
-            console.print(f"[green]✅ {len(df)} OHLCV Candles abgerufen[/green]")
+from env_test_utils import episode_pool, get_market_data, run_episodes
 
-            # Berechne Features
-            calculator = FeatureCalculator()
-            df_features = calculator.calculate_all_features(df, symbol="SOL/USDT")
-
-            console.print(f"[green]✅ {len(df_features.columns)} Features berechnet[/green]")
-
-            return df_features
-
-    except Exception as e:
-        console.print(f"[red]❌ Fehler beim Datenabruf: {e}[/red]")
-        return None
+console = Console()
+logger = get_logger(__name__)
 
+# (Name, exc_info) fehlgeschlagener Tests – Tracebacks erst in der Summary ausgeben
+_failures = []
 
-def test_reward_function(reward_type: str, df: pd.DataFrame, n_episodes: int = 3):
+def test_reward_function(reward_type: str, pool, n_episodes: int = 3):
     """
     Teste eine Reward Function mit Random Agent.
 
     Args:
         reward_type: Typ der Reward Function
-        df: DataFrame mit Marktdaten
+        pool: Prozess-Pool aus episode_pool()
         n_episodes: Anzahl Test-Episodes
 
     Returns:
@@ -85,35 +54,12 @@ def test_reward_function(reward_type: str, df: pd.DataFrame, n_episodes: int = 3
     console.print(f"\n[bold cyan]Testing {reward_type.upper()} Reward...[/bold cyan]")
 
     try:
-        # Erstelle Environment mit Reward Function
-        env = TradingEnv(
-            df=df,
-            initial_balance=10000.0,
-            reward_type=reward_type,
-        )
-
-        returns = []
-        total_rewards = []
-        win_rates = []
-        num_trades = []
-
-        for episode in range(n_episodes):
-            observation, info = env.reset()
-
-            done = False
-            truncated = False
-            episode_reward = 0
-
-            while not (done or truncated):
-                action = env.action_space.sample()
-                obs, reward, done, truncated, info = env.step(action)
-                episode_reward += reward
+        episodes = run_episodes(pool, reward_type, n_episodes)
 
-            stats = env.get_trade_statistics()
-            returns.append(stats['total_return'])
-            total_rewards.append(episode_reward)
-            win_rates.append(stats.get('win_rate', 0))
-            num_trades.append(stats.get('completed_trades', 0))
+        returns = [e["total_return"] for e in episodes]
+        total_rewards = [e["episode_reward"] for e in episodes]
+        win_rates = [e["win_rate"] for e in episodes]
+        num_trades = [e["completed_trades"] for e in episodes]
 
         # Aggregiere Ergebnisse
         results = {
@@ -134,8 +80,7 @@ def test_reward_function(reward_type: str, df: pd.DataFrame, n_episodes: int = 3
 
     except Exception as e:
         console.print(f"[red]❌ Test für {reward_type} fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        _failures.append((f"{reward_type} Reward", sys.exc_info()))
         return None
 
 
@@ -152,10 +97,14 @@ def compare_reward_functions():
     reward_types = ["profit", "sharpe", "sortino", "multi", "incremental"]
     results = []
 
-    for reward_type in reward_types:
-        result = test_reward_function(reward_type, df, n_episodes=5)
-        if result:
-            results.append(result)
+    with episode_pool(df) as pool:
+        for reward_type in reward_types:
+            result = test_reward_function(reward_type, pool, n_episodes=5)
+            if result:
+                results.append(result)
+
+    if not results:
+        return False
 
     # Zeige Vergleich
     console.print("\n[bold cyan]Reward Function Comparison[/bold cyan]")
@@ -168,15 +117,19 @@ def compare_reward_functions():
     table.add_column("Avg Trades", style="blue")
     table.add_column("Best Return", style="green")
 
-    for result in results:
-        table.add_row(
-            result["reward_type"].upper(),
-            f"{result['avg_return']*100:+.2f}%",
-            f"{result['avg_reward']:.2f}",
-            f"{result['avg_win_rate']*100:.1f}%",
-            f"{result['avg_trades']:.0f}",
-            f"{result['best_return']*100:+.2f}%",
-        )
+    # Alle Zellen spaltenweise formatieren, dann in einem Durchlauf einfügen
+    results_df = pd.DataFrame(results)
+    cells = pd.DataFrame({
+        "reward_type": results_df["reward_type"].str.upper(),
+        "avg_return": (results_df["avg_return"] * 100).map("{:+.2f}%".format),
+        "avg_reward": results_df["avg_reward"].map("{:.2f}".format),
+        "avg_win_rate": (results_df["avg_win_rate"] * 100).map("{:.1f}%".format),
+        "avg_trades": results_df["avg_trades"].map("{:.0f}".format),
+        "best_return": (results_df["best_return"] * 100).map("{:+.2f}%".format),
+    })
+
+    for row in cells.itertuples(index=False):
+        table.add_row(*row)
 
     console.print(table)
 
@@ -209,6 +162,8 @@ def compare_reward_functions():
 
 def test_single_reward():
     """Teste einzelne Reward Function im Detail."""
+    from solana_rl_bot.environment import TradingEnv
+
     console.print("\n[bold cyan]Testing Single Reward Function (Multi-Objective)...[/bold cyan]")
 
     try:
@@ -227,26 +182,26 @@ def test_single_reward():
         observation, info = env.reset()
         console.print(f"\n[cyan]Running Episode...[/cyan]")
 
-        done = False
-        truncated = False
         step_count = 0
-        rewards_log = []
+        n_steps = len(df) - env.window_size - 1
+
+        # Random Actions vorab ziehen, Rewards in vorallokierten Buffer schreiben
+        actions = env.np_random.integers(0, env.action_space.n, size=n_steps, dtype=np.int8)
+        rewards_arr = np.empty(n_steps, dtype=np.float32)
 
-        for i in track(range(len(df) - env.window_size - 1), description="Steps"):
-            action = env.action_space.sample()
-            obs, reward, done, truncated, info = env.step(action)
+        with logging_disabled(), Progress() as progress:
+            task = progress.add_task("Steps", total=n_steps)
 
-            rewards_log.append({
-                "step": step_count,
-                "action": ["HOLD", "BUY", "SELL"][action],
-                "reward": reward,
-                "portfolio_value": info["portfolio_value"],
-            })
+            # In Blöcken von 32 Steps laufen, Progress einmal pro Block aktualisieren
+            for start in range(0, n_steps, 32):
+                rewards, done = env.step_batch(actions[start:start + 32])
+                rewards_arr[start:start + len(rewards)] = rewards
+                step_count += len(rewards)
 
-            step_count += 1
+                progress.update(task, completed=step_count)
 
-            if done or truncated:
-                break
+                if done:
+                    break
 
         # Statistiken
         stats = env.get_trade_statistics()
@@ -260,20 +215,19 @@ def test_single_reward():
         console.print(f"  Final Portfolio: ${stats['final_portfolio_value']:.2f}")
 
         # Reward Statistics
-        rewards_array = np.array([r["reward"] for r in rewards_log])
+        rewards_arr = rewards_arr[:step_count]
         console.print(f"\n[cyan]Reward Statistics:[/cyan]")
-        console.print(f"  Total Reward: {np.sum(rewards_array):.2f}")
-        console.print(f"  Mean Reward: {np.mean(rewards_array):.4f}")
-        console.print(f"  Std Reward: {np.std(rewards_array):.4f}")
-        console.print(f"  Max Reward: {np.max(rewards_array):.4f}")
-        console.print(f"  Min Reward: {np.min(rewards_array):.4f}")
+        console.print(f"  Total Reward: {rewards_arr.sum():.2f}")
+        console.print(f"  Mean Reward: {rewards_arr.mean():.4f}")
+        console.print(f"  Std Reward: {rewards_arr.std():.4f}")
+        console.print(f"  Max Reward: {rewards_arr.max():.4f}")
+        console.print(f"  Min Reward: {rewards_arr.min():.4f}")
 
         return True
 
     except Exception as e:
         console.print(f"[red]❌ Single Reward Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        _failures.append(("Single Reward", sys.exc_info()))
         return False
 
 
@@ -316,6 +270,9 @@ def main():
         status = "[green]✅ PASS[/green]" if result else "[red]❌ FAIL[/red]"
         console.print(f"{status} {name}")
 
+    for name, exc_info in _failures:
+        logger.opt(exception=exc_info).error("{} fehlgeschlagen", name)
+
     console.print("=" * 60)
     console.print(f"\nTotal: {passed}/{total} bestanden ({passed/total*100:.1f}%)")
 
@@ -13,7 +13,6 @@ Usage:
 """
 
 import sys
-import os
 from pathlib import Path
 import numpy as np
 
@@ -24,54 +23,26 @@ sys.path.insert(0, str(project_root / "src"))
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import track
+from rich.progress import Progress
 
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
-from solana_rl_bot.environment import TradingEnv
-from solana_rl_bot.data.collectors import BinanceConnector
-from solana_rl_bot.data.features import FeatureCalculator
-from solana_rl_bot.utils import LoggerSetup
+from solana_rl_bot.utils import LoggerSetup, get_logger, logging_disabled
 
-console = Console()
-
-
-def get_market_data():
-    """Hole echte Marktdaten mit Features."""
-    console.print("\n[bold cyan]Hole Marktdaten...[/bold cyan]")
-
-    try:
-        api_key = os.getenv("BINANCE_API_KEY")
-        api_secret = os.getenv("BINANCE_API_SECRET")
-        testnet = os.getenv("BINANCE_TESTNET", "false").lower() == "true"
-
-        with BinanceConnector(api_key, api_secret, testnet) as connector:
-            # Hole OHLCV Daten
-            df = connector.fetch_ohlcv(
-                symbol="SOL/USDT",
-                timeframe="5m",
-                limit=500,  # Genug für Training
-            )
+from env_test_utils import episode_pool, get_market_data, run_episodes
 
-            console.print(f"[green]✅ {len(df)} OHLCV Candles abgerufen[/green]")
-
-            # Berechne Features
-            calculator = FeatureCalculator()
-            df_features = calculator.calculate_all_features(df, symbol="SOL/USDT")
-
-            console.print(f"[green]✅ {len(df_features.columns)} Features berechnet[/green]")
-
-            return df_features
-
-    except Exception as e:
-        console.print(f"[red]❌ Fehler beim Datenabruf: {e}[/red]")
-        return None
+console = Console()
+logger = get_logger(__name__)
 
+# (Name, exc_info) fehlgeschlagener Tests – Tracebacks erst in der Summary ausgeben
+_failures = []
 
 def test_environment_init():
     """Teste Environment Initialisierung."""
+    from solana_rl_bot.environment import TradingEnv
+
     console.print("\n[bold cyan]Testing Environment Initialization...[/bold cyan]")
 
     try:
@@ -107,13 +78,14 @@ def test_environment_init():
 
     except Exception as e:
         console.print(f"[red]❌ Init Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        _failures.append(("Init", sys.exc_info()))
         return False
 
 
 def test_action_execution():
     """Teste Action Execution."""
+    from solana_rl_bot.environment import TradingEnv
+
     console.print("\n[bold cyan]Testing Action Execution...[/bold cyan]")
 
     try:
@@ -151,13 +123,14 @@ def test_action_execution():
 
     except Exception as e:
         console.print(f"[red]❌ Action Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        _failures.append(("Action", sys.exc_info()))
         return False
 
 
 def test_random_agent():
     """Teste Environment mit Random Agent."""
+    from solana_rl_bot.environment import TradingEnv
+
     console.print("\n[bold cyan]Testing Random Agent...[/bold cyan]")
 
     try:
@@ -174,19 +147,24 @@ def test_random_agent():
         steps = 0
 
         # Laufe Episode
-        done = False
-        truncated = False
+        n_steps = len(df) - env.window_size - 1
 
-        for i in track(range(len(df) - env.window_size - 1), description="Steps"):
-            # Random Action
-            action = env.action_space.sample()
+        # Random Actions für die ganze Episode vorab ziehen (env RNG für Reproduzierbarkeit)
+        actions = env.np_random.integers(0, env.action_space.n, size=n_steps, dtype=np.int8)
 
-            obs, reward, done, truncated, info = env.step(action)
-            total_reward += reward
-            steps += 1
+        with logging_disabled(), Progress() as progress:
+            task = progress.add_task("Steps", total=n_steps)
 
-            if done or truncated:
-                break
+            # In Blöcken von 32 Steps laufen, Progress einmal pro Block aktualisieren
+            for start in range(0, n_steps, 32):
+                rewards, done = env.step_batch(actions[start:start + 32])
+                total_reward += float(rewards.sum())
+                steps += len(rewards)
+
+                progress.update(task, completed=steps)
+
+                if done:
+                    break
 
         # Statistiken
         stats = env.get_trade_statistics()
@@ -222,8 +200,7 @@ def test_random_agent():
 
     except Exception as e:
         console.print(f"[red]❌ Random Agent Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        _failures.append(("Random Agent", sys.exc_info()))
         return False
 
 
@@ -236,32 +213,19 @@ def test_multiple_episodes():
         if df is None:
             return False
 
-        env = TradingEnv(df=df, initial_balance=10000.0)
-
         n_episodes = 5
-        returns = []
 
         console.print(f"\nLaufe {n_episodes} Episodes...")
 
-        for episode in range(n_episodes):
-            observation, info = env.reset()
-
-            done = False
-            truncated = False
-            episode_reward = 0
-
-            while not (done or truncated):
-                action = env.action_space.sample()
-                obs, reward, done, truncated, info = env.step(action)
-                episode_reward += reward
-
-            stats = env.get_trade_statistics()
-            returns.append(stats['total_return'])
+        with episode_pool(df) as pool:
+            episodes = run_episodes(pool, "profit", n_episodes)
+        returns = [e["total_return"] for e in episodes]
 
+        for episode, result in enumerate(episodes):
             console.print(
                 f"  Episode {episode+1}: "
-                f"Return: {stats['total_return']*100:+.2f}%, "
-                f"Trades: {stats.get('completed_trades', 0)}"
+                f"Return: {result['total_return']*100:+.2f}%, "
+                f"Trades: {result['completed_trades']}"
             )
 
         # Durchschnittliche Performance
@@ -278,8 +242,7 @@ def test_multiple_episodes():
 
     except Exception as e:
         console.print(f"[red]❌ Multiple Episodes Test fehlgeschlagen: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        _failures.append(("Multiple Episodes", sys.exc_info()))
         return False
 
 
@@ -324,6 +287,9 @@ def main():
         status = "[green]✅ PASS[/green]" if result else "[red]❌ FAIL[/red]"
         console.print(f"{status} {name}")
 
+    for name, exc_info in _failures:
+        logger.opt(exception=exc_info).error("{} fehlgeschlagen", name)
+
     console.print("=" * 60)
     console.print(f"\nTotal: {passed}/{total} bestanden ({passed/total*100:.1f}%)")
 
@@ -11,23 +11,26 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-import pandas as pd
-from solana_rl_bot.environment import TradingEnv
+from solana_rl_bot.data.processors import load_features
+from solana_rl_bot.environment import TradingEnv, build_env_fn
 from solana_rl_bot.agents import DQNAgent
-from solana_rl_bot.utils import get_logger
+from solana_rl_bot.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
 
 def main():
     """Trainiere DQN Agent."""
+    # Setup logging
+    setup_logging()
+
     logger.info("=== DQN Training Start ===\n")
 
     # 1. Lade Daten
     logger.info("Lade Training-Daten...")
 
     try:
-        df = pd.read_csv("data/processed/sol_usdt_features.csv", index_col=0, parse_dates=True)
+        df = load_features()
         logger.info(f"Daten geladen: {len(df)} Candles\n")
     except FileNotFoundError:
         logger.error("Keine Daten gefunden! Bitte zuerst download_real_data.py ausfuehren.")
@@ -39,8 +42,8 @@ def main():
 
     # 2. Split Train/Test
     train_size = int(len(df) * 0.8)
-    train_df = df[:train_size].copy()
-    test_df = df[train_size:].copy()
+    train_df = df.iloc[:train_size]
+    test_df = df.iloc[train_size:]
 
     logger.info(f"Train: {len(train_df)} Candles")
     logger.info(f"Test: {len(test_df)} Candles\n")
@@ -48,8 +51,10 @@ def main():
     # 3. Erstelle Environments
     logger.info("Erstelle Trading Environments...")
 
-    train_env = TradingEnv(
-        df=train_df,
+    # Factory statt fertigem Env: jeder SubprocVecEnv Worker baut sein eigenes,
+    # die Daten liegen einmal im Shared Memory statt gepickelt pro Worker
+    make_train_env = build_env_fn(
+        train_df,
         initial_balance=10000.0,
         commission=0.001,
         window_size=50,
@@ -70,12 +75,17 @@ def main():
     logger.info("Initialisiere DQN Agent...")
 
     agent = DQNAgent(
-        env=train_env,
+        env_fn=make_train_env,
+        n_envs=4,
         learning_rate=1e-4,
         buffer_size=100_000,
         learning_starts=10_000,
         batch_size=128,
         gamma=0.99,
+        # 4 Envs liefern 4 Transitions pro Step: 1 Gradient Step pro Step
+        # haelt das Verhaeltnis von 1 Update pro 4 Transitions
+        train_freq=1,
+        gradient_steps=1,
         target_update_interval=10_000,
         exploration_fraction=0.1,
         exploration_initial_eps=1.0,
@@ -97,6 +107,7 @@ def main():
         n_eval_episodes=5,
         save_path="./models/dqn/",
         checkpoint_freq=100_000,
+        early_stop_patience=8,  # 200k Steps ohne Verbesserung
     )
 
     logger.info("\n=== Training Complete! ===\n")
@@ -115,7 +126,7 @@ def main():
     logger.info("TRAINING SUMMARY")
     logger.info("=" * 50)
     logger.info(f"Total Training Steps: 500,000")
-    logger.info(f"Training Episodes: {len(train_df) // train_env.window_size}")
+    logger.info(f"Training Episodes: {len(train_df) // test_env.window_size}")
     logger.info(f"\nFinal Test Performance:")
     logger.info(f"  Mean Return: {stats['mean_return']*100:.2f}%")
     logger.info(f"  Best Return: {stats['max_return']*100:.2f}%")
@@ -124,6 +135,8 @@ def main():
     logger.info(f"\nModel gespeichert in: ./models/dqn/")
     logger.info("=" * 50)
 
+    agent.close()
+
 
 if __name__ == "__main__":
     main()
@@ -9,24 +9,31 @@ Trainiert beide Agents unter identischen Bedingungen:
 - 500k Training Steps
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import pandas as pd
 import argparse
+import torch
+from solana_rl_bot.data.processors import load_features
 from solana_rl_bot.environment import TradingEnv
 from solana_rl_bot.agents import PPOAgent, DQNAgent
 from solana_rl_bot.risk import RiskConfigFactory
-from solana_rl_bot.utils import get_logger
+from solana_rl_bot.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
 
 def train_agent(agent_type: str, train_df: pd.DataFrame, test_df: pd.DataFrame,
-                risk_config, total_timesteps: int = 500_000):
+                risk_config, total_timesteps: int = 500_000,
+                train_norm: Optional[pd.DataFrame] = None,
+                test_norm: Optional[pd.DataFrame] = None):
     """Trainiere einen Agent mit Risk Management."""
 
     logger.info(f"\n{'='*60}")
@@ -42,6 +49,7 @@ def train_agent(agent_type: str, train_df: pd.DataFrame, test_df: pd.DataFrame,
         reward_type="sortino",  # Winner!
         use_risk_management=True,
         risk_config=risk_config,
+        df_normalized=train_norm,
     )
 
     test_env = TradingEnv(
@@ -52,6 +60,7 @@ def train_agent(agent_type: str, train_df: pd.DataFrame, test_df: pd.DataFrame,
         reward_type="sortino",
         use_risk_management=True,
         risk_config=risk_config,
+        df_normalized=test_norm,
     )
 
     logger.info(f"Risk Config: {risk_config.timeframe}")
@@ -125,9 +134,20 @@ def train_agent(agent_type: str, train_df: pd.DataFrame, test_df: pd.DataFrame,
     return stats
 
 
+def _train_on_device(cuda_device: int, agent_type: str, *args):
+    """Trainiere einen Agent in eigenem Prozess auf einer festen GPU."""
+    # Vor der ersten CUDA-Initialisierung setzen, sonst wirkungslos
+    os.environ["CUDA_VISIBLE_DEVICES"] = str(cuda_device)
+    setup_logging()
+    return train_agent(agent_type, *args)
+
+
 def main():
     """Hauptfunktion - Trainiere PPO und DQN fair."""
 
+    # Setup logging
+    setup_logging()
+
     parser = argparse.ArgumentParser(description="Fair PPO vs DQN Comparison")
     parser.add_argument("--agent", type=str, default="both",
                        choices=["ppo", "dqn", "both"],
@@ -147,7 +167,7 @@ def main():
     logger.info("Lade Training-Daten...")
 
     try:
-        df = pd.read_csv("data/processed/sol_usdt_features.csv", index_col=0, parse_dates=True)
+        df = load_features()
         logger.info(f"Daten geladen: {len(df)} Candles")
     except FileNotFoundError:
         logger.error("Keine Daten gefunden!")
@@ -155,8 +175,12 @@ def main():
 
     # 2. Split Train/Test
     train_size = int(len(df) * 0.8)
-    train_df = df[:train_size].copy()
-    test_df = df[train_size:].copy()
+    train_df = df.iloc[:train_size]
+    test_df = df.iloc[train_size:]
+
+    # Feature-Normalisierung einmal pro Split, geteilt von PPO und DQN
+    train_norm = TradingEnv.normalize_features(train_df)
+    test_norm = TradingEnv.normalize_features(test_df)
 
     logger.info(f"Train: {len(train_df)} Candles ({train_df.index[0]} bis {train_df.index[-1]})")
     logger.info(f"Test: {len(test_df)} Candles ({test_df.index[0]} bis {test_df.index[-1]})")
@@ -168,11 +192,22 @@ def main():
     results = {}
 
     # 4. Training
-    if args.agent in ["ppo", "both"]:
-        results["PPO"] = train_agent("ppo", train_df, test_df, risk_config, args.steps)
-
-    if args.agent in ["dqn", "both"]:
-        results["DQN"] = train_agent("dqn", train_df, test_df, risk_config, args.steps)
+    agent_types = [a for a in ("ppo", "dqn") if args.agent in (a, "both")]
+    train_args = (train_df, test_df, risk_config, args.steps, train_norm, test_norm)
+
+    if len(agent_types) == 2 and torch.cuda.device_count() >= 2:
+        # Beide Agents parallel, je ein Prozess pro GPU (getrennte save_paths)
+        logger.info("2+ GPUs gefunden - trainiere PPO und DQN parallel")
+        ctx = torch.multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2, mp_context=ctx) as executor:
+            futures = {
+                agent_type.upper(): executor.submit(_train_on_device, device, agent_type, *train_args)
+                for device, agent_type in enumerate(agent_types)
+            }
+            results = {name: future.result() for name, future in futures.items()}
+    else:
+        for agent_type in agent_types:
+            results[agent_type.upper()] = train_agent(agent_type, *train_args)
 
     # 5. Vergleich
     if len(results) == 2:
@@ -11,16 +11,19 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-import pandas as pd
-from solana_rl_bot.environment import TradingEnv
+from solana_rl_bot.data.processors import load_features
+from solana_rl_bot.environment import TradingEnv, build_env_fn
 from solana_rl_bot.agents import PPOAgent
-from solana_rl_bot.utils import get_logger
+from solana_rl_bot.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
 
 def main():
     """Trainiere PPO Agent."""
+    # Setup logging
+    setup_logging()
+
     logger.info("=== PPO Training Start ===\n")
 
     # 1. Lade Daten
@@ -28,7 +31,7 @@ def main():
 
     # Lade CSV direkt
     try:
-        df = pd.read_csv("data/processed/sol_usdt_features.csv", index_col=0, parse_dates=True)
+        df = load_features()
         logger.info(f"Daten geladen: {len(df)} Candles\n")
     except FileNotFoundError:
         logger.error("Keine Daten gefunden! Bitte zuerst download_data.py ausfuehren.")
@@ -40,8 +43,8 @@ def main():
 
     # 2. Split Train/Test
     train_size = int(len(df) * 0.8)
-    train_df = df[:train_size].copy()
-    test_df = df[train_size:].copy()
+    train_df = df.iloc[:train_size]
+    test_df = df.iloc[train_size:]
 
     logger.info(f"Train: {len(train_df)} Candles")
     logger.info(f"Test: {len(test_df)} Candles\n")
@@ -49,8 +52,10 @@ def main():
     # 3. Erstelle Environments
     logger.info("Erstelle Trading Environments...")
 
-    train_env = TradingEnv(
-        df=train_df,
+    # Factory statt fertigem Env: jeder SubprocVecEnv Worker baut sein eigenes,
+    # die Daten liegen einmal im Shared Memory statt gepickelt pro Worker
+    make_train_env = build_env_fn(
+        train_df,
         initial_balance=10000.0,
         commission=0.001,
         window_size=50,
@@ -71,9 +76,11 @@ def main():
     logger.info("Initialisiere PPO Agent...")
 
     agent = PPOAgent(
-        env=train_env,
+        env_fn=make_train_env,
+        n_envs=4,
         learning_rate=3e-4,
-        n_steps=2048,
+        # 4 Envs x 512 Steps: Rollout bleibt bei 2048 Transitions pro Update
+        n_steps=512,
         batch_size=64,
         n_epochs=10,
         gamma=0.99,
@@ -113,7 +120,7 @@ def main():
     logger.info("TRAINING SUMMARY")
     logger.info("=" * 50)
     logger.info(f"Total Training Steps: 500,000")
-    logger.info(f"Training Episodes: {len(train_df) // train_env.window_size}")
+    logger.info(f"Training Episodes: {len(train_df) // test_env.window_size}")
     logger.info(f"\nFinal Test Performance:")
     logger.info(f"  Mean Return: {stats['mean_return']*100:.2f}%")
     logger.info(f"  Best Return: {stats['max_return']*100:.2f}%")
@@ -122,6 +129,8 @@ def main():
     logger.info(f"\nModel gespeichert in: ./models/ppo/")
     logger.info("=" * 50)
 
+    agent.close()
+
 
 if __name__ == "__main__":
     main()
@@ -12,18 +12,21 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-import pandas as pd
 import argparse
-from solana_rl_bot.environment import ContinuousTradingEnv
+from solana_rl_bot.data.processors import load_features
+from solana_rl_bot.environment import ContinuousTradingEnv, build_env_fn
 from solana_rl_bot.agents import SACAgent
 from solana_rl_bot.risk import RiskConfigFactory
-from solana_rl_bot.utils import get_logger
+from solana_rl_bot.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
 
 def main():
     """Trainiere SAC Agent."""
+    # Setup logging
+    setup_logging()
+
     parser = argparse.ArgumentParser(description="SAC Training mit Risk Management")
     parser.add_argument("--steps", type=int, default=500_000,
                        help="Training Steps (default: 500000)")
@@ -42,7 +45,7 @@ def main():
     logger.info("Lade Training-Daten...")
 
     try:
-        df = pd.read_csv("data/processed/sol_usdt_features.csv", index_col=0, parse_dates=True)
+        df = load_features()
         logger.info(f"Daten geladen: {len(df)} Candles\n")
     except FileNotFoundError:
         logger.error("Keine Daten gefunden! Bitte zuerst download_real_data.py ausfuehren.")
@@ -54,8 +57,8 @@ def main():
 
     # 2. Split Train/Test
     train_size = int(len(df) * 0.8)
-    train_df = df[:train_size].copy()
-    test_df = df[train_size:].copy()
+    train_df = df.iloc[:train_size]
+    test_df = df.iloc[train_size:]
 
     logger.info(f"Train: {len(train_df)} Candles")
     logger.info(f"Test: {len(test_df)} Candles\n")
@@ -72,8 +75,11 @@ def main():
     # 4. Erstelle Environments (Continuous fuer SAC!)
     logger.info("Erstelle Continuous Trading Environments (fuer SAC)...")
 
-    train_env = ContinuousTradingEnv(
-        df=train_df,
+    # Factory statt fertigem Env: jeder SubprocVecEnv Worker baut sein eigenes,
+    # die Daten liegen einmal im Shared Memory statt gepickelt pro Worker
+    make_train_env = build_env_fn(
+        train_df,
+        ContinuousTradingEnv,
         initial_balance=10000.0,
         commission=0.001,
         window_size=50,
@@ -98,15 +104,18 @@ def main():
     logger.info("Initialisiere SAC Agent...")
 
     agent = SACAgent(
-        env=train_env,
+        env_fn=make_train_env,
+        n_envs=4,
         learning_rate=3e-4,
         buffer_size=100_000,
         learning_starts=10_000,
         batch_size=256,
         tau=0.005,
         gamma=0.99,
+        # 4 Envs liefern 4 Transitions pro Step: 4 Gradient Steps pro Step
+        # halten das Verhaeltnis von 1 Update pro Transition
         train_freq=1,
-        gradient_steps=1,
+        gradient_steps=4,
         ent_coef="auto",  # Automatisches Entropy Tuning
         tensorboard_log="./logs/tensorboard/sac/",
         verbose=1,
@@ -152,6 +161,8 @@ def main():
     logger.info(f"\nModel gespeichert in: ./models/sac_rm/")
     logger.info("=" * 50)
 
+    agent.close()
+
     return stats
 
 
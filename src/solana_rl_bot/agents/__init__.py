@@ -8,9 +8,15 @@ PPO, DQN und SAC Agents fuer Trading.
 from solana_rl_bot.agents.ppo_agent import PPOAgent
 from solana_rl_bot.agents.dqn_agent import DQNAgent
 from solana_rl_bot.agents.sac_agent import SACAgent
+from solana_rl_bot.agents.replay_buffer import MemmapReplayBuffer
+from solana_rl_bot.agents.rollout_buffer import FastGAERolloutBuffer
+from solana_rl_bot.agents.callbacks import AsyncEvalCallback
 
 __all__ = [
     "PPOAgent",
     "DQNAgent",
     "SACAgent",
+    "MemmapReplayBuffer",
+    "FastGAERolloutBuffer",
+    "AsyncEvalCallback",
 ]
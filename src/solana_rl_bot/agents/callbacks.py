@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Training Callbacks fuer die SB3 Agents.
+
+AsyncEvalCallback evaluiert einen Snapshot der Policy in einem
+Hintergrund-Thread, waehrend das Training weiterlaeuft.
+"""
+
+from typing import List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+
+import numpy as np
+import torch
+from stable_baselines3.common.callbacks import EvalCallback
+from stable_baselines3.common.policies import BasePolicy
+from stable_baselines3.common.evaluation import evaluate_policy
+
+from solana_rl_bot.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncEvalCallback(EvalCallback):
+    """
+    EvalCallback, der das Training bei Evaluationen nicht anhaelt.
+
+    Bei jedem eval_freq Step wird die Policy kopiert und im Hintergrund
+    evaluiert. Das Ergebnis (Logging, evaluations.npz, Best-Model,
+    Early-Stopping Callbacks) wird im ersten Step nach Abschluss auf dem
+    Trainings-Thread verarbeitet. Laeuft noch eine Evaluation, wird der
+    naechste Termin uebersprungen.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Tuple[Future, int, BasePolicy]] = None
+
+    def _init_callback(self) -> None:
+        super()._init_callback()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async_eval")
+
+    def _on_step(self) -> bool:
+        continue_training = True
+
+        if self._pending is not None and self._pending[0].done():
+            continue_training = self._process_pending()
+
+        if self.eval_freq > 0 and self.n_calls % self.eval_freq == 0:
+            if self._pending is None:
+                self._submit()
+            else:
+                logger.debug(
+                    "Evaluation bei {} uebersprungen (vorherige laeuft noch)", self.num_timesteps
+                )
+
+        return continue_training
+
+    def _on_training_end(self) -> None:
+        # Letzte Evaluation abwarten, damit Best-Model und Logs vollstaendig sind
+        if self._pending is not None:
+            self._process_pending()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        super()._on_training_end()
+
+    def _snapshot_policy(self) -> BasePolicy:
+        """
+        Kopiere die Policy in eine frisch gebaute, unkompilierte Instanz.
+
+        copy.deepcopy reicht nicht: nn.Module.compile haelt eine an das
+        Live-Modul gebundene Funktion, die Kopie wuerde weiter die
+        trainierten Netze ausfuehren. load_state_dict kopiert nur die Gewichte.
+        """
+        policy = self.model.policy
+        snapshot = type(policy)(**policy._get_constructor_parameters())
+        snapshot.load_state_dict(policy.state_dict())
+        snapshot.to(policy.device)
+        snapshot.set_training_mode(False)
+        return snapshot
+
+    def _submit(self) -> None:
+        """Starte Evaluation eines Policy-Snapshots im Hintergrund."""
+        snapshot = self._snapshot_policy()
+
+        # Reset success rate buffer
+        self._is_success_buffer = []
+
+        future = self._executor.submit(self._evaluate_snapshot, snapshot)
+        self._pending = (future, self.num_timesteps, snapshot)
+
+    def _evaluate_snapshot(self, snapshot: BasePolicy) -> Tuple[List[float], List[int]]:
+        """Evaluiere Snapshot (laeuft im Hintergrund-Thread)."""
+        with torch.inference_mode():
+            return evaluate_policy(
+                snapshot,
+                self.eval_env,
+                n_eval_episodes=self.n_eval_episodes,
+                render=self.render,
+                deterministic=self.deterministic,
+                return_episode_rewards=True,
+                warn=self.warn,
+                callback=self._log_success_callback,
+            )
+
+    def _process_pending(self) -> bool:
+        """Verarbeite das Ergebnis der laufenden Evaluation (wartet falls noetig)."""
+        future, eval_timesteps, snapshot = self._pending
+        self._pending = None
+
+        episode_rewards, episode_lengths = future.result()
+        continue_training = True
+
+        if self.log_path is not None:
+            self.evaluations_timesteps.append(eval_timesteps)
+            self.evaluations_results.append(episode_rewards)
+            self.evaluations_length.append(episode_lengths)
+
+            kwargs = {}
+            # Save success log if present
+            if len(self._is_success_buffer) > 0:
+                self.evaluations_successes.append(self._is_success_buffer)
+                kwargs = dict(successes=self.evaluations_successes)
+
+            np.savez(
+                self.log_path,
+                timesteps=self.evaluations_timesteps,
+                results=self.evaluations_results,
+                ep_lengths=self.evaluations_length,
+                **kwargs,
+            )
+
+        mean_reward, std_reward = np.mean(episode_rewards), np.std(episode_rewards)
+        mean_ep_length, std_ep_length = np.mean(episode_lengths), np.std(episode_lengths)
+        self.last_mean_reward = float(mean_reward)
+
+        if self.verbose >= 1:
+            logger.info(
+                "Eval num_timesteps={}, episode_reward={:.2f} +/- {:.2f}",
+                eval_timesteps,
+                mean_reward,
+                std_reward,
+            )
+            logger.info("Episode length: {:.2f} +/- {:.2f}", mean_ep_length, std_ep_length)
+        self.logger.record("eval/mean_reward", float(mean_reward))
+        self.logger.record("eval/mean_ep_length", mean_ep_length)
+
+        if len(self._is_success_buffer) > 0:
+            success_rate = np.mean(self._is_success_buffer)
+            if self.verbose >= 1:
+                logger.info("Success rate: {:.2f}%", 100 * success_rate)
+            self.logger.record("eval/success_rate", success_rate)
+
+        self.logger.record("time/total_timesteps", self.num_timesteps, exclude="tensorboard")
+        self.logger.dump(self.num_timesteps)
+
+        if mean_reward > self.best_mean_reward:
+            if self.verbose >= 1:
+                logger.info("New best mean reward!")
+            if self.best_model_save_path is not None:
+                self._save_snapshot(snapshot, os.path.join(self.best_model_save_path, "best_model"))
+            self.best_mean_reward = float(mean_reward)
+            # Trigger callback on new best model, if needed
+            if self.callback_on_new_best is not None:
+                continue_training = self.callback_on_new_best.on_step()
+
+        # Trigger callback after every evaluation, if needed
+        if self.callback is not None:
+            continue_training = continue_training and self._on_event()
+
+        return continue_training
+
+    def _save_snapshot(self, snapshot: BasePolicy, path: str) -> None:
+        """Speichere das Model mit den evaluierten (Snapshot) Gewichten."""
+        live_policy = self.model.policy
+        self.model.policy = snapshot
+        try:
+            self.model.save(path)
+        finally:
+            self.model.policy = live_policy
@@ -8,20 +8,47 @@ DQN ist ein value-based RL Algorithmus:
 - Target Network fuer stabile Updates
 """
 
-from typing import Optional, Dict, Any
-import os
+from typing import Optional, Dict, Any, Callable, Literal
+import copy
 from pathlib import Path
 
 import numpy as np
+import torch
+import gymnasium as gym
 from stable_baselines3 import DQN
-from stable_baselines3.common.vec_env import DummyVecEnv
-from stable_baselines3.common.callbacks import EvalCallback, CheckpointCallback
-
+from stable_baselines3.common.vec_env import DummyVecEnv, VecEnv
+from stable_baselines3.common.callbacks import (
+    CallbackList,
+    CheckpointCallback,
+    EvalCallback,
+    StopTrainingOnNoModelImprovement,
+)
+
+from solana_rl_bot.agents.replay_buffer import MemmapReplayBuffer, replay_buffer_options
+from solana_rl_bot.environment.shared_env import make_vec_env
 from solana_rl_bot.utils import get_logger
 
 logger = get_logger(__name__)
 
 
+class BF16DQN(DQN):
+    """
+    DQN mit optionalem BF16 Autocast im Training Step.
+
+    Forward Passes und Loss laufen unter torch.autocast, Gewichte und
+    Optimizer State bleiben in FP32 (BF16 braucht keinen GradScaler).
+    """
+
+    autocast_dtype: Optional[torch.dtype] = None
+
+    def train(self, gradient_steps: int, batch_size: int = 100) -> None:
+        if self.autocast_dtype is None or self.device.type != "cuda":
+            return super().train(gradient_steps, batch_size)
+
+        with torch.autocast(device_type="cuda", dtype=self.autocast_dtype):
+            return super().train(gradient_steps, batch_size)
+
+
 class DQNAgent:
     """
     DQN Agent Wrapper fuer Trading Environment.
@@ -34,7 +61,7 @@ class DQNAgent:
 
     def __init__(
         self,
-        env,
+        env=None,
         learning_rate: float = 1e-4,
         buffer_size: int = 100_000,
         learning_starts: int = 10_000,
@@ -49,12 +76,20 @@ class DQNAgent:
         exploration_final_eps: float = 0.05,
         tensorboard_log: Optional[str] = None,
         verbose: int = 1,
+        n_envs: int = 1,
+        env_fn: Optional[Callable[[], gym.Env]] = None,
+        vec_env_cls: Literal["subproc", "dummy"] = "subproc",
+        memmap_buffer: bool = False,
+        optimize_memory_usage: bool = False,
+        torch_compile: bool = True,
+        fp_precision: Literal["fp32", "bf16"] = "bf16",
+        policy_kwargs: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialisiere DQN Agent.
 
         Args:
-            env: Trading Environment (Gymnasium-kompatibel)
+            env: Trading Environment (Gymnasium-kompatibel oder VecEnv), optional wenn env_fn gesetzt
             learning_rate: Learning Rate fuer Optimizer
             buffer_size: Groesse des Replay Buffers
             learning_starts: Steps vor erstem Training
@@ -69,15 +104,35 @@ class DQNAgent:
             exploration_final_eps: Final epsilon
             tensorboard_log: Pfad fuer TensorBoard Logs
             verbose: Verbosity Level
+            n_envs: Anzahl paralleler Environments (> 1 = SubprocVecEnv)
+            env_fn: Factory fuer ein neues Environment (noetig fuer n_envs > 1)
+            vec_env_cls: "subproc" (ein Prozess pro Env) oder "dummy" (sequentiell)
+            memmap_buffer: Replay Buffer als numpy.memmap Arrays (Temp-Dateien, fuer Buffer > RAM)
+            optimize_memory_usage: next_obs nicht speichern (halber Buffer-RAM, aendert
+                Truncation-Handling, siehe replay_buffer_options)
+            torch_compile: Q-Network und Target Network mit torch.compile kompilieren (nur CUDA)
+            fp_precision: Precision im Training Step ("bf16" = Autocast, nur CUDA mit BF16 Support)
+            policy_kwargs: SB3 policy_kwargs (None = [128, 128] SiLU MLP mit AdamW)
         """
         self.env = env
+        self._save_dirs = set()
 
         # Wrap Environment fuer Stable-Baselines3
-        self.vec_env = DummyVecEnv([lambda: env])
+        self.vec_env = make_vec_env(env, env_fn, n_envs, vec_env_cls)
+
+        # Q-Network: kleines SiLU MLP mit AdamW
+        if policy_kwargs is None:
+            policy_kwargs = dict(
+                net_arch=[128, 128],
+                activation_fn=torch.nn.SiLU,
+                normalize_images=False,
+                optimizer_class=torch.optim.AdamW,
+            )
 
         # Erstelle DQN Model
-        self.model = DQN(
+        self.model = BF16DQN(
             policy="MlpPolicy",
+            policy_kwargs=policy_kwargs,
             env=self.vec_env,
             learning_rate=learning_rate,
             buffer_size=buffer_size,
@@ -91,15 +146,23 @@ class DQNAgent:
             exploration_fraction=exploration_fraction,
             exploration_initial_eps=exploration_initial_eps,
             exploration_final_eps=exploration_final_eps,
+            replay_buffer_class=MemmapReplayBuffer if memmap_buffer else None,
+            **replay_buffer_options(optimize_memory_usage),
             verbose=verbose,
             tensorboard_log=tensorboard_log,
         )
 
+        self.torch_compile = torch_compile
+        self.fp_precision = fp_precision
+        self._compile_networks()
+        self._set_precision()
+
         logger.info(
             f"DQN Agent initialisiert mit:\n"
             f"  Learning Rate: {learning_rate}\n"
             f"  Buffer Size: {buffer_size:,}\n"
             f"  Batch Size: {batch_size}\n"
+            f"  Envs: {n_envs}\n"
             f"  Gamma: {gamma}\n"
             f"  Exploration: {exploration_initial_eps} -> {exploration_final_eps}"
         )
@@ -112,39 +175,55 @@ class DQNAgent:
         n_eval_episodes: int = 5,
         save_path: Optional[str] = None,
         checkpoint_freq: int = 50000,
+        early_stop_patience: Optional[int] = None,
     ) -> None:
         """
         Trainiere Agent.
 
         Args:
             total_timesteps: Anzahl Training Steps
-            eval_env: Environment fuer Evaluation
+            eval_env: Environment fuer Evaluation (Env oder VecEnv)
             eval_freq: Evaluation Frequenz (Steps)
             n_eval_episodes: Anzahl Episodes pro Evaluation
             save_path: Pfad zum Speichern des Models
             checkpoint_freq: Checkpoint Frequenz (Steps)
+            early_stop_patience: Stoppe nach N Evaluations ohne neues Best-Model (None = aus)
         """
         callbacks = []
 
+        # Callback-Frequenzen zaehlen VecEnv-Steps, nicht Transitions
+        n_envs = self.vec_env.num_envs
+
         # Evaluation Callback
         if eval_env is not None:
-            eval_vec_env = DummyVecEnv([lambda: eval_env])
+            if isinstance(eval_env, VecEnv):
+                eval_vec_env = eval_env
+            else:
+                eval_vec_env = DummyVecEnv([lambda: eval_env])
 
             eval_callback = EvalCallback(
                 eval_vec_env,
                 best_model_save_path=save_path if save_path else "./models/",
                 log_path=save_path if save_path else "./logs/",
-                eval_freq=eval_freq,
+                eval_freq=max(eval_freq // n_envs, 1),
                 n_eval_episodes=n_eval_episodes,
                 deterministic=True,
                 render=False,
+                callback_after_eval=(
+                    StopTrainingOnNoModelImprovement(
+                        max_no_improvement_evals=early_stop_patience,
+                        verbose=1,
+                    )
+                    if early_stop_patience is not None
+                    else None
+                ),
             )
             callbacks.append(eval_callback)
 
         # Checkpoint Callback
         if save_path is not None:
             checkpoint_callback = CheckpointCallback(
-                save_freq=checkpoint_freq,
+                save_freq=max(checkpoint_freq // n_envs, 1),
                 save_path=save_path,
                 name_prefix="dqn_checkpoint",
             )
@@ -155,14 +234,14 @@ class DQNAgent:
         # Training
         self.model.learn(
             total_timesteps=total_timesteps,
-            callback=callbacks if callbacks else None,
+            callback=CallbackList(callbacks) if callbacks else None,
         )
 
         logger.info("Training abgeschlossen!")
 
         # Speichere finales Model
         if save_path is not None:
-            final_path = os.path.join(save_path, "dqn_final.zip")
+            final_path = str(Path(save_path) / "dqn_final.zip")
             self.save(final_path)
             logger.info(f"Model gespeichert: {final_path}")
 
@@ -177,9 +256,31 @@ class DQNAgent:
         Returns:
             action, state
         """
-        action, state = self.model.predict(observation, deterministic=deterministic)
+        # inference_mode: kein Autograd-Tracking (auch keine Version Counter)
+        with torch.inference_mode():
+            action, state = self.model.predict(observation, deterministic=deterministic)
         return action, state
 
+    def predict_batch(self, observations: np.ndarray) -> np.ndarray:
+        """
+        Greedy Actions fuer einen Batch von Observations.
+
+        Umgeht den SB3 predict() Wrapper: ein Tensor-Transfer und ein
+        Forward Pass durch das Q-Network fuer den ganzen Batch.
+
+        Args:
+            observations: Array (n_envs, *obs_shape)
+
+        Returns:
+            Actions (n_envs,)
+        """
+        obs_tensor = torch.as_tensor(observations, dtype=torch.float32, device=self.model.device)
+
+        with torch.inference_mode():
+            q_values = self.model.policy.q_net(obs_tensor)
+
+        return q_values.argmax(dim=-1).cpu().numpy()
+
     def evaluate(
         self,
         env,
@@ -197,84 +298,146 @@ class DQNAgent:
         Returns:
             Dictionary mit Metriken
         """
-        episode_rewards = []
-        episode_lengths = []
-        episode_returns = []
-
-        for episode in range(n_episodes):
-            obs, info = env.reset()
-            done = False
-            episode_reward = 0
-            episode_length = 0
-
-            while not done:
-                action, _ = self.predict(obs, deterministic=deterministic)
-                obs, reward, terminated, truncated, info = env.step(action)
-
-                episode_reward += reward
-                episode_length += 1
-                done = terminated or truncated
-
-            # Episode Stats
-            final_return = info.get("total_return", 0)
-
-            episode_rewards.append(episode_reward)
-            episode_lengths.append(episode_length)
-            episode_returns.append(final_return)
-
-            logger.info(
-                f"Episode {episode + 1}/{n_episodes}: "
-                f"Reward={episode_reward:.2f}, "
-                f"Return={final_return*100:.2f}%, "
-                f"Length={episode_length}"
-            )
+        # Alle Episodes laufen im Gleichschritt: ein Env pro Episode,
+        # ein gebatchter Forward Pass pro Step (predict/predict_batch
+        # laufen unter torch.inference_mode)
+        envs = [env] if n_episodes == 1 else [copy.deepcopy(env) for _ in range(n_episodes)]
+        vec_env = DummyVecEnv([lambda e=e: e for e in envs])
+
+        episode_rewards = np.zeros(n_episodes, dtype=np.float64)
+        episode_lengths = np.zeros(n_episodes, dtype=np.int32)
+        episode_returns = np.zeros(n_episodes, dtype=np.float64)
+        active = np.ones(n_episodes, dtype=bool)
+
+        # Eval-Mode einmal vor der Schleife (Dropout/BatchNorm aus)
+        self.model.policy.set_training_mode(False)
+
+        obs = vec_env.reset()
+
+        while active.any():
+            if deterministic:
+                actions = self.predict_batch(obs)
+            else:
+                actions, _ = self.predict(obs, deterministic=False)
+            obs, rewards, dones, infos = vec_env.step(actions)
+
+            # Bereits beendete Envs (Autoreset) nicht weiter zaehlen
+            episode_rewards += rewards * active
+            episode_lengths += active
+
+            for episode in np.flatnonzero(dones & active):
+                active[episode] = False
+
+                # Episode Stats (infos enthalten den letzten Step vor dem Autoreset)
+                episode_returns[episode] = infos[episode].get("total_return", 0)
+
+                # Lazy Formatting: loguru formatiert nur, wenn ein Sink INFO annimmt
+                logger.info(
+                    "Episode {}/{}: Reward={:.2f}, Return={:.2f}%, Length={}",
+                    episode + 1,
+                    n_episodes,
+                    episode_rewards[episode],
+                    episode_returns[episode] * 100,
+                    episode_lengths[episode],
+                )
 
         # Aggregate Stats
+        # Python floats, damit die Stats JSON-serialisierbar bleiben
         stats = {
-            "mean_reward": np.mean(episode_rewards),
-            "std_reward": np.std(episode_rewards),
-            "mean_return": np.mean(episode_returns),
-            "std_return": np.std(episode_returns),
-            "mean_length": np.mean(episode_lengths),
-            "min_return": np.min(episode_returns),
-            "max_return": np.max(episode_returns),
+            "mean_reward": float(episode_rewards.mean()),
+            "std_reward": float(episode_rewards.std()),
+            "mean_return": float(episode_returns.mean()),
+            "std_return": float(episode_returns.std()),
+            "mean_length": float(episode_lengths.mean()),
+            "min_return": float(episode_returns.min()),
+            "max_return": float(episode_returns.max()),
         }
 
         logger.info(
-            f"\n=== Evaluation Results ({n_episodes} episodes) ===\n"
-            f"Mean Reward: {stats['mean_reward']:.2f} +/- {stats['std_reward']:.2f}\n"
-            f"Mean Return: {stats['mean_return']*100:.2f}% +/- {stats['std_return']*100:.2f}%\n"
-            f"Return Range: [{stats['min_return']*100:.2f}%, {stats['max_return']*100:.2f}%]\n"
-            f"Mean Length: {stats['mean_length']:.1f} steps"
+            "\n=== Evaluation Results ({} episodes) ===\n"
+            "Mean Reward: {:.2f} +/- {:.2f}\n"
+            "Mean Return: {:.2f}% +/- {:.2f}%\n"
+            "Return Range: [{:.2f}%, {:.2f}%]\n"
+            "Mean Length: {:.1f} steps",
+            n_episodes,
+            stats["mean_reward"],
+            stats["std_reward"],
+            stats["mean_return"] * 100,
+            stats["std_return"] * 100,
+            stats["min_return"] * 100,
+            stats["max_return"] * 100,
+            stats["mean_length"],
         )
 
         return stats
 
     def save(self, path: str) -> None:
         """Speichere Model."""
-        # Erstelle Directory falls nicht existiert
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Erstelle Directory falls nicht existiert (einmal pro Verzeichnis)
+        parent = Path(path).parent
+        if parent not in self._save_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._save_dirs.add(parent)
 
         self.model.save(path)
         logger.info(f"Model gespeichert: {path}")
 
     def load(self, path: str) -> None:
         """Lade Model."""
-        self.model = DQN.load(path, env=self.vec_env)
+        self.model = BF16DQN.load(path, env=self.vec_env)
+        self._compile_networks()
+        self._set_precision()
         logger.info(f"Model geladen: {path}")
 
+    def _compile_networks(self) -> None:
+        """
+        Kompiliere Q-Network und Target Network mit torch.compile.
+
+        Kompiliert in-place (nn.Module.compile), damit die state_dict Keys
+        und die DQN Aliase (model.q_net, model.q_net_target) gleich bleiben.
+        """
+        if not self.torch_compile or not torch.cuda.is_available():
+            return
+
+        self.model.policy.q_net.compile(mode="reduce-overhead", fullgraph=False)
+        self.model.policy.q_net_target.compile(fullgraph=False)
+        logger.info("Q-Networks mit torch.compile kompiliert")
+
+    def _set_precision(self) -> None:
+        """Aktiviere BF16 Autocast im Training Step falls unterstuetzt."""
+        use_bf16 = (
+            self.fp_precision == "bf16"
+            and torch.cuda.is_available()
+            and torch.cuda.is_bf16_supported()
+        )
+        self.model.autocast_dtype = torch.bfloat16 if use_bf16 else None
+
+        if use_bf16:
+            logger.info("BF16 Autocast im Training aktiviert")
+
+    def close(self) -> None:
+        """Schliesse Environments (beendet SubprocVecEnv Worker)."""
+        self.vec_env.close()
+
     @staticmethod
-    def load_agent(path: str, env) -> "DQNAgent":
+    def load_agent(
+        path: str,
+        env=None,
+        env_fn: Optional[Callable[[], gym.Env]] = None,
+        n_envs: int = 1,
+    ) -> "DQNAgent":
         """
         Lade gespeicherten Agent.
 
         Args:
             path: Pfad zum Model
-            env: Trading Environment
+            env: Trading Environment, optional wenn env_fn gesetzt
+            env_fn: Factory fuer ein neues Environment
+            n_envs: Anzahl paralleler Environments
 
         Returns:
             DQNAgent Instanz
         """
-        agent = DQNAgent(env)
+        agent = DQNAgent(env, env_fn=env_fn, n_envs=n_envs)
         agent.load(path)
         return agent
@@ -8,20 +8,43 @@ PPO ist ein state-of-the-art RL Algorithmus:
 - Funktioniert gut fuer Trading Tasks
 """
 
-from typing import Optional, Dict, Any
-import os
+from typing import Optional, Dict, Any, Callable, Literal
+import copy
 from pathlib import Path
 
 import numpy as np
+import torch
+import gymnasium as gym
 from stable_baselines3 import PPO
-from stable_baselines3.common.vec_env import DummyVecEnv
-from stable_baselines3.common.callbacks import EvalCallback, CheckpointCallback
+from stable_baselines3.common.vec_env import DummyVecEnv, VecEnv
+from stable_baselines3.common.callbacks import CheckpointCallback
 
+from solana_rl_bot.agents.callbacks import AsyncEvalCallback
+from solana_rl_bot.agents.rollout_buffer import FastGAERolloutBuffer
+from solana_rl_bot.environment.shared_env import make_vec_env
 from solana_rl_bot.utils import get_logger
 
 logger = get_logger(__name__)
 
 
+class BF16PPO(PPO):
+    """
+    PPO mit optionalem BF16 Autocast im Training Step.
+
+    Forward Passes und Loss laufen unter torch.autocast, Gewichte und
+    Optimizer State bleiben in FP32 (BF16 braucht keinen GradScaler).
+    """
+
+    autocast_dtype: Optional[torch.dtype] = None
+
+    def train(self, *args, **kwargs) -> None:
+        if self.autocast_dtype is None or self.device.type != "cuda":
+            return super().train(*args, **kwargs)
+
+        with torch.autocast(device_type="cuda", dtype=self.autocast_dtype):
+            return super().train(*args, **kwargs)
+
+
 class PPOAgent:
     """
     PPO Agent Wrapper f�r Trading Environment.
@@ -34,7 +57,7 @@ class PPOAgent:
 
     def __init__(
         self,
-        env,
+        env=None,
         learning_rate: float = 3e-4,
         n_steps: int = 2048,
         batch_size: int = 64,
@@ -47,14 +70,20 @@ class PPOAgent:
         max_grad_norm: float = 0.5,
         tensorboard_log: Optional[str] = None,
         verbose: int = 1,
+        n_envs: int = 1,
+        env_fn: Optional[Callable[[], gym.Env]] = None,
+        vec_env_cls: Literal["subproc", "dummy"] = "subproc",
+        torch_compile: bool = False,
+        fp_precision: Literal["fp32", "bf16"] = "fp32",
+        device: str = "cpu",
     ):
         """
         Initialisiere PPO Agent.
 
         Args:
-            env: Trading Environment (Gymnasium-kompatibel)
+            env: Trading Environment (Gymnasium-kompatibel oder VecEnv), optional wenn env_fn gesetzt
             learning_rate: Learning Rate f�r Optimizer
-            n_steps: Steps pro Update
+            n_steps: Steps pro Update und Environment (Rollout = n_steps * n_envs)
             batch_size: Batch Size f�r Training
             n_epochs: Anzahl Epochs pro Update
             gamma: Discount Factor
@@ -65,14 +94,25 @@ class PPOAgent:
             max_grad_norm: Max Gradient Norm (Clipping)
             tensorboard_log: Pfad f�r TensorBoard Logs
             verbose: Verbosity Level
+            n_envs: Anzahl paralleler Environments (> 1 = SubprocVecEnv)
+            env_fn: Factory fuer ein neues Environment (noetig fuer n_envs > 1)
+            vec_env_cls: "subproc" (ein Prozess pro Env) oder "dummy" (sequentiell)
+            torch_compile: Policy MLP (mlp_extractor) mit torch.compile kompilieren (nur CUDA)
+            fp_precision: Precision im Training Step ("bf16" = Autocast, nur CUDA mit BF16 Support)
+            device: Torch Device ("cpu" Default: MLP Policy mit kleinen Batches ist
+                launch-bound, auf der GPU dominiert der Transfer; "auto"/"cuda" moeglich)
         """
         self.env = env
+        self._save_dirs = set()
 
         # Wrap Environment f�r Stable-Baselines3
-        self.vec_env = DummyVecEnv([lambda: env])
+        self.vec_env = make_vec_env(env, env_fn, n_envs, vec_env_cls)
+
+        # Wiederverwendeter float32 Buffer fuer einzelne Observations in predict()
+        self._obs_buf = np.empty(self.vec_env.observation_space.shape, dtype=np.float32)
 
         # Erstelle PPO Model
-        self.model = PPO(
+        self.model = BF16PPO(
             policy="MlpPolicy",
             env=self.vec_env,
             learning_rate=learning_rate,
@@ -85,15 +125,23 @@ class PPOAgent:
             ent_coef=ent_coef,
             vf_coef=vf_coef,
             max_grad_norm=max_grad_norm,
+            rollout_buffer_class=FastGAERolloutBuffer,
             verbose=verbose,
             tensorboard_log=tensorboard_log,
+            device=device,
         )
 
+        self.torch_compile = torch_compile
+        self.fp_precision = fp_precision
+        self._compile_networks()
+        self._set_precision()
+
         logger.info(
             f"PPO Agent initialisiert mit:\n"
             f"  Learning Rate: {learning_rate}\n"
             f"  Steps: {n_steps}\n"
             f"  Batch Size: {batch_size}\n"
+            f"  Envs: {n_envs}\n"
             f"  Gamma: {gamma}"
         )
 
@@ -111,7 +159,7 @@ class PPOAgent:
 
         Args:
             total_timesteps: Anzahl Training Steps
-            eval_env: Environment f�r Evaluation
+            eval_env: Environment f�r Evaluation (Env oder VecEnv)
             eval_freq: Evaluation Frequenz (Steps)
             n_eval_episodes: Anzahl Episodes pro Evaluation
             save_path: Pfad zum Speichern des Models
@@ -119,15 +167,22 @@ class PPOAgent:
         """
         callbacks = []
 
+        # Callback-Frequenzen zaehlen VecEnv-Steps, nicht Transitions
+        n_envs = self.vec_env.num_envs
+
         # Evaluation Callback
         if eval_env is not None:
-            eval_vec_env = DummyVecEnv([lambda: eval_env])
+            if isinstance(eval_env, VecEnv):
+                eval_vec_env = eval_env
+            else:
+                eval_vec_env = DummyVecEnv([lambda: eval_env])
 
-            eval_callback = EvalCallback(
+            # Evaluation im Hintergrund-Thread, Training laeuft weiter
+            eval_callback = AsyncEvalCallback(
                 eval_vec_env,
                 best_model_save_path=save_path if save_path else "./models/",
                 log_path=save_path if save_path else "./logs/",
-                eval_freq=eval_freq,
+                eval_freq=max(eval_freq // n_envs, 1),
                 n_eval_episodes=n_eval_episodes,
                 deterministic=True,
                 render=False,
@@ -137,7 +192,7 @@ class PPOAgent:
         # Checkpoint Callback
         if save_path is not None:
             checkpoint_callback = CheckpointCallback(
-                save_freq=checkpoint_freq,
+                save_freq=max(checkpoint_freq // n_envs, 1),
                 save_path=save_path,
                 name_prefix="ppo_checkpoint",
             )
@@ -155,7 +210,7 @@ class PPOAgent:
 
         # Speichere finales Model
         if save_path is not None:
-            final_path = os.path.join(save_path, "ppo_final.zip")
+            final_path = str(Path(save_path) / "ppo_final.zip")
             self.save(final_path)
             logger.info(f"Model gespeichert: {final_path}")
 
@@ -170,7 +225,21 @@ class PPOAgent:
         Returns:
             action, state
         """
-        action, state = self.model.predict(observation, deterministic=deterministic)
+        # Nur kopieren, wenn die Observation nicht schon float32 und contiguous ist
+        if not (
+            isinstance(observation, np.ndarray)
+            and observation.dtype == np.float32
+            and observation.flags.c_contiguous
+        ):
+            if np.shape(observation) == self._obs_buf.shape:
+                np.copyto(self._obs_buf, observation)
+                observation = self._obs_buf
+            else:
+                observation = np.ascontiguousarray(observation, dtype=np.float32)
+
+        # inference_mode: kein Autograd-Tracking (auch keine Version Counter)
+        with torch.inference_mode():
+            action, state = self.model.predict(observation, deterministic=deterministic)
         return action, state
 
     def evaluate(
@@ -190,84 +259,141 @@ class PPOAgent:
         Returns:
             Dictionary mit Metriken
         """
-        episode_rewards = []
-        episode_lengths = []
-        episode_returns = []
-
-        for episode in range(n_episodes):
-            obs, info = env.reset()
-            done = False
-            episode_reward = 0
-            episode_length = 0
-
-            while not done:
-                action, _ = self.predict(obs, deterministic=deterministic)
-                obs, reward, terminated, truncated, info = env.step(action)
-
-                episode_reward += reward
-                episode_length += 1
-                done = terminated or truncated
-
-            # Episode Stats
-            final_return = info.get("total_return", 0)
-
-            episode_rewards.append(episode_reward)
-            episode_lengths.append(episode_length)
-            episode_returns.append(final_return)
-
-            logger.info(
-                f"Episode {episode + 1}/{n_episodes}: "
-                f"Reward={episode_reward:.2f}, "
-                f"Return={final_return*100:.2f}%, "
-                f"Length={episode_length}"
-            )
+        # Alle Episodes laufen im Gleichschritt: ein Env pro Episode,
+        # ein gebatchter predict() pro Step (unter torch.inference_mode)
+        envs = [env] if n_episodes == 1 else [copy.deepcopy(env) for _ in range(n_episodes)]
+        vec_env = DummyVecEnv([lambda e=e: e for e in envs])
+
+        episode_rewards = np.zeros(n_episodes, dtype=np.float64)
+        episode_lengths = np.zeros(n_episodes, dtype=np.int32)
+        episode_returns = np.zeros(n_episodes, dtype=np.float64)
+        active = np.ones(n_episodes, dtype=bool)
+
+        # Eval-Mode einmal vor der Schleife (Dropout/BatchNorm aus)
+        self.model.policy.set_training_mode(False)
+
+        obs = vec_env.reset()
+
+        while active.any():
+            actions, _ = self.predict(obs, deterministic=deterministic)
+            obs, rewards, dones, infos = vec_env.step(actions)
+
+            # Bereits beendete Envs (Autoreset) nicht weiter zaehlen
+            episode_rewards += rewards * active
+            episode_lengths += active
+
+            for episode in np.flatnonzero(dones & active):
+                active[episode] = False
+
+                # Episode Stats (infos enthalten den letzten Step vor dem Autoreset)
+                episode_returns[episode] = infos[episode].get("total_return", 0)
+
+                # Lazy Formatting: loguru formatiert nur, wenn ein Sink INFO annimmt
+                logger.info(
+                    "Episode {}/{}: Reward={:.2f}, Return={:.2f}%, Length={}",
+                    episode + 1,
+                    n_episodes,
+                    episode_rewards[episode],
+                    episode_returns[episode] * 100,
+                    episode_lengths[episode],
+                )
 
         # Aggregate Stats
+        # Python floats, damit die Stats JSON-serialisierbar bleiben
         stats = {
-            "mean_reward": np.mean(episode_rewards),
-            "std_reward": np.std(episode_rewards),
-            "mean_return": np.mean(episode_returns),
-            "std_return": np.std(episode_returns),
-            "mean_length": np.mean(episode_lengths),
-            "min_return": np.min(episode_returns),
-            "max_return": np.max(episode_returns),
+            "mean_reward": float(episode_rewards.mean()),
+            "std_reward": float(episode_rewards.std()),
+            "mean_return": float(episode_returns.mean()),
+            "std_return": float(episode_returns.std()),
+            "mean_length": float(episode_lengths.mean()),
+            "min_return": float(episode_returns.min()),
+            "max_return": float(episode_returns.max()),
         }
 
         logger.info(
-            f"\n=== Evaluation Results ({n_episodes} episodes) ===\n"
-            f"Mean Reward: {stats['mean_reward']:.2f} � {stats['std_reward']:.2f}\n"
-            f"Mean Return: {stats['mean_return']*100:.2f}% � {stats['std_return']*100:.2f}%\n"
-            f"Return Range: [{stats['min_return']*100:.2f}%, {stats['max_return']*100:.2f}%]\n"
-            f"Mean Length: {stats['mean_length']:.1f} steps"
+            "\n=== Evaluation Results ({} episodes) ===\n"
+            "Mean Reward: {:.2f} � {:.2f}\n"
+            "Mean Return: {:.2f}% � {:.2f}%\n"
+            "Return Range: [{:.2f}%, {:.2f}%]\n"
+            "Mean Length: {:.1f} steps",
+            n_episodes,
+            stats["mean_reward"],
+            stats["std_reward"],
+            stats["mean_return"] * 100,
+            stats["std_return"] * 100,
+            stats["min_return"] * 100,
+            stats["max_return"] * 100,
+            stats["mean_length"],
         )
 
         return stats
 
     def save(self, path: str) -> None:
         """Speichere Model."""
-        # Erstelle Directory falls nicht existiert
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Erstelle Directory falls nicht existiert (einmal pro Verzeichnis)
+        parent = Path(path).parent
+        if parent not in self._save_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._save_dirs.add(parent)
 
         self.model.save(path)
         logger.info(f"Model gespeichert: {path}")
 
     def load(self, path: str) -> None:
         """Lade Model."""
-        self.model = PPO.load(path, env=self.vec_env)
+        self.model = BF16PPO.load(path, env=self.vec_env, device=self.model.device)
+        self._compile_networks()
+        self._set_precision()
         logger.info(f"Model geladen: {path}")
 
+    def _compile_networks(self) -> None:
+        """
+        Kompiliere Policy MLP (mlp_extractor) mit torch.compile.
+
+        Kompiliert in-place (nn.Module.compile), damit die state_dict Keys
+        und gespeicherte Models kompatibel bleiben.
+        """
+        if not self.torch_compile or self.model.device.type != "cuda":
+            return
+
+        self.model.policy.mlp_extractor.compile(mode="reduce-overhead", fullgraph=False)
+        logger.info("Policy-Netzwerk mit torch.compile kompiliert")
+
+    def _set_precision(self) -> None:
+        """Aktiviere BF16 Autocast im Training Step falls unterstuetzt."""
+        use_bf16 = (
+            self.fp_precision == "bf16"
+            and self.model.device.type == "cuda"
+            and torch.cuda.is_bf16_supported()
+        )
+        self.model.autocast_dtype = torch.bfloat16 if use_bf16 else None
+
+        if use_bf16:
+            logger.info("BF16 Autocast im Training aktiviert")
+
+    def close(self) -> None:
+        """Schliesse Environments (beendet SubprocVecEnv Worker)."""
+        self.vec_env.close()
+
     @staticmethod
-    def load_agent(path: str, env) -> "PPOAgent":
+    def load_agent(
+        path: str,
+        env=None,
+        env_fn: Optional[Callable[[], gym.Env]] = None,
+        n_envs: int = 1,
+    ) -> "PPOAgent":
         """
         Lade gespeicherten Agent.
 
         Args:
             path: Pfad zum Model
-            env: Trading Environment
+            env: Trading Environment, optional wenn env_fn gesetzt
+            env_fn: Factory fuer ein neues Environment
+            n_envs: Anzahl paralleler Environments
 
         Returns:
             PPOAgent Instanz
         """
-        agent = PPOAgent(env)
+        agent = PPOAgent(env, env_fn=env_fn, n_envs=n_envs)
         agent.load(path)
         return agent
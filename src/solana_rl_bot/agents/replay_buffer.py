@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Memory-mapped Replay Buffer fuer Off-Policy Agents (DQN, SAC).
+
+Speichert jedes Feld (obs, next_obs, action, reward, done, timeout) als
+eigenes, fest typisiertes numpy.memmap Array. Kalte Teile des Buffers
+koennen so vom OS auf Disk ausgelagert werden, Minibatches bleiben ein
+einziger Fancy-Index Gather pro Feld.
+"""
+
+from typing import Any, Dict, Optional
+import shutil
+import tempfile
+import weakref
+from pathlib import Path
+
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.buffers import ReplayBuffer
+
+from solana_rl_bot.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def replay_buffer_options(optimize_memory_usage: bool) -> Dict[str, Any]:
+    """
+    SB3 Replay-Buffer Argumente fuer DQN/SAC.
+
+    Mit optimize_memory_usage wird next_obs aus observations[pos + 1]
+    abgeleitet (halber Buffer-RAM). SB3 erlaubt das nur ohne
+    Timeout-Handling: Truncations (Portfolio-Verlust-Stop) werden dann
+    wie echte Episodenenden behandelt und nicht mehr gebootstrappt, das
+    Lernziel aendert sich also. Deshalb nur auf ausdruecklichen Wunsch.
+
+    Args:
+        optimize_memory_usage: Speichersparenden Buffer verwenden
+
+    Returns:
+        Keyword-Argumente fuer den SB3 Algorithmus
+    """
+    if not optimize_memory_usage:
+        return dict(optimize_memory_usage=False)
+
+    return dict(
+        optimize_memory_usage=True,
+        replay_buffer_kwargs=dict(handle_timeout_termination=False),
+    )
+
+
+class MemmapReplayBuffer(ReplayBuffer):
+    """
+    ReplayBuffer mit numpy.memmap Arrays statt In-Memory Arrays.
+
+    add() und sample() kommen unveraendert von SB3, da beide nur ueber
+    self.pos bzw. Index-Arrays auf die Felder zugreifen.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int,
+        observation_space: spaces.Space,
+        action_space: spaces.Space,
+        device="auto",
+        n_envs: int = 1,
+        optimize_memory_usage: bool = False,
+        handle_timeout_termination: bool = True,
+        memmap_dir: Optional[str] = None,
+    ):
+        """
+        Initialisiere Memmap Replay Buffer.
+
+        Args:
+            buffer_size: Max Anzahl Transitions
+            observation_space: Observation Space des Environments
+            action_space: Action Space des Environments
+            device: Torch Device fuer Samples
+            n_envs: Anzahl paralleler Environments
+            optimize_memory_usage: next_obs aus observations ableiten (SB3)
+            handle_timeout_termination: Truncation separat behandeln (SB3)
+            memmap_dir: Verzeichnis fuer die .dat Dateien (None = Temp-Verzeichnis)
+        """
+        super().__init__(
+            buffer_size,
+            observation_space,
+            action_space,
+            device=device,
+            n_envs=n_envs,
+            optimize_memory_usage=optimize_memory_usage,
+            handle_timeout_termination=handle_timeout_termination,
+        )
+
+        if memmap_dir is None:
+            self.memmap_dir = Path(tempfile.mkdtemp(prefix="replay_buffer_"))
+            # Temp-Verzeichnis wird mit dem Buffer entfernt
+            weakref.finalize(self, shutil.rmtree, self.memmap_dir, ignore_errors=True)
+        else:
+            self.memmap_dir = Path(memmap_dir)
+            self.memmap_dir.mkdir(parents=True, exist_ok=True)
+
+        shape = (self.buffer_size, self.n_envs)
+
+        # Discrete Actions passen in den kleinsten Integer-Typ
+        if isinstance(action_space, spaces.Discrete):
+            action_dtype = np.min_scalar_type(int(action_space.n) - 1)
+        else:
+            action_dtype = self.actions.dtype
+
+        self.observations = self._memmap("obs", (*shape, *self.obs_shape), np.float32)
+        if not optimize_memory_usage:
+            self.next_observations = self._memmap(
+                "next_obs", (*shape, *self.obs_shape), np.float32
+            )
+        self.actions = self._memmap("action", (*shape, self.action_dim), action_dtype)
+        self.rewards = self._memmap("reward", shape, np.float32)
+        self.dones = self._memmap("done", shape, np.float32)
+        self.timeouts = self._memmap("timeout", shape, np.float32)
+
+        logger.info(f"Memmap Replay Buffer: {self.buffer_size:,} x {self.n_envs} in {self.memmap_dir}")
+
+    def _memmap(self, name: str, shape: tuple, dtype) -> np.memmap:
+        """Erstelle ein mit Nullen initialisiertes memmap Array."""
+        return np.memmap(self.memmap_dir / f"{name}.dat", dtype=dtype, mode="w+", shape=shape)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Rollout Buffer mit vektorisierter GAE Berechnung fuer PPO.
+
+SB3 berechnet pro Step Delta, Maske und Advantage einzeln in Python.
+Hier werden Deltas und Decay-Faktoren fuer den ganzen Buffer auf einmal
+berechnet; die Rueckwaerts-Rekursion ist nur noch ein Multiply-Add pro
+Step ueber alle Envs.
+"""
+
+import numpy as np
+import torch
+from stable_baselines3.common.buffers import RolloutBuffer
+
+
+class FastGAERolloutBuffer(RolloutBuffer):
+    """RolloutBuffer mit vektorisiertem compute_returns_and_advantage()."""
+
+    def compute_returns_and_advantage(self, last_values: torch.Tensor, dones: np.ndarray) -> None:
+        """
+        Berechne GAE Advantages und Returns (identisch zu SB3).
+
+        Args:
+            last_values: Value Estimate der Observation nach dem letzten Step
+            dones: Episode-Ende nach dem letzten Step
+        """
+        last_values = last_values.clone().cpu().numpy().flatten()
+
+        # Maske und Value des jeweils naechsten Steps
+        next_non_terminal = np.empty_like(self.values)
+        next_non_terminal[:-1] = 1.0 - self.episode_starts[1:]
+        next_non_terminal[-1] = 1.0 - dones.astype(np.float32)
+
+        next_values = np.empty_like(self.values)
+        next_values[:-1] = self.values[1:]
+        next_values[-1] = last_values
+
+        deltas = self.rewards + self.gamma * next_values * next_non_terminal - self.values
+        decay = (self.gamma * self.gae_lambda) * next_non_terminal
+
+        # A_t = delta_t + gamma * lambda * (1 - done_t+1) * A_t+1
+        last_gae_lam = np.zeros(self.n_envs, dtype=self.advantages.dtype)
+        for step in range(self.buffer_size - 1, -1, -1):
+            last_gae_lam = deltas[step] + decay[step] * last_gae_lam
+            self.advantages[step] = last_gae_lam
+
+        # TD(lambda) Estimator, siehe SB3 RolloutBuffer
+        self.returns = self.advantages + self.values
@@ -4,18 +4,181 @@ Backtester für RL Trading Agents.
 Führt Backtests auf historischen Daten aus und sammelt Performance Metriken.
 """
 
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+from gymnasium import spaces
 from datetime import datetime
+from pathlib import Path
 
 from solana_rl_bot.environment import TradingEnv
 from solana_rl_bot.backtesting.metrics import PerformanceMetrics
-from solana_rl_bot.utils import get_logger
+from solana_rl_bot.utils import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
 
+class RandomAgent:
+    """
+    Zufalls-Agent als Klasse (im Gegensatz zu einer Closure picklebar).
+
+    Discrete und beschränkte Box Action Spaces werden blockweise mit einem
+    numpy Generator gezogen statt einzeln per action_space.sample().
+    """
+
+    def __init__(self, action_space: spaces.Space, pool_size: int = 10_000):
+        self.action_space = action_space
+        self.pool_size = pool_size
+        self._rng = np.random.default_rng()
+        self._pool = None
+        self._i = 0
+
+        self._batched = isinstance(action_space, spaces.Discrete) or (
+            isinstance(action_space, spaces.Box) and action_space.is_bounded()
+        )
+
+    def seed(self, seed: int) -> None:
+        """Seede Generator und Action Space (jeder Worker bekommt eine Kopie)."""
+        self._rng = np.random.default_rng(seed)
+        self.action_space.seed(seed)
+        self._pool = None
+
+    def _refill(self) -> None:
+        """Ziehe die nächsten pool_size Actions auf einmal."""
+        space = self.action_space
+        if isinstance(space, spaces.Discrete):
+            self._pool = self._rng.integers(space.start, space.start + space.n, size=self.pool_size)
+        else:
+            self._pool = self._rng.uniform(
+                space.low, space.high, size=(self.pool_size, *space.shape)
+            ).astype(space.dtype)
+        self._i = 0
+
+    def __call__(self, observation):
+        if not self._batched:
+            return self.action_space.sample()
+
+        if self._pool is None or self._i >= self.pool_size:
+            self._refill()
+
+        action = self._pool[self._i]
+        self._i += 1
+        return action
+
+
+def _init_worker() -> None:
+    """Konfiguriere Logging im Worker-Prozess."""
+    setup_logging()
+
+
+# Environment, Metriken und Agent eines Backtest-Workers (aus dem Initializer)
+_worker_state: Dict = {}
+
+
+def _init_backtest_worker(
+    env: TradingEnv, metrics: PerformanceMetrics, agent: Callable
+) -> None:
+    """Übernimm env (samt DataFrame), metrics und agent einmal pro Worker-Prozess."""
+    _init_worker()
+    _worker_state.update(env=env, metrics=metrics, agent=agent)
+
+
+def _backtest_in_worker(deterministic: bool, seed: int, history_dir: Optional[str]) -> Dict:
+    """Ein Backtest auf der Kopie von env und agent dieses Workers."""
+    return _backtest_one(
+        _worker_state["env"],
+        _worker_state["metrics"],
+        _worker_state["agent"],
+        deterministic,
+        seed,
+        history_dir,
+    )
+
+
+def _backtest_one(
+    env: TradingEnv,
+    metrics: PerformanceMetrics,
+    agent: Callable,
+    deterministic: bool,
+    seed: int,
+    history_dir: Optional[str] = None,
+) -> Dict:
+    """Ein Backtest auf env (im Worker: eigene Kopie von env und agent)."""
+    env.action_space.seed(seed)
+    if hasattr(agent, "seed"):
+        agent.seed(seed)
+
+    return Backtester(env, metrics).run_backtest(
+        agent, deterministic=deterministic, verbose=False, history_dir=history_dir
+    )
+
+
+def _n_workers(n_jobs: int, n_tasks: int, agent: Callable) -> int:
+    """Anzahl Worker-Prozesse; 1 wenn der Agent nicht picklebar ist (z.B. Closure)."""
+    n_workers = min(n_tasks, os.cpu_count() or 1) if n_jobs == -1 else min(n_tasks, n_jobs)
+    if n_workers <= 1:
+        return 1
+
+    try:
+        pickle.dumps(agent)
+    except Exception as e:
+        logger.warning(f"Agent nicht picklebar ({e}), laufe sequentiell")
+        return 1
+
+    return n_workers
+
+
+def _walk_forward_windows(
+    df: pd.DataFrame,
+    offset: int,
+    windows: List[Tuple[int, int, int, int]],
+    env_kwargs: Dict,
+    metrics: PerformanceMetrics,
+    agent: Callable,
+) -> List[Dict]:
+    """
+    Teste eine Folge von Walk-Forward Windows.
+
+    Ein Environment + Backtester für alle Windows, pro Window nur neue
+    Daten. df beginnt bei Index offset des kompletten DataFrames.
+    """
+    results = []
+    test_env = None
+    backtester = None
+
+    for train_start, train_end, test_start, test_end in windows:
+        logger.info(
+            f"Window: Train[{train_start}:{train_end}], Test[{test_start}:{test_end}]"
+        )
+
+        # Test auf Test Window
+        test_df = df.iloc[test_start - offset:test_end - offset]
+
+        if test_env is None:
+            test_env = TradingEnv(df=test_df, **env_kwargs)
+            backtester = Backtester(test_env, metrics)
+        else:
+            test_env.set_df(test_df)
+
+        # Backtest
+        result = backtester.run_backtest(agent, deterministic=True, verbose=False)
+
+        result["window"] = {
+            "train_start": train_start,
+            "train_end": train_end,
+            "test_start": test_start,
+            "test_end": test_end,
+        }
+
+        results.append(result)
+
+    return results
+
+
 class Backtester:
     """
     Backtesting Framework für RL Trading Agents.
@@ -43,6 +206,7 @@ class Backtester:
         agent: Callable,
         deterministic: bool = True,
         verbose: bool = False,
+        history_dir: Optional[str] = None,
     ) -> Dict:
         """
         Führe Backtest aus.
@@ -51,6 +215,9 @@ class Backtester:
             agent: Agent Function (observation -> action)
             deterministic: Deterministisch (no exploration)
             verbose: Verbose logging
+            history_dir: Verzeichnis für die History-Arrays als .npy memmaps
+                (None = im RAM). Die Ergebnisse enthalten dann memmap-Views,
+                das OS lagert sie bei Bedarf aus.
 
         Returns:
             Dictionary mit Backtest-Ergebnissen
@@ -66,10 +233,21 @@ class Backtester:
         step_count = 0
         total_reward = 0.0
 
-        portfolio_history = []
-        actions_history = []
-        prices_history = []
-        timestamps_history = []
+        # Vorallokierte Arrays (eine Episode hat hoechstens len(df) Steps);
+        # Preise und Timestamps werden erst am Ende ueber die Step-Indizes geholt
+        df = self.env.df
+        max_steps = len(df)
+        action_shape = self.env.action_space.shape
+
+        history_path = Path(history_dir) if history_dir is not None else None
+        if history_path is not None:
+            history_path.mkdir(parents=True, exist_ok=True)
+
+        portfolio_history = self._history_array(history_path, "portfolio", (max_steps,), np.float64)
+        actions_history = self._history_array(
+            history_path, "actions", (max_steps, *action_shape), self.env.action_space.dtype
+        )
+        step_indices = np.empty(max_steps, dtype=np.int64)
 
         while not (done or truncated):
             # Agent Prediction
@@ -79,33 +257,47 @@ class Backtester:
             observation, reward, done, truncated, info = self.env.step(action)
 
             # Track
+            portfolio_history[step_count] = info["portfolio_value"]
+            actions_history[step_count] = np.reshape(action, action_shape)
+            step_indices[step_count] = self.env.current_step
             step_count += 1
             total_reward += reward
-            portfolio_history.append(info["portfolio_value"])
-            actions_history.append(action)
-
-            # Price und Timestamp
-            current_price = self.env.df.iloc[self.env.current_step]["close"]
-            prices_history.append(current_price)
-
-            if "timestamp" in self.env.df.columns:
-                timestamp = self.env.df.iloc[self.env.current_step]["timestamp"]
-                timestamps_history.append(timestamp)
 
             if verbose and step_count % 50 == 0:
+                # Lazy Formatting: loguru formatiert nur, wenn ein Sink INFO annimmt
                 logger.info(
-                    f"Step {step_count}: Portfolio=${info['portfolio_value']:.2f}, "
-                    f"Return={info['total_return']*100:+.2f}%"
+                    "Step {}: Portfolio=${:.2f}, Return={:+.2f}%",
+                    step_count,
+                    info["portfolio_value"],
+                    info["total_return"] * 100,
                 )
 
+        portfolio_history = portfolio_history[:step_count]
+        actions_history = actions_history[:step_count]
+        step_indices = step_indices[:step_count]
+
+        # Price und Timestamp pro Step
+        prices_history = df["close"].to_numpy()[step_indices]
+        if history_path is not None:
+            prices_out = self._history_array(history_path, "prices", (step_count,), np.float64)
+            prices_out[:] = prices_history
+            prices_history = prices_out
+        if "timestamp" in df.columns:
+            timestamps_history = df["timestamp"].iloc[step_indices].tolist()
+        else:
+            timestamps_history = []
+
         # Backtest Stats
         stats = self.env.get_trade_statistics()
 
+        # Kopie: trade_records ist eine View, die nach env.reset() überschrieben wird
+        trade_records = self.env.trade_records.copy()
+
         # Performance Metriken
         timestamps = timestamps_history if len(timestamps_history) > 0 else None
         performance = self.metrics.calculate_all_metrics(
             portfolio_values=portfolio_history,
-            trades=self.env.trades,
+            trades=trade_records,
             initial_balance=self.env.initial_balance,
             timestamps=timestamps,
         )
@@ -128,6 +320,7 @@ class Backtester:
             "prices_history": prices_history,
             "timestamps_history": timestamps_history,
             "trades": self.env.trades,
+            "trade_records": trade_records,
             "stats": stats,
             "performance": performance,
         }
@@ -139,34 +332,77 @@ class Backtester:
 
         return results
 
+    @staticmethod
+    def _history_array(history_path: Optional[Path], name: str, shape: tuple, dtype) -> np.ndarray:
+        """Leeres History-Array im RAM oder als .npy memmap in history_path."""
+        if history_path is None:
+            return np.empty(shape, dtype=dtype)
+        return np.lib.format.open_memmap(
+            history_path / f"{name}.npy", mode="w+", dtype=dtype, shape=shape
+        )
+
     def run_multiple_backtests(
         self,
         agent: Callable,
         n_runs: int = 10,
         deterministic: bool = True,
+        n_jobs: int = 1,
+        history_dir: Optional[str] = None,
     ) -> List[Dict]:
         """
         Führe mehrere Backtests aus (mit verschiedenen Seeds).
 
+        Runs sind unabhängig und können mit n_jobs != 1 parallel in
+        Worker-Prozessen laufen; agent und Environment müssen dafür
+        picklebar sein (sonst sequentiell).
+
         Args:
             agent: Agent Function
             n_runs: Anzahl Runs
             deterministic: Deterministisch
+            n_jobs: Anzahl Worker-Prozesse (-1 = alle CPU Kerne, 1 = sequentiell)
+            history_dir: Verzeichnis für die History-Arrays (ein Unterordner pro Run)
 
         Returns:
             Liste von Backtest-Ergebnissen
         """
         logger.info(f"Starte {n_runs} Backtests...")
 
-        results = []
-
-        for run in range(n_runs):
-            logger.info(f"Run {run + 1}/{n_runs}")
-
-            # Backtest
-            result = self.run_backtest(agent, deterministic=deterministic, verbose=False)
-
-            results.append(result)
+        n_workers = _n_workers(n_jobs, n_runs, agent)
+
+        if history_dir is None:
+            run_dirs = [None] * n_runs
+        else:
+            run_dirs = [str(Path(history_dir) / f"run_{run}") for run in range(n_runs)]
+
+        if n_workers <= 1:
+            results = []
+            for run in range(n_runs):
+                logger.info(f"Run {run + 1}/{n_runs}")
+                results.append(
+                    _backtest_one(
+                        self.env, self.metrics, agent, deterministic, run, run_dirs[run]
+                    )
+                )
+        else:
+            # forkserver: kein Fork des Elternprozesses samt Torch-State
+            ctx = multiprocessing.get_context("forkserver")
+            # env (mit DataFrame) und agent gehen einmal pro Worker über den
+            # Initializer, pro Run werden nur Seed und Verzeichnis gepickelt
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=ctx,
+                initializer=_init_backtest_worker,
+                initargs=(self.env, self.metrics, agent),
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _backtest_in_worker,
+                        [deterministic] * n_runs,
+                        range(n_runs),
+                        run_dirs,
+                    )
+                )
 
         # Aggregiere Statistiken
         aggregated = self._aggregate_results(results)
@@ -178,20 +414,29 @@ class Backtester:
 
         return results
 
+    @staticmethod
+    def _collect_performance(results: List[Dict], key: str, default=None) -> np.ndarray:
+        """Sammle eine Performance-Metrik aller Ergebnisse in ein float64 Array."""
+        if default is None:
+            values = (r["performance"][key] for r in results)
+        else:
+            values = (r["performance"].get(key, default) for r in results)
+        return np.fromiter(values, dtype=np.float64, count=len(results))
+
     def _aggregate_results(self, results: List[Dict]) -> Dict:
         """Aggregiere Ergebnisse von mehreren Backtests."""
-        returns = [r["performance"]["total_return"] for r in results]
-        sharpes = [r["performance"].get("sharpe_ratio", 0) for r in results]
-        max_dds = [r["performance"]["max_drawdown"] for r in results]
+        returns = self._collect_performance(results, "total_return")
+        sharpes = self._collect_performance(results, "sharpe_ratio", default=0.0)
+        max_dds = self._collect_performance(results, "max_drawdown")
 
         aggregated = {
             "n_runs": len(results),
-            "avg_return": np.mean(returns),
-            "std_return": np.std(returns),
-            "best_return": max(returns),
-            "worst_return": min(returns),
-            "avg_sharpe": np.mean(sharpes),
-            "avg_max_drawdown": np.mean(max_dds),
+            "avg_return": returns.mean(),
+            "std_return": returns.std(),
+            "best_return": returns.max(),
+            "worst_return": returns.min(),
+            "avg_sharpe": sharpes.mean(),
+            "avg_max_drawdown": max_dds.mean(),
         }
 
         return aggregated
@@ -203,11 +448,16 @@ class Backtester:
         train_size: int = 1000,
         test_size: int = 200,
         step_size: int = 100,
+        n_jobs: int = 1,
     ) -> List[Dict]:
         """
         Walk-Forward Analysis.
 
-        Teilt Daten in überlappende Train/Test Windows.
+        Teilt Daten in überlappende Train/Test Windows. Die Windows sind
+        unabhängig und laufen in zusammenhängenden Blöcken parallel in
+        Worker-Prozessen; agent muss dafür picklebar und zustandslos sein
+        (sonst sequentiell). Lohnt sich erst, wenn die Windows deutlich
+        länger laufen als der Start der Worker (Import von Torch etc.).
 
         Args:
             df: Komplettes DataFrame
@@ -215,59 +465,59 @@ class Backtester:
             train_size: Training Window Size
             test_size: Test Window Size
             step_size: Schritt-Größe
+            n_jobs: Anzahl Worker-Prozesse (-1 = alle CPU Kerne, 1 = sequentiell)
 
         Returns:
-            Liste von Test-Ergebnissen
+            Liste von Test-Ergebnissen (in Window-Reihenfolge)
         """
         logger.info(
             f"Starte Walk-Forward Analysis: "
             f"Train={train_size}, Test={test_size}, Step={step_size}"
         )
 
-        results = []
-        start_idx = 0
-
-        while start_idx + train_size + test_size <= len(df):
-            # Train Window
-            train_start = start_idx
-            train_end = start_idx + train_size
+        # (train_start, train_end, test_start, test_end) pro Window
+        windows = [
+            (start, start + train_size, start + train_size, start + train_size + test_size)
+            for start in range(0, len(df) - train_size - test_size + 1, step_size)
+        ]
 
-            # Test Window
-            test_start = train_end
-            test_end = test_start + test_size
-
-            logger.info(
-                f"Window: Train[{train_start}:{train_end}], Test[{test_start}:{test_end}]"
-            )
-
-            # Test auf Test Window
-            test_df = df.iloc[test_start:test_end].copy()
-
-            # Erstelle neues Environment für Test
-            test_env = TradingEnv(
-                df=test_df,
-                initial_balance=self.env.initial_balance,
-                commission=self.env.commission,
-                reward_type=self.env.reward_function.name,
-            )
-
-            # Temporärer Backtester
-            temp_backtester = Backtester(test_env, self.metrics)
-
-            # Backtest
-            result = temp_backtester.run_backtest(agent, deterministic=True, verbose=False)
-
-            result["window"] = {
-                "train_start": train_start,
-                "train_end": train_end,
-                "test_start": test_start,
-                "test_end": test_end,
-            }
-
-            results.append(result)
+        env_kwargs = {
+            "initial_balance": self.env.initial_balance,
+            "commission": self.env.commission,
+            "reward_type": self.env.reward_function.name,
+        }
 
-            # Nächstes Window
-            start_idx += step_size
+        n_workers = _n_workers(n_jobs, len(windows), agent)
+
+        if n_workers <= 1:
+            results = _walk_forward_windows(df, 0, windows, env_kwargs, self.metrics, agent)
+        else:
+            # Zusammenhängende Blöcke, jeder Worker bekommt nur seinen Datenausschnitt
+            chunks = [list(chunk) for chunk in np.array_split(np.arange(len(windows)), n_workers)]
+            jobs = []
+            for chunk in chunks:
+                chunk_windows = [windows[i] for i in chunk]
+                first, last = chunk_windows[0][2], chunk_windows[-1][3]
+                jobs.append((df.iloc[first:last], first, chunk_windows))
+
+            # forkserver: kein Fork des Elternprozesses samt Torch-State
+            ctx = multiprocessing.get_context("forkserver")
+            with ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=ctx, initializer=_init_worker
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _walk_forward_windows,
+                        chunk_df,
+                        offset,
+                        chunk_windows,
+                        env_kwargs,
+                        self.metrics,
+                        agent,
+                    )
+                    for chunk_df, offset, chunk_windows in jobs
+                ]
+                results = [result for future in futures for result in future.result()]
 
         # Aggregiere Walk-Forward Results
         if len(results) > 0:
@@ -281,36 +531,36 @@ class Backtester:
 
     def _aggregate_walk_forward_results(self, results: List[Dict]) -> Dict:
         """Aggregiere Walk-Forward Results."""
-        returns = [r["performance"]["total_return"] for r in results]
-        sharpes = [r["performance"].get("sharpe_ratio", 0) for r in results]
+        returns = self._collect_performance(results, "total_return")
+        sharpes = self._collect_performance(results, "sharpe_ratio", default=0.0)
 
         return {
             "n_windows": len(results),
-            "avg_return": np.mean(returns),
-            "std_return": np.std(returns),
-            "best_return": max(returns),
-            "worst_return": min(returns),
-            "avg_sharpe": np.mean(sharpes),
-            "win_rate": sum(1 for r in returns if r > 0) / len(returns),
+            "avg_return": returns.mean(),
+            "std_return": returns.std(),
+            "best_return": returns.max(),
+            "worst_return": returns.min(),
+            "avg_sharpe": sharpes.mean(),
+            "win_rate": (returns > 0).mean(),
         }
 
-    def benchmark_against_random(self, n_runs: int = 10) -> Dict:
+    def benchmark_against_random(self, n_runs: int = 10, n_jobs: int = -1) -> Dict:
         """
         Benchmark gegen Random Agent.
 
         Args:
             n_runs: Anzahl Random Runs
+            n_jobs: Anzahl Worker-Prozesse (-1 = alle CPU Kerne)
 
         Returns:
             Benchmark-Ergebnisse
         """
         logger.info(f"Benchmark gegen Random Agent ({n_runs} runs)...")
 
-        def random_agent(observation):
-            return self.env.action_space.sample()
+        random_agent = RandomAgent(self.env.action_space)
 
         # Multiple Runs
-        random_results = self.run_multiple_backtests(random_agent, n_runs=n_runs)
+        random_results = self.run_multiple_backtests(random_agent, n_runs=n_runs, n_jobs=n_jobs)
 
         # Aggregiere
         random_stats = self._aggregate_results(random_results)
@@ -7,7 +7,8 @@ Berechnet Trading Performance Metriken:
 - Trading Metrics (Win Rate, Profit Factor, Trades)
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+import math
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
@@ -16,6 +17,37 @@ from solana_rl_bot.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Annualisierungs-Konstanten
+_SQRT_252 = math.sqrt(252.0)
+_SECONDS_PER_YEAR = 365.25 * 86400.0
+
+
+def _risk_stats(returns: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Mean, Std und Downside-Deviation der Returns mit einem Scratch-Buffer.
+
+    Mean und Std wie np.mean/np.std (gleiche Summation, bitgleiche
+    Ergebnisse), der Mittelwert wird aber nur einmal berechnet.
+    Downside-Deviation (Sortino): sqrt(mean(min(r, 0)^2)) über alle N
+    Returns; 0 genau dann, wenn es keine negativen Returns gibt.
+
+    Returns:
+        (mean, std, downside_std)
+    """
+    n = returns.size
+    mean = returns.sum() / n
+
+    scratch = returns - mean
+    np.multiply(scratch, scratch, out=scratch)
+    std = np.sqrt(scratch.sum() / n)
+
+    # Scratch-Buffer wiederverwenden: min(r, 0)^2
+    np.minimum(returns, 0.0, out=scratch)
+    np.multiply(scratch, scratch, out=scratch)
+    downside_std = np.sqrt(scratch.sum() / n)
+
+    return mean, std, downside_std
+
 
 class PerformanceMetrics:
     """
@@ -30,20 +62,25 @@ class PerformanceMetrics:
             risk_free_rate: Risk-free Rate (annualisiert, z.B. 0.02 für 2%)
         """
         self.risk_free_rate = risk_free_rate
+        self._rf_daily = risk_free_rate / 252.0
 
     def calculate_all_metrics(
         self,
-        portfolio_values: List[float],
-        trades: List[Dict],
+        portfolio_values: Union[List[float], np.ndarray],
+        trades: Union[List[Dict], np.ndarray, pd.DataFrame],
         initial_balance: float,
         timestamps: Optional[List[datetime]] = None,
     ) -> Dict:
         """
         Berechne alle Performance Metriken.
 
+        Ein zusammenhängendes float64 Array (auch np.memmap, z.B. die
+        vorallozierte portfolio_history aus Backtester.run_backtest) wird
+        ohne Kopie verwendet; Listen werden einmal konvertiert.
+
         Args:
-            portfolio_values: Liste von Portfolio Values
-            trades: Liste von Trades
+            portfolio_values: Portfolio Values (Liste oder float64 Array)
+            trades: Liste von Trades, Trade-Log Structured Array oder DataFrame
             initial_balance: Initiales Kapital
             timestamps: Optional - Liste von Timestamps
 
@@ -53,24 +90,37 @@ class PerformanceMetrics:
         if len(portfolio_values) == 0:
             return {"error": "Keine Portfolio Values"}
 
+        # Einmal in ein zusammenhängendes float64 Array, alle Helper teilen es
+        # (no-op für float64 Arrays aus dem Backtester)
+        pv = np.ascontiguousarray(portfolio_values, dtype=np.float64)
+
         metrics = {}
 
         # 1. Return Metrics
-        metrics.update(self._calculate_return_metrics(portfolio_values, initial_balance, timestamps))
+        metrics.update(self._calculate_return_metrics(pv, initial_balance, timestamps))
+
+        # Ein einzelner Wert hat keine Returns und keinen Drawdown:
+        # Risk Metrics entfallen, Drawdown ist 0 (ohne NumPy-Aufrufe)
+        if pv.size < 2:
+            metrics.update(self._calculate_trading_metrics(trades))
+            metrics.update(
+                {"max_drawdown": 0.0, "max_drawdown_pct": 0.0, "max_drawdown_duration_steps": 0}
+            )
+            return metrics
 
         # 2. Risk Metrics
-        metrics.update(self._calculate_risk_metrics(portfolio_values, initial_balance, timestamps))
+        metrics.update(self._calculate_risk_metrics(pv, initial_balance, timestamps))
 
         # 3. Trading Metrics
         metrics.update(self._calculate_trading_metrics(trades))
 
         # 4. Drawdown Metrics
-        metrics.update(self._calculate_drawdown_metrics(portfolio_values))
+        metrics.update(self._calculate_drawdown_metrics(pv))
 
         return metrics
 
     def _calculate_return_metrics(
-        self, portfolio_values: List[float], initial_balance: float, timestamps: Optional[List[datetime]] = None
+        self, portfolio_values: np.ndarray, initial_balance: float, timestamps: Optional[List[datetime]] = None
     ) -> Dict:
         """Berechne Return Metriken."""
         final_value = portfolio_values[-1]
@@ -97,139 +147,151 @@ class PerformanceMetrics:
         return metrics
 
     def _calculate_risk_metrics(
-        self, portfolio_values: List[float], initial_balance: float, timestamps: Optional[List[datetime]] = None
+        self, portfolio_values: np.ndarray, initial_balance: float, timestamps: Optional[List[datetime]] = None
     ) -> Dict:
         """Berechne Risk Metriken."""
-        # Returns berechnen
-        returns = np.diff(portfolio_values) / portfolio_values[:-1]
+        # Returns berechnen (Differenz und Division in einem Buffer)
+        returns = np.empty(max(portfolio_values.size - 1, 0), dtype=np.float64)
+        np.subtract(portfolio_values[1:], portfolio_values[:-1], out=returns)
+        returns /= portfolio_values[:-1]
 
         if len(returns) == 0:
             return {}
 
-        # Volatility
-        volatility = np.std(returns)
+        # Mean, Volatility und Downside-Volatility
+        mean_return, volatility, downside_std = _risk_stats(returns)
         
-        # Annualized Volatility (252 trading days)
+        # Annualisierung über die Bar-Frequenz aus den Timestamps
+        # (sqrt(Steps pro Jahr)), sonst Fallback auf Tagesdaten (252)
+        ann_factor = _SQRT_252
+        rf_per_step = self._rf_daily
         if timestamps and len(timestamps) >= 2:
             # Berechne durchschnittliche Zeit zwischen Steps
-            time_diffs = [(timestamps[i+1] - timestamps[i]).total_seconds() for i in range(len(timestamps)-1)]
-            avg_seconds = np.mean(time_diffs)
-            steps_per_year = (365.25 * 24 * 3600) / avg_seconds
-            annualized_volatility = volatility * np.sqrt(steps_per_year)
-        else:
-            # Fallback: Assume daily data
-            annualized_volatility = volatility * np.sqrt(252)
+            # Vektorisiert über int64 Nanosekunden statt timedelta pro Step
+            ts_ns = pd.DatetimeIndex(timestamps).as_unit("ns").asi8
+            avg_seconds = (np.diff(ts_ns) / 1e9).mean()
+            if avg_seconds > 0:
+                steps_per_year = _SECONDS_PER_YEAR / avg_seconds
+                ann_factor = math.sqrt(steps_per_year)
+                rf_per_step = self.risk_free_rate / steps_per_year
 
         metrics = {
             "volatility": volatility,
-            "annualized_volatility": annualized_volatility,
+            "annualized_volatility": volatility * ann_factor,
         }
 
-        # Sharpe Ratio
-        mean_return = np.mean(returns)
+        # Sharpe Ratio (annualisiert)
         if volatility > 0:
-            sharpe_ratio = (mean_return - self.risk_free_rate / 252) / volatility
-            # Annualized Sharpe
-            sharpe_ratio_annualized = sharpe_ratio * np.sqrt(252)
-            metrics["sharpe_ratio"] = sharpe_ratio_annualized
+            metrics["sharpe_ratio"] = (mean_return - rf_per_step) / volatility * ann_factor
         else:
             metrics["sharpe_ratio"] = 0.0
 
         # Sortino Ratio (nur Downside)
-        downside_returns = returns[returns < 0]
-        if len(downside_returns) > 0:
-            downside_std = np.std(downside_returns)
-            if downside_std > 0:
-                sortino_ratio = (mean_return - self.risk_free_rate / 252) / downside_std
-                sortino_ratio_annualized = sortino_ratio * np.sqrt(252)
-                metrics["sortino_ratio"] = sortino_ratio_annualized
-            else:
-                metrics["sortino_ratio"] = 0.0
+        if downside_std > 0:
+            metrics["sortino_ratio"] = (mean_return - rf_per_step) / downside_std * ann_factor
         else:
             # Keine negativen Returns = perfekt
             metrics["sortino_ratio"] = float('inf')
 
         return metrics
 
-    def _calculate_trading_metrics(self, trades: List[Dict]) -> Dict:
-        """Berechne Trading Metriken."""
+    def _calculate_trading_metrics(self, trades: Union[List[Dict], np.ndarray, pd.DataFrame]) -> Dict:
+        """
+        Berechne Trading Metriken.
+
+        trades ist entweder eine Liste von Trade-Dicts, ein Structured Array
+        mit den Spalten "side" (-1 = SELL), "profit" und "profit_pct"
+        (z.B. TradingEnv.trade_records) oder ein DataFrame mit den Spalten
+        der Trade-Dicts (z.B. pd.DataFrame(env.trades)); die beiden letzten
+        ohne Python-Schleife.
+        """
         if len(trades) == 0:
             return {"total_trades": 0, "completed_trades": 0}
 
-        # Filtere SELL trades (completed)
-        sell_trades = [t for t in trades if t.get("action") == "SELL"]
-
-        if len(sell_trades) == 0:
+        # Profits der SELL trades (completed) als Spalten
+        if isinstance(trades, np.ndarray):
+            sells = trades[trades["side"] == -1]
+            profits = sells["profit"]
+            profit_pcts = sells["profit_pct"]
+        elif isinstance(trades, pd.DataFrame):
+            sells = trades[trades["action"].to_numpy() == "SELL"]
+            if len(sells) == 0:
+                # Nur BUY Trades: DataFrame hat ggf. keine Profit-Spalten
+                return {"total_trades": len(trades), "completed_trades": 0}
+            profits = sells["profit"].to_numpy(dtype=np.float64)
+            profit_pcts = sells["profit_pct"].to_numpy(dtype=np.float64)
+        else:
+            # Ein Durchlauf über die Trade-Dicts, direkt in ein Structured Array
+            sells = np.fromiter(
+                ((t["profit"], t["profit_pct"]) for t in trades if t.get("action") == "SELL"),
+                dtype=[("profit", np.float64), ("profit_pct", np.float64)],
+            )
+            profits = sells["profit"]
+            profit_pcts = sells["profit_pct"]
+
+        n_completed = len(profits)
+        if n_completed == 0:
             return {"total_trades": len(trades), "completed_trades": 0}
 
-        profits = [t["profit"] for t in sell_trades]
-        profit_pcts = [t["profit_pct"] for t in sell_trades]
-
-        winning_trades = [p for p in profits if p > 0]
-        losing_trades = [p for p in profits if p <= 0]
+        # Summen einmal aus der Win-Maske, Mittelwerte daraus abgeleitet
+        wins = profits > 0
+        n_wins = int(np.count_nonzero(wins))
+        n_losses = n_completed - n_wins
+        total_profit = profits.sum()
+        wins_sum = profits[wins].sum()
+        losses_sum = profits[~wins].sum()
 
         metrics = {
             "total_trades": len(trades),
-            "completed_trades": len(sell_trades),
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
-            "win_rate": len(winning_trades) / len(sell_trades) if sell_trades else 0,
-            "avg_profit": np.mean(profits),
-            "avg_profit_pct": np.mean(profit_pcts) * 100,
-            "max_profit": max(profits),
-            "max_loss": min(profits),
-            "total_profit_from_trades": sum(profits),
+            "completed_trades": n_completed,
+            "winning_trades": n_wins,
+            "losing_trades": n_losses,
+            "win_rate": n_wins / n_completed,
+            "avg_profit": total_profit / n_completed,
+            "avg_profit_pct": profit_pcts.mean() * 100,
+            "max_profit": profits.max(),
+            "max_loss": profits.min(),
+            "total_profit_from_trades": total_profit,
         }
 
         # Profit Factor (Gewinn / Verlust Ratio)
-        if len(winning_trades) > 0 and len(losing_trades) > 0:
-            total_wins = sum(winning_trades)
-            total_losses = abs(sum(losing_trades))
+        if n_wins > 0 and n_losses > 0:
+            total_losses = abs(losses_sum)
             if total_losses > 0:
-                metrics["profit_factor"] = total_wins / total_losses
+                metrics["profit_factor"] = wins_sum / total_losses
             else:
                 metrics["profit_factor"] = float('inf')
         else:
             metrics["profit_factor"] = 0.0
 
         # Average Win / Average Loss
-        if len(winning_trades) > 0:
-            metrics["avg_win"] = np.mean(winning_trades)
-        else:
-            metrics["avg_win"] = 0.0
-
-        if len(losing_trades) > 0:
-            metrics["avg_loss"] = np.mean(losing_trades)
-        else:
-            metrics["avg_loss"] = 0.0
+        metrics["avg_win"] = wins_sum / n_wins if n_wins > 0 else 0.0
+        metrics["avg_loss"] = losses_sum / n_losses if n_losses > 0 else 0.0
 
         return metrics
 
-    def _calculate_drawdown_metrics(self, portfolio_values: List[float]) -> Dict:
+    def _calculate_drawdown_metrics(self, portfolio_values: np.ndarray) -> Dict:
         """Berechne Drawdown Metriken."""
-        portfolio_array = np.array(portfolio_values)
-
         # Running Maximum
-        running_max = np.maximum.accumulate(portfolio_array)
+        running_max = np.maximum.accumulate(portfolio_values)
 
-        # Drawdown
-        drawdown = (running_max - portfolio_array) / running_max
+        # Drawdown (in-place im Buffer der Differenz)
+        drawdown = running_max - portfolio_values
+        drawdown /= running_max
 
         # Max Drawdown
-        max_drawdown = np.max(drawdown)
+        max_drawdown = drawdown.max()
 
         # Max Drawdown Duration (in Steps)
         in_drawdown = drawdown > 0
-        if np.any(in_drawdown):
-            # Finde längste Drawdown-Periode
-            drawdown_starts = np.where(np.diff(np.concatenate(([0], in_drawdown.astype(int)))) == 1)[0]
-            drawdown_ends = np.where(np.diff(np.concatenate((in_drawdown.astype(int), [0]))) == -1)[0]
-            
-            if len(drawdown_starts) > 0 and len(drawdown_ends) > 0:
-                drawdown_durations = drawdown_ends - drawdown_starts
-                max_drawdown_duration = np.max(drawdown_durations)
-            else:
-                max_drawdown_duration = 0
+        if in_drawdown.any():
+            # Grenzen der Runs gleicher Werte, ohne die Maske zu kopieren/padden
+            transitions = np.flatnonzero(in_drawdown[1:] != in_drawdown[:-1]) + 1
+            boundaries = np.concatenate(([0], transitions, [in_drawdown.size]))
+            run_lengths = np.diff(boundaries)
+
+            # Dauer wie bisher als Ende - Start (Index-Differenz)
+            max_drawdown_duration = run_lengths[in_drawdown[boundaries[:-1]]].max() - 1
         else:
             max_drawdown_duration = 0
 
@@ -265,13 +327,17 @@ class PerformanceMetrics:
 
     def compare_to_buy_and_hold(
         self,
-        portfolio_values: List[float],
-        prices: List[float],
+        portfolio_values: Union[List[float], np.ndarray],
+        prices: Union[List[float], np.ndarray],
         initial_balance: float,
     ) -> Dict:
         """
         Vergleiche Strategie mit Buy-and-Hold.
 
+        prices (und portfolio_values) dürfen auch 2D sein, eine Zeile pro
+        Asset bzw. Strategie (n x Steps); die Werte im Ergebnis sind dann
+        Arrays mit einem Eintrag pro Zeile (Broadcasting, keine Schleife).
+
         Args:
             portfolio_values: Portfolio Values der Strategie
             prices: Preise (Close) für Buy-and-Hold
@@ -280,17 +346,21 @@ class PerformanceMetrics:
         Returns:
             Dictionary mit Vergleichs-Metriken
         """
-        if len(prices) < 2:
+        prices = np.asarray(prices, dtype=np.float64)
+        portfolio_values = np.asarray(portfolio_values, dtype=np.float64)
+
+        if prices.shape[-1] < 2:
             return {}
 
-        # Buy-and-Hold Return
-        initial_price = prices[0]
-        final_price = prices[-1]
+        # Buy-and-Hold Return (pro Zeile bei 2D)
+        # np.take: Skalar bei 1D, Array pro Zeile bei 2D
+        initial_price = np.take(prices, 0, axis=-1)
+        final_price = np.take(prices, -1, axis=-1)
         bah_return = (final_price - initial_price) / initial_price
         bah_final_value = initial_balance * (1 + bah_return)
 
         # Strategie Return
-        strategy_final_value = portfolio_values[-1]
+        strategy_final_value = np.take(portfolio_values, -1, axis=-1)
         strategy_return = (strategy_final_value - initial_balance) / initial_balance
 
         # Alpha (Excess Return)
@@ -318,37 +388,43 @@ class PerformanceMetrics:
         Returns:
             Formatierter String
         """
-        lines = []
-        lines.append("=" * 60)
-        lines.append("PERFORMANCE METRICS")
-        lines.append("=" * 60)
+        get = metrics.get
+        rule = "=" * 60
+        sections = [f"{rule}\nPERFORMANCE METRICS\n{rule}"]
 
         # Return Metrics
         if "total_return" in metrics:
-            lines.append("\n[RETURNS]")
-            lines.append(f"  Initial Balance:    ${metrics.get('initial_balance', 0):.2f}")
-            lines.append(f"  Final Value:        ${metrics.get('final_value', 0):.2f}")
-            lines.append(f"  Total Return:       {metrics.get('total_return_pct', 0):+.2f}%")
+            section = (
+                f"\n[RETURNS]\n"
+                f"  Initial Balance:    ${get('initial_balance', 0):.2f}\n"
+                f"  Final Value:        ${get('final_value', 0):.2f}\n"
+                f"  Total Return:       {get('total_return_pct', 0):+.2f}%"
+            )
             if "annualized_return" in metrics:
-                lines.append(f"  Annualized Return:  {metrics.get('annualized_return_pct', 0):+.2f}%")
+                section += f"\n  Annualized Return:  {get('annualized_return_pct', 0):+.2f}%"
+            sections.append(section)
 
         # Risk Metrics
         if "sharpe_ratio" in metrics:
-            lines.append("\n[RISK METRICS]")
-            lines.append(f"  Volatility (Ann.):  {metrics.get('annualized_volatility', 0)*100:.2f}%")
-            lines.append(f"  Sharpe Ratio:       {metrics.get('sharpe_ratio', 0):.3f}")
-            lines.append(f"  Sortino Ratio:      {metrics.get('sortino_ratio', 0):.3f}")
-            lines.append(f"  Max Drawdown:       {metrics.get('max_drawdown_pct', 0):.2f}%")
+            sections.append(
+                f"\n[RISK METRICS]\n"
+                f"  Volatility (Ann.):  {get('annualized_volatility', 0)*100:.2f}%\n"
+                f"  Sharpe Ratio:       {get('sharpe_ratio', 0):.3f}\n"
+                f"  Sortino Ratio:      {get('sortino_ratio', 0):.3f}\n"
+                f"  Max Drawdown:       {get('max_drawdown_pct', 0):.2f}%"
+            )
 
         # Trading Metrics
         if "total_trades" in metrics:
-            lines.append("\n[TRADING]")
-            lines.append(f"  Total Trades:       {metrics.get('total_trades', 0)}")
-            lines.append(f"  Completed Trades:   {metrics.get('completed_trades', 0)}")
-            lines.append(f"  Win Rate:           {metrics.get('win_rate', 0)*100:.1f}%")
-            lines.append(f"  Profit Factor:      {metrics.get('profit_factor', 0):.2f}")
-            lines.append(f"  Avg Profit:         ${metrics.get('avg_profit', 0):.2f}")
-
-        lines.append("=" * 60)
-
-        return "\n".join(lines)
+            sections.append(
+                f"\n[TRADING]\n"
+                f"  Total Trades:       {get('total_trades', 0)}\n"
+                f"  Completed Trades:   {get('completed_trades', 0)}\n"
+                f"  Win Rate:           {get('win_rate', 0)*100:.1f}%\n"
+                f"  Profit Factor:      {get('profit_factor', 0):.2f}\n"
+                f"  Avg Profit:         ${get('avg_profit', 0):.2f}"
+            )
+
+        sections.append(rule)
+
+        return "\n".join(sections)
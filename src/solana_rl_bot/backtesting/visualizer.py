@@ -4,16 +4,37 @@ Visualizer für Backtest-Ergebnisse.
 Erstellt Plots und Tabellen für Performance-Analyse.
 """
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 import numpy as np
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
 from solana_rl_bot.utils import get_logger
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 logger = get_logger(__name__)
-console = Console()
+
+# Performance-Keys in der Reihenfolge, in der sie entpackt werden (Default 0)
+_RESULT_KEYS = (
+    "initial_balance",
+    "final_value",
+    "total_return_pct",
+    "annualized_return_pct",
+    "annualized_volatility",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "max_drawdown_pct",
+    "total_trades",
+    "completed_trades",
+    "win_rate",
+    "profit_factor",
+    "avg_profit",
+    "buy_and_hold_return_pct",
+    "strategy_return_pct",
+    "alpha_pct",
+    "outperformance",
+)
+_SUMMARY_KEYS = ("total_return_pct", "sharpe_ratio", "max_drawdown_pct", "win_rate", "completed_trades")
 
 
 class BacktestVisualizer:
@@ -23,7 +44,17 @@ class BacktestVisualizer:
 
     def __init__(self):
         """Initialisiere Visualizer."""
-        pass
+        # rich wird erst beim ersten Print geladen (Headless-Runs brauchen es nicht)
+        self._console: Optional["Console"] = None
+
+    @property
+    def console(self) -> "Console":
+        """Rich Console, beim ersten Zugriff erstellt."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
 
     def print_results(self, results: Dict, title: str = "Backtest Results"):
         """
@@ -33,49 +64,63 @@ class BacktestVisualizer:
             results: Backtest-Ergebnisse Dictionary
             title: Titel für Output
         """
-        console.print(f"\n[bold cyan]{title}[/bold cyan]")
-        console.print("=" * 60)
-
         # Performance Metrics
         perf = results.get("performance", {})
+        (
+            initial_balance, final_value, total_return_pct, annualized_return_pct,
+            annualized_volatility, sharpe_ratio, sortino_ratio, max_drawdown_pct,
+            total_trades, completed_trades, win_rate, profit_factor, avg_profit,
+            bah_return_pct, strategy_return_pct, alpha_pct, outperformance,
+        ) = (perf.get(key, 0) for key in _RESULT_KEYS)
+
+        lines = [f"\n[bold cyan]{title}[/bold cyan]", "=" * 60]
 
         # Return Metrics
-        console.print("\n[yellow]RETURNS[/yellow]")
-        console.print(f"  Initial Balance:    ${perf.get('initial_balance', 0):.2f}")
-        console.print(f"  Final Value:        ${perf.get('final_value', 0):.2f}")
-        console.print(f"  Total Return:       {perf.get('total_return_pct', 0):+.2f}%")
+        lines.append(
+            f"\n[yellow]RETURNS[/yellow]\n"
+            f"  Initial Balance:    ${initial_balance:.2f}\n"
+            f"  Final Value:        ${final_value:.2f}\n"
+            f"  Total Return:       {total_return_pct:+.2f}%"
+        )
         if "annualized_return_pct" in perf:
-            console.print(f"  Annualized Return:  {perf.get('annualized_return_pct', 0):+.2f}%")
+            lines.append(f"  Annualized Return:  {annualized_return_pct:+.2f}%")
 
         # Risk Metrics
         if "sharpe_ratio" in perf:
-            console.print("\n[yellow]RISK METRICS[/yellow]")
-            console.print(f"  Volatility (Ann.):  {perf.get('annualized_volatility', 0)*100:.2f}%")
-            console.print(f"  Sharpe Ratio:       {perf.get('sharpe_ratio', 0):.3f}")
-            console.print(f"  Sortino Ratio:      {perf.get('sortino_ratio', 0):.3f}")
-            console.print(f"  Max Drawdown:       {perf.get('max_drawdown_pct', 0):.2f}%")
+            lines.append(
+                f"\n[yellow]RISK METRICS[/yellow]\n"
+                f"  Volatility (Ann.):  {annualized_volatility*100:.2f}%\n"
+                f"  Sharpe Ratio:       {sharpe_ratio:.3f}\n"
+                f"  Sortino Ratio:      {sortino_ratio:.3f}\n"
+                f"  Max Drawdown:       {max_drawdown_pct:.2f}%"
+            )
 
         # Trading Metrics
         if "total_trades" in perf:
-            console.print("\n[yellow]TRADING[/yellow]")
-            console.print(f"  Total Trades:       {perf.get('total_trades', 0)}")
-            console.print(f"  Completed Trades:   {perf.get('completed_trades', 0)}")
-            console.print(f"  Win Rate:           {perf.get('win_rate', 0)*100:.1f}%")
-            console.print(f"  Profit Factor:      {perf.get('profit_factor', 0):.2f}")
-            console.print(f"  Avg Profit:         ${perf.get('avg_profit', 0):.2f}")
+            lines.append(
+                f"\n[yellow]TRADING[/yellow]\n"
+                f"  Total Trades:       {total_trades}\n"
+                f"  Completed Trades:   {completed_trades}\n"
+                f"  Win Rate:           {win_rate*100:.1f}%\n"
+                f"  Profit Factor:      {profit_factor:.2f}\n"
+                f"  Avg Profit:         ${avg_profit:.2f}"
+            )
 
         # Buy-and-Hold Comparison
         if "buy_and_hold_return" in perf:
-            console.print("\n[yellow]VS BUY-AND-HOLD[/yellow]")
-            console.print(f"  B&H Return:         {perf.get('buy_and_hold_return_pct', 0):+.2f}%")
-            console.print(f"  Strategy Return:    {perf.get('strategy_return_pct', 0):+.2f}%")
-            console.print(f"  Alpha:              {perf.get('alpha_pct', 0):+.2f}%")
-            
-            outperformance = perf.get('outperformance', False)
             status = "[green]✅ Outperform[/green]" if outperformance else "[red]❌ Underperform[/red]"
-            console.print(f"  Status:             {status}")
+            lines.append(
+                f"\n[yellow]VS BUY-AND-HOLD[/yellow]\n"
+                f"  B&H Return:         {bah_return_pct:+.2f}%\n"
+                f"  Strategy Return:    {strategy_return_pct:+.2f}%\n"
+                f"  Alpha:              {alpha_pct:+.2f}%\n"
+                f"  Status:             {status}"
+            )
+
+        lines.append("=" * 60)
 
-        console.print("=" * 60)
+        # Ein console.print statt einem pro Zeile
+        self.console.print("\n".join(lines))
 
     def print_comparison_table(self, results_list: List[Dict], labels: List[str]):
         """
@@ -85,6 +130,8 @@ class BacktestVisualizer:
             results_list: Liste von Backtest-Ergebnissen
             labels: Labels für jedes Result
         """
+        from rich.table import Table
+
         table = Table(title="Backtest Comparison")
 
         table.add_column("Metric", style="cyan")
@@ -101,28 +148,23 @@ class BacktestVisualizer:
             ("Profit Factor", "profit_factor", ""),
         ]
 
+        perfs = [results.get("performance", {}) for results in results_list]
+
         for metric_name, metric_key, suffix in metrics:
-            row = [metric_name]
-            
-            for results in results_list:
-                perf = results.get("performance", {})
-                value = perf.get(metric_key, 0)
-                
-                if metric_key == "win_rate":
-                    value *= 100  # Convert to percentage
-                
-                if suffix == "%":
-                    formatted = f"{value:+.2f}%"
-                elif suffix == "":
-                    formatted = f"{value:.2f}"
-                else:
-                    formatted = f"{value:.2f}{suffix}"
-                
-                row.append(formatted)
-            
-            table.add_row(*row)
+            # Alle Spalten einer Zeile auf einmal formatieren
+            values = np.array([perf.get(metric_key, 0) for perf in perfs], dtype=np.float64)
+
+            if metric_key == "win_rate":
+                values *= 100  # Convert to percentage
+
+            if suffix == "%":
+                formatted = np.char.mod("%+.2f%%", values)
+            else:
+                formatted = np.char.mod(f"%.2f{suffix}", values)
 
-        console.print(table)
+            table.add_row(metric_name, *formatted.tolist())
+
+        self.console.print(table)
 
     def print_walk_forward_results(self, wf_results: List[Dict]):
         """
@@ -131,8 +173,10 @@ class BacktestVisualizer:
         Args:
             wf_results: Liste von Walk-Forward Test-Ergebnissen
         """
-        console.print("\n[bold cyan]Walk-Forward Analysis Results[/bold cyan]")
-        console.print("=" * 60)
+        from rich.table import Table
+
+        self.console.print("\n[bold cyan]Walk-Forward Analysis Results[/bold cyan]")
+        self.console.print("=" * 60)
 
         table = Table(title="Walk-Forward Windows")
         table.add_column("Window", style="cyan")
@@ -142,34 +186,49 @@ class BacktestVisualizer:
         table.add_column("Max DD", style="red")
         table.add_column("Trades", style="blue")
 
+        # Ein Durchlauf über die Windows, danach Formatierung und Stats auf Arrays
+        n_windows = len(wf_results)
+        test_ranges = []
+        returns = np.empty(n_windows, dtype=np.float64)
+        returns_pct = np.empty(n_windows, dtype=np.float64)
+        sharpes = np.empty(n_windows, dtype=np.float64)
+        max_dds = np.empty(n_windows, dtype=np.float64)
+        trades = np.empty(n_windows, dtype=np.int64)
+
         for i, result in enumerate(wf_results):
             window_info = result.get("window", {})
             perf = result.get("performance", {})
 
-            test_range = f"[{window_info['test_start']}:{window_info['test_end']}]"
-            
-            table.add_row(
-                f"#{i+1}",
-                test_range,
-                f"{perf.get('total_return_pct', 0):+.2f}%",
-                f"{perf.get('sharpe_ratio', 0):.2f}",
-                f"{perf.get('max_drawdown_pct', 0):.2f}%",
-                str(perf.get('completed_trades', 0)),
-            )
+            test_ranges.append(f"[{window_info['test_start']}:{window_info['test_end']}]")
+            returns[i] = perf["total_return"]
+            returns_pct[i] = perf.get("total_return_pct", 0)
+            sharpes[i] = perf.get("sharpe_ratio", 0)
+            max_dds[i] = perf.get("max_drawdown_pct", 0)
+            trades[i] = perf.get("completed_trades", 0)
+
+        rows = zip(
+            [f"#{i+1}" for i in range(n_windows)],
+            test_ranges,
+            np.char.mod("%+.2f%%", returns_pct).tolist(),
+            np.char.mod("%.2f", sharpes).tolist(),
+            np.char.mod("%.2f%%", max_dds).tolist(),
+            np.char.mod("%d", trades).tolist(),
+        )
+        for row in rows:
+            table.add_row(*row)
 
-        console.print(table)
+        self.console.print(table)
 
         # Aggregierte Stats
-        returns = [r["performance"]["total_return"] for r in wf_results]
-        sharpes = [r["performance"].get("sharpe_ratio", 0) for r in wf_results]
-
-        console.print(f"\n[yellow]Aggregated Statistics[/yellow]")
-        console.print(f"  Windows:            {len(wf_results)}")
-        console.print(f"  Avg Return:         {np.mean(returns)*100:+.2f}% ± {np.std(returns)*100:.2f}%")
-        console.print(f"  Best Return:        {max(returns)*100:+.2f}%")
-        console.print(f"  Worst Return:       {min(returns)*100:+.2f}%")
-        console.print(f"  Avg Sharpe:         {np.mean(sharpes):.3f}")
-        console.print(f"  Win Rate (>0):      {sum(1 for r in returns if r > 0) / len(returns) * 100:.1f}%")
+        self.console.print(
+            f"\n[yellow]Aggregated Statistics[/yellow]\n"
+            f"  Windows:            {n_windows}\n"
+            f"  Avg Return:         {returns.mean()*100:+.2f}% ± {returns.std()*100:.2f}%\n"
+            f"  Best Return:        {returns.max()*100:+.2f}%\n"
+            f"  Worst Return:       {returns.min()*100:+.2f}%\n"
+            f"  Avg Sharpe:         {sharpes.mean():.3f}\n"
+            f"  Win Rate (>0):      {np.count_nonzero(returns > 0) / n_windows * 100:.1f}%"
+        )
 
     def print_summary_panel(self, results: Dict):
         """
@@ -179,22 +238,27 @@ class BacktestVisualizer:
             results: Backtest-Ergebnisse
         """
         perf = results.get("performance", {})
+        total_return_pct, sharpe_ratio, max_drawdown_pct, win_rate, completed_trades = (
+            perf.get(key, 0) for key in _SUMMARY_KEYS
+        )
 
         summary_text = f"""
-[bold]Return:[/bold] {perf.get('total_return_pct', 0):+.2f}%
-[bold]Sharpe:[/bold] {perf.get('sharpe_ratio', 0):.3f}
-[bold]Max DD:[/bold] {perf.get('max_drawdown_pct', 0):.2f}%
-[bold]Win Rate:[/bold] {perf.get('win_rate', 0)*100:.1f}%
-[bold]Trades:[/bold] {perf.get('completed_trades', 0)}
+[bold]Return:[/bold] {total_return_pct:+.2f}%
+[bold]Sharpe:[/bold] {sharpe_ratio:.3f}
+[bold]Max DD:[/bold] {max_drawdown_pct:.2f}%
+[bold]Win Rate:[/bold] {win_rate*100:.1f}%
+[bold]Trades:[/bold] {completed_trades}
 """
 
+        from rich.panel import Panel
+
         panel = Panel(
             summary_text.strip(),
             title="[bold cyan]Backtest Summary[/bold cyan]",
             border_style="cyan",
         )
 
-        console.print(panel)
+        self.console.print(panel)
 
     def print_trade_log(self, trades: List[Dict], limit: int = 10):
         """
@@ -204,7 +268,9 @@ class BacktestVisualizer:
             trades: Liste von Trades
             limit: Max Anzahl zu zeigen
         """
-        console.print(f"\n[bold cyan]Trade Log (Last {limit})[/bold cyan]")
+        from rich.table import Table
+
+        self.console.print(f"\n[bold cyan]Trade Log (Last {limit})[/bold cyan]")
 
         table = Table()
         table.add_column("Step", style="cyan")
@@ -250,4 +316,4 @@ class BacktestVisualizer:
                     profit_pct_str,
                 )
 
-        console.print(table)
+        self.console.print(table)
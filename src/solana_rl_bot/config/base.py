@@ -2,9 +2,23 @@
 Base configuration classes using Pydantic v2.
 """
 
-from typing import Any, Dict
+from enum import Enum
+from typing import Any, Dict, Union, get_args, get_origin
 from pydantic import BaseModel, ConfigDict
 
+# Feldtypen, die model_dump unverändert zurückgibt
+_SCALAR_TYPES = (str, int, float, bool, Enum, type(None))
+
+# Config-Klasse -> nur skalare Felder (to_dict ohne model_dump)
+_LEAF_CONFIGS: Dict[type, bool] = {}
+
+
+def _is_scalar_annotation(annotation: Any) -> bool:
+    """Prüfe, ob ein Feldtyp (ggf. Optional/Union) nur skalare Typen zulässt."""
+    if get_origin(annotation) is Union:
+        return all(_is_scalar_annotation(arg) for arg in get_args(annotation))
+    return isinstance(annotation, type) and issubclass(annotation, _SCALAR_TYPES)
+
 
 class BaseConfig(BaseModel):
     """Base configuration class with Pydantic v2 settings."""
@@ -21,8 +35,24 @@ class BaseConfig(BaseModel):
     )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert config to dictionary."""
-        return self.model_dump(exclude_none=True)
+        """
+        Convert config to dictionary.
+
+        Leaf configs (only scalar fields) are copied straight from the
+        instance dict; nested models, lists and dicts go through model_dump.
+        """
+        cls = type(self)
+        is_leaf = _LEAF_CONFIGS.get(cls)
+        if is_leaf is None:
+            is_leaf = all(
+                _is_scalar_annotation(field.annotation) for field in cls.model_fields.values()
+            )
+            _LEAF_CONFIGS[cls] = is_leaf
+
+        if not is_leaf:
+            return self.model_dump(exclude_none=True)
+
+        return {name: value for name, value in self.__dict__.items() if value is not None}
 
     def to_json(self) -> str:
         """Convert config to JSON string."""
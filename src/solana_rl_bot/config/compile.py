@@ -0,0 +1,40 @@
+"""
+Precompile YAML configs for fast startup.
+
+Usage:
+    python -m solana_rl_bot.config.compile                 # config/production.yaml
+    python -m solana_rl_bot.config.compile paper production
+
+Writes config/{environment}.marshal next to each YAML file. load_config
+uses it as long as the YAML content is unchanged.
+"""
+
+import argparse
+from pathlib import Path
+
+from solana_rl_bot.config.loader import _find_project_root, compile_yaml_config
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompile YAML configs")
+    parser.add_argument(
+        "environments",
+        nargs="*",
+        default=["production"],
+        help="Environments to compile (default: production)",
+    )
+    parser.add_argument(
+        "--config-dir",
+        type=Path,
+        default=None,
+        help="Config directory (default: project_root/config)",
+    )
+    args = parser.parse_args()
+
+    config_dir = args.config_dir or _find_project_root() / "config"
+    for environment in args.environments:
+        compile_yaml_config(config_dir / f"{environment}.yaml")
+
+
+if __name__ == "__main__":
+    main()
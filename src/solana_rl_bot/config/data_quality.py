@@ -2,14 +2,30 @@
 Data quality monitoring and validation configuration.
 """
 
-from typing import List, Optional
+from types import MappingProxyType
+from typing import ClassVar, Dict, FrozenSet, List, Optional
 from pydantic import Field, field_validator
 from solana_rl_bot.config.base import BaseConfig
 
+# Shared read-only default; each ValidationConfig gets its own dict copy
+_DEFAULT_FEATURE_BOUNDS = MappingProxyType(
+    {
+        "rsi_14": (0, 100),
+        "stoch_k": (0, 100),
+        "stoch_d": (0, 100),
+        "cci": (-500, 500),
+        "adx": (0, 100),
+    }
+)
+
 
 class OutlierDetectionConfig(BaseConfig):
     """Outlier detection configuration."""
 
+    # Allowed values for method / handle_outliers
+    _VALID_METHODS: ClassVar[FrozenSet[str]] = frozenset({"zscore", "iqr", "isolation_forest"})
+    _VALID_HANDLING: ClassVar[FrozenSet[str]] = frozenset({"clip", "remove", "flag"})
+
     enabled: bool = Field(
         default=True,
         description="Enable outlier detection",
@@ -39,24 +55,29 @@ class OutlierDetectionConfig(BaseConfig):
     @classmethod
     def validate_method(cls, v: str) -> str:
         """Validate outlier detection method."""
-        valid_methods = ["zscore", "iqr", "isolation_forest"]
-        if v.lower() not in valid_methods:
-            raise ValueError(f"Method must be one of {valid_methods}")
-        return v.lower()
+        method = v.lower()
+        if method not in cls._VALID_METHODS:
+            raise ValueError(f"Method must be one of {sorted(cls._VALID_METHODS)}")
+        return method
 
     @field_validator("handle_outliers")
     @classmethod
     def validate_handle_outliers(cls, v: str) -> str:
         """Validate outlier handling method."""
-        valid_methods = ["clip", "remove", "flag"]
-        if v.lower() not in valid_methods:
-            raise ValueError(f"Handle method must be one of {valid_methods}")
-        return v.lower()
+        method = v.lower()
+        if method not in cls._VALID_HANDLING:
+            raise ValueError(f"Handle method must be one of {sorted(cls._VALID_HANDLING)}")
+        return method
 
 
 class MissingDataConfig(BaseConfig):
     """Missing data handling configuration."""
 
+    # Allowed values for handle_missing
+    _VALID_HANDLING: ClassVar[FrozenSet[str]] = frozenset(
+        {"forward_fill", "backward_fill", "interpolate", "drop", "zero"}
+    )
+
     enabled: bool = Field(
         default=True,
         description="Enable missing data checks",
@@ -82,10 +103,10 @@ class MissingDataConfig(BaseConfig):
     @classmethod
     def validate_handle_missing(cls, v: str) -> str:
         """Validate missing data handling method."""
-        valid_methods = ["forward_fill", "backward_fill", "interpolate", "drop", "zero"]
-        if v.lower() not in valid_methods:
-            raise ValueError(f"Handle method must be one of {valid_methods}")
-        return v.lower()
+        method = v.lower()
+        if method not in cls._VALID_HANDLING:
+            raise ValueError(f"Handle method must be one of {sorted(cls._VALID_HANDLING)}")
+        return method
 
 
 class ValidationConfig(BaseConfig):
@@ -123,13 +144,7 @@ class ValidationConfig(BaseConfig):
         description="Validate technical indicators are within expected ranges",
     )
     feature_bounds: dict = Field(
-        default_factory=lambda: {
-            "rsi_14": (0, 100),
-            "stoch_k": (0, 100),
-            "stoch_d": (0, 100),
-            "cci": (-500, 500),
-            "adx": (0, 100),
-        },
+        default_factory=_DEFAULT_FEATURE_BOUNDS.copy,
         description="Expected bounds for features {feature_name: (min, max)}",
     )
 
@@ -137,6 +152,20 @@ class ValidationConfig(BaseConfig):
 class DataQualityConfig(BaseConfig):
     """Data quality monitoring configuration."""
 
+    # Allowed values for alert_methods
+    _VALID_ALERT_METHODS: ClassVar[FrozenSet[str]] = frozenset(
+        {"log", "database", "email", "slack", "webhook"}
+    )
+
+    # Severity level -> rank for should_alert
+    _SEVERITY_RANK: ClassVar[Dict[str, int]] = {
+        "debug": 0,
+        "info": 1,
+        "warning": 2,
+        "error": 3,
+        "critical": 4,
+    }
+
     # Enable/disable monitoring
     enabled: bool = Field(
         default=True,
@@ -195,20 +224,19 @@ class DataQualityConfig(BaseConfig):
     @classmethod
     def validate_alert_methods(cls, v: List[str]) -> List[str]:
         """Validate alert methods."""
-        valid_methods = ["log", "database", "email", "slack", "webhook"]
-        for method in v:
-            if method.lower() not in valid_methods:
-                raise ValueError(f"Alert method must be one of {valid_methods}")
-        return [m.lower() for m in v]
+        methods = [m.lower() for m in v]
+        if not set(methods).issubset(cls._VALID_ALERT_METHODS):
+            raise ValueError(f"Alert method must be one of {sorted(cls._VALID_ALERT_METHODS)}")
+        return methods
 
     @field_validator("min_severity_for_alert")
     @classmethod
     def validate_severity(cls, v: str) -> str:
         """Validate severity level."""
-        valid_levels = ["debug", "info", "warning", "error", "critical"]
-        if v.lower() not in valid_levels:
-            raise ValueError(f"Severity must be one of {valid_levels}")
-        return v.lower()
+        level = v.lower()
+        if level not in cls._SEVERITY_RANK:
+            raise ValueError(f"Severity must be one of {list(cls._SEVERITY_RANK)}")
+        return level
 
     def should_alert(self, severity: str) -> bool:
         """Check if alert should be sent for given severity.
@@ -219,7 +247,8 @@ class DataQualityConfig(BaseConfig):
         Returns:
             True if alert should be sent
         """
-        severity_order = ["debug", "info", "warning", "error", "critical"]
-        min_index = severity_order.index(self.min_severity_for_alert)
-        severity_index = severity_order.index(severity.lower())
-        return severity_index >= min_index
+        rank = self._SEVERITY_RANK
+        try:
+            return rank[severity.lower()] >= rank[self.min_severity_for_alert]
+        except KeyError:
+            raise ValueError(f"Unknown severity: {severity}") from None
@@ -3,7 +3,7 @@ Database configuration for TimescaleDB.
 """
 
 import os
-from typing import Optional
+from typing import ClassVar, FrozenSet, Mapping, Optional
 from pydantic import Field, field_validator
 from solana_rl_bot.config.base import BaseConfig
 
@@ -15,6 +15,11 @@ class DatabaseConfig(BaseConfig):
     Settings (pool sizes, timeouts) come from YAML config.
     """
 
+    # Valid PostgreSQL sslmode values
+    _VALID_SSL_MODES: ClassVar[FrozenSet[str]] = frozenset(
+        {"disable", "allow", "prefer", "require", "verify-ca", "verify-full"}
+    )
+
     # Connection settings (from .env)
     host: str = Field(
         default="localhost",
@@ -89,9 +94,8 @@ class DatabaseConfig(BaseConfig):
     @classmethod
     def validate_ssl_mode(cls, v: str) -> str:
         """Validate SSL mode."""
-        valid_modes = ["disable", "allow", "prefer", "require", "verify-ca", "verify-full"]
-        if v not in valid_modes:
-            raise ValueError(f"ssl_mode must be one of {valid_modes}")
+        if v not in cls._VALID_SSL_MODES:
+            raise ValueError(f"ssl_mode must be one of {sorted(cls._VALID_SSL_MODES)}")
         return v
 
     @field_validator("pool_size", "max_overflow")
@@ -118,26 +122,31 @@ class DatabaseConfig(BaseConfig):
         )
 
     @classmethod
-    def from_env(cls, yaml_config: Optional[dict] = None) -> "DatabaseConfig":
+    def from_env(
+        cls, yaml_config: Optional[dict] = None, env: Optional[Mapping[str, str]] = None
+    ) -> "DatabaseConfig":
         """Create config from environment variables and optional YAML config.
 
         Priority: Environment variables > YAML config > defaults
 
         Args:
             yaml_config: Optional YAML configuration dictionary
+            env: Environment snapshot (default: os.environ)
 
         Returns:
             DatabaseConfig instance
         """
         config_dict = yaml_config or {}
+        if env is None:
+            env = os.environ
 
         # Override with environment variables (secrets)
         env_overrides = {
-            "host": os.getenv("TIMESCALE_HOST"),
-            "port": os.getenv("TIMESCALE_PORT"),
-            "database": os.getenv("TIMESCALE_DB"),
-            "user": os.getenv("TIMESCALE_USER"),
-            "password": os.getenv("TIMESCALE_PASSWORD"),
+            "host": env.get("TIMESCALE_HOST"),
+            "port": env.get("TIMESCALE_PORT"),
+            "database": env.get("TIMESCALE_DB"),
+            "user": env.get("TIMESCALE_USER"),
+            "password": env.get("TIMESCALE_PASSWORD"),
         }
 
         # Merge: Start with YAML, override with env vars
@@ -3,7 +3,7 @@ Exchange configuration for cryptocurrency exchanges.
 """
 
 import os
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, FrozenSet, List, Mapping, Optional
 from pydantic import Field, field_validator
 from solana_rl_bot.config.base import BaseConfig
 
@@ -38,6 +38,10 @@ class ExchangeConfig(BaseConfig):
     Exchange settings come from YAML config.
     """
 
+    _SUPPORTED_EXCHANGES: ClassVar[FrozenSet[str]] = frozenset(
+        {"binance", "coinbase", "kraken", "bybit", "okx"}
+    )
+
     # Exchange identification
     name: str = Field(
         default="binance",
@@ -124,10 +128,10 @@ class ExchangeConfig(BaseConfig):
     @classmethod
     def validate_exchange_name(cls, v: str) -> str:
         """Validate exchange name."""
-        supported = ["binance", "coinbase", "kraken", "bybit", "okx"]
-        if v.lower() not in supported:
-            raise ValueError(f"Exchange must be one of {supported}")
-        return v.lower()
+        name = v.lower()
+        if name not in cls._SUPPORTED_EXCHANGES:
+            raise ValueError(f"Exchange must be one of {sorted(cls._SUPPORTED_EXCHANGES)}")
+        return name
 
     @field_validator("default_timeframe")
     @classmethod
@@ -149,33 +153,40 @@ class ExchangeConfig(BaseConfig):
         return v
 
     @classmethod
-    def from_env(cls, yaml_config: Optional[dict] = None) -> "ExchangeConfig":
+    def from_env(
+        cls, yaml_config: Optional[dict] = None, env: Optional[Mapping[str, str]] = None
+    ) -> "ExchangeConfig":
         """Create config from environment variables and optional YAML config.
 
         Priority: Environment variables > YAML config > defaults
 
         Args:
             yaml_config: Optional YAML configuration dictionary
+            env: Environment snapshot (default: os.environ)
 
         Returns:
             ExchangeConfig instance
         """
         config_dict = yaml_config or {}
+        if env is None:
+            env = os.environ
 
         # Get exchange name from YAML or default
         exchange_name = config_dict.get("name", "binance").upper()
 
-        # Override with environment variables (API keys)
-        env_overrides = {
-            "api_key": os.getenv(f"{exchange_name}_API_KEY"),
-            "api_secret": os.getenv(f"{exchange_name}_API_SECRET"),
-            "testnet": os.getenv(f"{exchange_name}_TESTNET", "").lower() == "true",
-        }
+        # Override with environment variables (API keys), only if set
+        api_key = env.get(f"{exchange_name}_API_KEY")
+        if api_key is not None:
+            config_dict["api_key"] = api_key
+
+        api_secret = env.get(f"{exchange_name}_API_SECRET")
+        if api_secret is not None:
+            config_dict["api_secret"] = api_secret
 
-        # Merge: Start with YAML, override with env vars
-        for key, value in env_overrides.items():
-            if value is not None:
-                config_dict[key] = value
+        # Unset {NAME}_TESTNET keeps the YAML value
+        testnet = env.get(f"{exchange_name}_TESTNET")
+        if testnet is not None:
+            config_dict["testnet"] = testnet.lower() == "true"
 
         return cls(**config_dict)
 
@@ -185,9 +196,10 @@ class ExchangeConfig(BaseConfig):
         Returns:
             Dictionary with API keys masked
         """
-        config = self.to_dict()
-        if config.get("api_key"):
-            config["api_key"] = "***" + config["api_key"][-4:]
-        if config.get("api_secret"):
-            config["api_secret"] = "***"
+        # Secrets are never serialized, only their masked form is added
+        config = self.model_dump(exclude_none=True, exclude={"api_key", "api_secret"})
+        if self.api_key is not None:
+            config["api_key"] = "***" + self.api_key[-4:] if self.api_key else ""
+        if self.api_secret is not None:
+            config["api_secret"] = "***" if self.api_secret else ""
         return config
@@ -7,13 +7,23 @@ This module provides centralized configuration loading from:
 - Pydantic validation for type safety
 """
 
+import copy
+import functools
+import hashlib
+import marshal
 import os
+from itertools import chain
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping, Tuple
 import yaml
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from solana_rl_bot.config.base import BaseConfig
 from solana_rl_bot.config.database import DatabaseConfig
 from solana_rl_bot.config.exchange import ExchangeConfig
@@ -70,31 +80,125 @@ class BotConfig(BaseConfig):
 def _find_project_root() -> Path:
     """Find project root directory (contains .env file).
 
+    The search is cached per working directory, see _search_project_root.
+
     Returns:
         Path to project root
 
     Raises:
         FileNotFoundError: If project root cannot be found
     """
-    current = Path.cwd()
+    return _search_project_root(Path.cwd())
 
+
+@functools.lru_cache(maxsize=1)
+def _search_project_root(current: Path) -> Path:
+    """Walk up from current to the first directory with .env or pyproject.toml."""
     # Try current directory and parents
-    for path in [current] + list(current.parents):
+    for path in chain((current,), current.parents):
         if (path / ".env").exists() or (path / ".env.template").exists():
             return path
         if (path / "pyproject.toml").exists():
             return path
 
     # Fallback to current directory
-    logger.warning(f"Could not find project root, using current directory: {current}")
+    logger.warning("Could not find project root, using current directory: {}", current)
     return current
 
 
-def _load_yaml_config(config_path: Path) -> Dict[str, Any]:
+# Parsed YAML configs keyed by (path, mtime_ns, size)
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _yaml_digest(data: bytes) -> bytes:
+    """Hash of the raw YAML bytes (identifies a precompiled config)."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _compiled_path(config_path: Path) -> Path:
+    """Path of the precompiled config next to config_path."""
+    return config_path.with_suffix(".marshal")
+
+
+def compile_yaml_config(config_path: Path) -> Path:
+    """Parse a YAML config once and store it in marshal format next to the file.
+
+    The file holds only the parsed YAML plus a hash of its source;
+    env overrides and validation still run in load_config, so no
+    secrets from .env end up on disk. Unlike pickle, loading it
+    cannot execute code.
+
+    Args:
+        config_path: Path to YAML config file
+
+    Returns:
+        Path of the written .marshal file
+
+    Raises:
+        ValueError: If the YAML contains values marshal cannot store
+            (e.g. dates)
+    """
+    data = config_path.read_bytes()
+    config = yaml.load(data, Loader=_YamlLoader)
+
+    compiled_path = _compiled_path(config_path)
+    compiled_path.write_bytes(
+        marshal.dumps({"source_digest": _yaml_digest(data), "config": config or {}})
+    )
+
+    logger.info("Compiled config {} -> {}", config_path, compiled_path)
+    return compiled_path
+
+
+def _load_precompiled(
+    config_path: Path, data: bytes, env: Mapping[str, str]
+) -> Optional[Dict[str, Any]]:
+    """Load the precompiled config for config_path if it matches data.
+
+    Args:
+        config_path: Path to YAML config file
+        data: Raw bytes of the YAML file
+        env: Environment snapshot (CONFIG_USE_PRECOMPILED=0 disables)
+
+    Returns:
+        Parsed config, or None if there is no up-to-date, readable
+        .marshal file
+    """
+    if env.get("CONFIG_USE_PRECOMPILED", "1") != "1":
+        return None
+
+    compiled_path = _compiled_path(config_path)
+    try:
+        compiled = marshal.loads(compiled_path.read_bytes())
+        digest = compiled["source_digest"]
+        config = compiled["config"]
+    except FileNotFoundError:
+        return None
+    except (EOFError, ValueError, TypeError, KeyError) as e:
+        logger.warning("Ignoring unreadable precompiled config {}: {}", compiled_path, e)
+        return None
+
+    if digest != _yaml_digest(data):
+        logger.warning("Ignoring stale precompiled config: {}", compiled_path)
+        return None
+
+    logger.info("Loaded precompiled config from: {}", compiled_path)
+    return config
+
+
+def _load_yaml_config(
+    config_path: Path, env: Optional[Mapping[str, str]] = None
+) -> Dict[str, Any]:
     """Load YAML configuration file.
 
+    Parsed files are cached by path, mtime and size; a modified file is
+    parsed again. Callers always get a fresh copy they may mutate. A
+    matching .marshal file from compile_yaml_config replaces the YAML
+    parse (disable with CONFIG_USE_PRECOMPILED=0).
+
     Args:
         config_path: Path to YAML config file
+        env: Environment snapshot (default: os.environ)
 
     Returns:
         Configuration dictionary
@@ -103,18 +207,33 @@ def _load_yaml_config(config_path: Path) -> Dict[str, Any]:
         FileNotFoundError: If config file not found
         yaml.YAMLError: If YAML parsing fails
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    key = (str(config_path), st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None:
+        logger.debug("Using cached config: {}", config_path)
+        return copy.deepcopy(cached)
 
+    # libyaml decodes UTF-8 itself, no text-mode pass needed
+    with open(config_path, "rb") as f:
+        data = f.read()
+
+    config = _load_precompiled(config_path, data, os.environ if env is None else env)
     if config is None:
-        logger.warning(f"Empty config file: {config_path}")
-        return {}
+        config = yaml.load(data, Loader=_YamlLoader)
 
-    logger.info(f"Loaded config from: {config_path}")
-    return config
+        if config is None:
+            logger.warning("Empty config file: {}", config_path)
+            config = {}
+        else:
+            logger.info("Loaded config from: {}", config_path)
+
+    _YAML_CACHE[key] = config
+    return copy.deepcopy(config)
 
 
 def _load_env_file(env_path: Optional[Path] = None) -> None:
@@ -129,9 +248,46 @@ def _load_env_file(env_path: Optional[Path] = None) -> None:
 
     if env_path.exists():
         load_dotenv(env_path, override=True)
-        logger.info(f"Loaded environment variables from: {env_path}")
+        logger.info("Loaded environment variables from: {}", env_path)
     else:
-        logger.warning(f".env file not found: {env_path}")
+        logger.warning(".env file not found: {}", env_path)
+
+
+# Environment variables read by load_config and the from_env constructors
+_ENV_PREFIXES = ("TIMESCALE_",)
+_ENV_SUFFIXES = ("_API_KEY", "_API_SECRET", "_TESTNET")
+_ENV_NAMES = ("LOG_LEVEL",)
+
+# Validated configs keyed by _config_fingerprint
+_BOTCONFIG_CACHE: Dict[bytes, BotConfig] = {}
+
+
+def _config_fingerprint(
+    config_path: Path, environment: str, env: Mapping[str, str]
+) -> bytes:
+    """Hash YAML content, environment name and relevant env vars.
+
+    Args:
+        config_path: Path to YAML config file (may not exist)
+        environment: Environment name
+        env: Environment snapshot
+
+    Returns:
+        Digest identifying all inputs of load_config
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{config_path}\0{environment}\0".encode())
+
+    try:
+        h.update(config_path.read_bytes())
+    except FileNotFoundError:
+        h.update(b"\0missing")
+
+    for key, value in sorted(env.items()):
+        if key in _ENV_NAMES or key.startswith(_ENV_PREFIXES) or key.endswith(_ENV_SUFFIXES):
+            h.update(f"\0{key}={value}".encode())
+
+    return h.digest()
 
 
 def load_config(
@@ -152,7 +308,8 @@ def load_config(
         env_file: Path to .env file (default: project_root/.env)
 
     Returns:
-        Complete bot configuration
+        Complete bot configuration. Repeated calls with unchanged YAML
+        and environment return a copy of the cached, validated config.
 
     Example:
         >>> config = load_config()  # Uses config/development.yaml
@@ -165,9 +322,12 @@ def load_config(
     else:
         _load_env_file()
 
+    # One snapshot for all env lookups below
+    env = os.environ.copy()
+
     # Determine environment
     if environment is None:
-        environment = os.getenv("ENVIRONMENT", "development")
+        environment = env.get("ENVIRONMENT", "development")
 
     # Determine config path
     if config_path is None:
@@ -175,25 +335,41 @@ def load_config(
         config_dir = project_root / "config"
         config_path = str(config_dir / f"{environment}.yaml")
 
+    fingerprint = _config_fingerprint(Path(config_path), environment, env)
+    cached = _BOTCONFIG_CACHE.get(fingerprint)
+    if cached is not None:
+        logger.debug("Using cached configuration for environment: {}", environment)
+        return cached.model_copy(deep=True)
+
     # Load YAML config
     try:
-        yaml_config = _load_yaml_config(Path(config_path))
+        yaml_config = _load_yaml_config(Path(config_path), env)
     except FileNotFoundError:
-        logger.warning(f"Config file not found: {config_path}, using defaults")
+        logger.warning("Config file not found: {}, using defaults", config_path)
         yaml_config = {}
 
+    # Split the YAML config into its sections once
+    database_yaml = yaml_config.pop("database", {})
+    exchange_yaml = yaml_config.pop("exchange", {})
+    trading_yaml = yaml_config.pop("trading", {})
+    data_quality_yaml = yaml_config.pop("data_quality", {})
+    log_level = yaml_config.pop("log_level", "INFO")
+    log_to_file = yaml_config.pop("log_to_file", True)
+    log_file_path = yaml_config.pop("log_file_path", None)
+
+    if yaml_config:
+        logger.warning("Ignoring unknown config keys in {}: {}", config_path, sorted(yaml_config))
+
     # Create sub-configs with env override
-    database_config = DatabaseConfig.from_env(yaml_config.get("database", {}))
-    exchange_config = ExchangeConfig.from_env(yaml_config.get("exchange", {}))
+    database_config = DatabaseConfig.from_env(database_yaml, env)
+    exchange_config = ExchangeConfig.from_env(exchange_yaml, env)
 
     # Trading and data quality configs (no env override needed)
-    trading_config = TradingConfig(**yaml_config.get("trading", {}))
-    data_quality_config = DataQualityConfig(**yaml_config.get("data_quality", {}))
+    trading_config = TradingConfig(**trading_yaml)
+    data_quality_config = DataQualityConfig(**data_quality_yaml)
 
     # Logging settings
-    log_level = os.getenv("LOG_LEVEL", yaml_config.get("log_level", "INFO"))
-    log_to_file = yaml_config.get("log_to_file", True)
-    log_file_path = yaml_config.get("log_file_path")
+    log_level = env.get("LOG_LEVEL", log_level)
 
     # Create main config
     config = BotConfig(
@@ -207,12 +383,13 @@ def load_config(
         log_file_path=log_file_path,
     )
 
-    logger.info(f"Configuration loaded for environment: {environment}")
-    logger.debug(f"Trading mode: {config.trading.mode}")
-    logger.debug(f"Exchange: {config.exchange.name}")
-    logger.debug(f"Database: {config.database.database}@{config.database.host}")
+    logger.info("Configuration loaded for environment: {}", environment)
+    logger.debug("Trading mode: {}", config.trading.mode)
+    logger.debug("Exchange: {}", config.exchange.name)
+    logger.debug("Database: {}@{}", config.database.database, config.database.host)
 
-    return config
+    _BOTCONFIG_CACHE[fingerprint] = config
+    return config.model_copy(deep=True)
 
 
 # Global config instance (can be set once and accessed everywhere)
@@ -260,4 +437,5 @@ def reset_config() -> None:
     """Reset global configuration (useful for testing)."""
     global _global_config
     _global_config = None
+    _search_project_root.cache_clear()
     logger.debug("Global configuration reset")
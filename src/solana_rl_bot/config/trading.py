@@ -2,7 +2,7 @@
 Trading configuration for risk management and execution.
 """
 
-from typing import Optional
+from typing import ClassVar, FrozenSet, Optional
 from enum import Enum
 from pydantic import Field, field_validator
 from solana_rl_bot.config.base import BaseConfig
@@ -104,6 +104,10 @@ class RiskManagementConfig(BaseConfig):
 class ExecutionConfig(BaseConfig):
     """Order execution configuration."""
 
+    _VALID_ORDER_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {"market", "limit", "stop_market", "stop_limit"}
+    )
+
     # Order types
     default_order_type: str = Field(
         default="market",
@@ -154,10 +158,10 @@ class ExecutionConfig(BaseConfig):
     @classmethod
     def validate_order_type(cls, v: str) -> str:
         """Validate order type."""
-        valid_types = ["market", "limit", "stop_market", "stop_limit"]
-        if v.lower() not in valid_types:
-            raise ValueError(f"Order type must be one of {valid_types}")
-        return v.lower()
+        order_type = v.lower()
+        if order_type not in cls._VALID_ORDER_TYPES:
+            raise ValueError(f"Order type must be one of {sorted(cls._VALID_ORDER_TYPES)}")
+        return order_type
 
 
 class TradingConfig(BaseConfig):
@@ -0,0 +1,11 @@
+"""
+Data Processors Module
+
+Laden und Aufbereiten verarbeiteter Datensätze.
+"""
+
+from solana_rl_bot.data.processors.feature_loader import load_features
+
+__all__ = [
+    "load_features",
+]
@@ -0,0 +1,73 @@
+"""
+Feature Loader
+
+Lädt den verarbeiteten Feature-Datensatz für Training und Evaluation.
+"""
+
+from pathlib import Path
+from typing import Union
+import pandas as pd
+
+from solana_rl_bot.utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_FEATURES_PATH = Path("data/processed/sol_usdt_features.csv")
+DEFAULT_CACHE_DIR = Path("data/cache")
+
+# Schlüssel in df.attrs: (st_size, st_mtime_ns) der CSV beim Schreiben des Caches
+_SOURCE_STAT_ATTR = "feature_loader_source_stat"
+
+
+def load_features(
+    path: Union[str, Path] = DEFAULT_FEATURES_PATH,
+    downcast: bool = True,
+    cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+) -> pd.DataFrame:
+    """
+    Lade Feature-CSV über einen binären Cache in cache_dir.
+
+    Beim ersten Aufruf (oder wenn sich Größe oder mtime der CSV geändert
+    haben) wird die CSV geparst und als Pickle gespeichert, danach wird nur
+    noch der Cache gelesen.
+
+    Args:
+        path: Pfad zur Feature-CSV
+        downcast: float64 Spalten zu float32 konvertieren (halber RAM)
+        cache_dir: Verzeichnis für den Pickle-Cache
+
+    Returns:
+        DataFrame mit Features (DatetimeIndex)
+
+    Raises:
+        FileNotFoundError: Wenn weder CSV noch Cache existieren
+    """
+    path = Path(path)
+    cache_path = Path(cache_dir) / f"{path.stem}.pkl"
+
+    source_stat = None
+    if path.exists():
+        stat = path.stat()
+        source_stat = (stat.st_size, stat.st_mtime_ns)
+
+    df = None
+    if cache_path.exists():
+        cached = pd.read_pickle(cache_path)
+        # Ohne CSV gilt der Cache, sonst nur bei unveränderter CSV
+        if source_stat is None or cached.attrs.get(_SOURCE_STAT_ATTR) == source_stat:
+            df = cached
+
+    if df is None:
+        df = pd.read_csv(path, index_col=0, parse_dates=True)
+        df.attrs[_SOURCE_STAT_ATTR] = source_stat
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(cache_path)
+        logger.info(f"Feature-Cache erstellt: {cache_path}")
+
+    df.attrs.pop(_SOURCE_STAT_ATTR, None)
+
+    if downcast:
+        float_cols = df.select_dtypes("float64").columns
+        df = df.astype({col: "float32" for col in float_cols})
+
+    return df
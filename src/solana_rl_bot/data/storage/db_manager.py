@@ -136,6 +136,10 @@ class DatabaseManager:
             if not all(col in df.columns for col in required_cols):
                 raise ValueError(f"Missing required columns. Need: {required_cols}")
 
+            # Insert in time order so writes stay in the latest hypertable chunk
+            if not df["timestamp"].is_monotonic_increasing:
+                df = df.sort_values("timestamp", kind="stable")
+
             # Insert using pandas to_sql
             rows_inserted = df.to_sql(
                 "ohlcv",
@@ -284,6 +288,9 @@ class DatabaseManager:
             if "timestamp" not in df.columns:
                 raise ValueError("DataFrame must have 'timestamp' column")
 
+            if not df["timestamp"].is_monotonic_increasing:
+                df = df.sort_values("timestamp", kind="stable")
+
             rows_inserted = df.to_sql(
                 "features",
                 self.engine,
@@ -4,9 +4,14 @@ Reinforcement Learning Environment Module
 Trading Environment fuer RL Training.
 """
 
-from solana_rl_bot.environment.trading_env import TradingEnv
+from solana_rl_bot.environment.trading_env import TradingEnv, TradeStats
 from solana_rl_bot.environment.advanced_trading_env import AdvancedTradingEnv
 from solana_rl_bot.environment.continuous_trading_env import ContinuousTradingEnv
+from solana_rl_bot.environment.shared_env import (
+    build_env_fn,
+    make_vec_env,
+    subproc_env_fn,
+)
 from solana_rl_bot.environment.rewards import (
     RewardFunction,
     RewardFactory,
@@ -19,8 +24,12 @@ from solana_rl_bot.environment.rewards import (
 
 __all__ = [
     "TradingEnv",
+    "TradeStats",
     "AdvancedTradingEnv",
     "ContinuousTradingEnv",
+    "build_env_fn",
+    "make_vec_env",
+    "subproc_env_fn",
     "RewardFunction",
     "RewardFactory",
     "ProfitReward",
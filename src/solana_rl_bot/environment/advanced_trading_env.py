@@ -69,7 +69,9 @@ class AdvancedTradingEnv(gym.Env):
         """
         super().__init__()
         
-        self.df = df.copy()
+        # Kein df.copy(): self.df ist ein Alias auf das DataFrame des Aufrufers,
+        # das Environment schreibt nie in df (nur in eigene Arrays)
+        self.df = df
         self.initial_balance = initial_balance
         self.commission = commission
         self.window_size = window_size
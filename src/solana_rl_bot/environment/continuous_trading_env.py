@@ -14,6 +14,7 @@ from gymnasium import spaces
 
 from solana_rl_bot.utils import get_logger
 from solana_rl_bot.environment.rewards import RewardFunction, RewardFactory
+from solana_rl_bot.environment.trading_env import TradingEnv
 from solana_rl_bot.risk import RiskManager, RiskConfig
 
 logger = get_logger(__name__)
@@ -47,6 +48,7 @@ class ContinuousTradingEnv(gym.Env):
         use_risk_management: bool = True,
         risk_config: Optional[RiskConfig] = None,
         use_position_sizing: bool = False,
+        df_normalized: Optional[pd.DataFrame] = None,
     ):
         """
         Initialisiere Continuous Trading Environment.
@@ -62,10 +64,13 @@ class ContinuousTradingEnv(gym.Env):
             use_risk_management: Aktiviere Risk Management
             risk_config: Custom RiskConfig
             use_position_sizing: Action magnitude bestimmt Position Size
+            df_normalized: Vorberechnete normalize_features(df) (None = hier berechnen)
         """
         super().__init__()
 
-        self.df = df.copy()
+        # Kein df.copy(): self.df ist ein Alias auf das DataFrame des Aufrufers,
+        # das Environment schreibt nie in df (nur in eigene Arrays)
+        self.df = df
         self.initial_balance = initial_balance
         self.commission = commission
         self.window_size = window_size
@@ -77,24 +82,20 @@ class ContinuousTradingEnv(gym.Env):
         else:
             self.reward_function = RewardFactory.create(reward_type)
 
-        # Bestimme Features
-        if features is None:
-            self.features = [
-                "open", "high", "low", "close", "volume",
-                "rsi_14", "macd", "bbands_upper", "bbands_lower",
-                "returns", "volatility"
-            ]
-        else:
-            self.features = features
-
-        # Filtere verfuegbare Features
-        self.features = [f for f in self.features if f in df.columns]
+        # Bestimme verfuegbare Features
+        self.features = self._select_features(df, features)
 
         if len(self.features) == 0:
             raise ValueError("Keine gueltigen Features gefunden!")
 
         # Normalize Features
-        self._normalize_data()
+        if df_normalized is not None:
+            missing = [f for f in self.features if f not in df_normalized.columns]
+            if missing:
+                raise ValueError(f"df_normalized fehlen Features: {missing}")
+            self.df_normalized = df_normalized
+        else:
+            self._normalize_data()
 
         # KONTINUIERLICHER Action Space fuer SAC
         self.action_space = spaces.Box(
@@ -140,21 +141,33 @@ class ContinuousTradingEnv(gym.Env):
             f"{len(df)} Candles, Box Action Space"
         )
 
+    @staticmethod
+    def _select_features(df: pd.DataFrame, features: Optional[list] = None) -> list:
+        """Bestimme die im DataFrame verfuegbaren Features (wie TradingEnv)."""
+        return TradingEnv._select_features(df, features)
+
+    @classmethod
+    def normalize_features(
+        cls, df: pd.DataFrame, features: Optional[list] = None
+    ) -> pd.DataFrame:
+        """
+        Min-Max Normalisierung der Features zu [-1, 1] (wie TradingEnv).
+
+        Kann einmal pro DataFrame berechnet und als df_normalized an
+        mehrere Environments uebergeben werden (z.B. ueber build_env_fn).
+
+        Args:
+            df: DataFrame mit OHLCV + Features
+            features: Liste von Feature-Namen (None = Standard-Features)
+
+        Returns:
+            DataFrame mit den normalisierten Feature-Spalten
+        """
+        return TradingEnv.normalize_features(df, features)
+
     def _normalize_data(self):
         """Normalisiere Features."""
-        self.df_normalized = self.df.copy()
-
-        for feature in self.features:
-            if feature in self.df.columns:
-                min_val = self.df[feature].min()
-                max_val = self.df[feature].max()
-
-                if max_val > min_val:
-                    self.df_normalized[feature] = (
-                        2 * (self.df[feature] - min_val) / (max_val - min_val) - 1
-                    )
-                else:
-                    self.df_normalized[feature] = 0
+        self.df_normalized = self.normalize_features(self.df, self.features)
 
     def _continuous_to_discrete(self, action: np.ndarray) -> int:
         """
@@ -18,6 +18,20 @@ from solana_rl_bot.utils import get_logger
 logger = get_logger(__name__)
 
 
+def _window_returns(portfolio_history: List[float], window: int) -> np.ndarray:
+    """
+    Returns der letzten `window` Portfolio Values.
+
+    Die Liste wird genau einmal in ein Array konvertiert, alle weiteren
+    Schritte laufen auf dem Array.
+    """
+    if len(portfolio_history) < 2:
+        return np.array([])
+
+    history = np.asarray(portfolio_history[-window:], dtype=np.float64)
+    return np.diff(history) / history[:-1]
+
+
 class RewardFunction(ABC):
     """
     Abstrakte Basis-Klasse für Reward Functions.
@@ -174,8 +188,8 @@ class SharpeReward(RewardFunction):
             return -self.hold_penalty
 
         # Sharpe Ratio
-        mean_return = np.mean(returns)
-        std_return = np.std(returns)
+        mean_return = returns.mean()
+        std_return = returns.std()
 
         if std_return == 0:
             sharpe = 0.0
@@ -193,14 +207,7 @@ class SharpeReward(RewardFunction):
 
     def _calculate_returns(self, portfolio_history: List[float]) -> np.ndarray:
         """Berechne Returns aus Portfolio History."""
-        if len(portfolio_history) < 2:
-            return np.array([])
-
-        # Nutze letzten N Werte
-        history = portfolio_history[-self.window :]
-        returns = np.diff(history) / history[:-1]
-
-        return returns
+        return _window_returns(portfolio_history, self.window)
 
 
 class SortinoReward(RewardFunction):
@@ -258,7 +265,7 @@ class SortinoReward(RewardFunction):
             return -self.hold_penalty
 
         # Sortino Ratio
-        mean_return = np.mean(returns)
+        mean_return = returns.mean()
 
         # Nur negative Returns für Downside Risk
         downside_returns = returns[returns < 0]
@@ -267,7 +274,7 @@ class SortinoReward(RewardFunction):
             # Keine Losses = perfekt
             sortino = mean_return * 10
         else:
-            downside_std = np.std(downside_returns)
+            downside_std = downside_returns.std()
             if downside_std == 0:
                 sortino = 0.0
             else:
@@ -284,13 +291,7 @@ class SortinoReward(RewardFunction):
 
     def _calculate_returns(self, portfolio_history: List[float]) -> np.ndarray:
         """Berechne Returns aus Portfolio History."""
-        if len(portfolio_history) < 2:
-            return np.array([])
-
-        history = portfolio_history[-self.window :]
-        returns = np.diff(history) / history[:-1]
-
-        return returns
+        return _window_returns(portfolio_history, self.window)
 
 
 class MultiObjectiveReward(RewardFunction):
@@ -386,10 +387,9 @@ class MultiObjectiveReward(RewardFunction):
         if len(portfolio_history) < max(2, self.window):
             return 0.0
 
-        history = portfolio_history[-self.window :]
-        returns = np.diff(history) / history[:-1]
+        returns = _window_returns(portfolio_history, self.window)
 
-        volatility = np.std(returns)
+        volatility = returns.std()
         return volatility * 100  # Skaliert
 
     def _calculate_drawdown(self, portfolio_history: List[float]) -> float:
@@ -0,0 +1,174 @@
+"""
+Shared-Memory Environment Factory
+
+Env-Factories für SubprocVecEnv, deren Daten nicht pro Worker gepickelt
+werden: die Marktdaten liegen einmal als numpy.memmap in /dev/shm und
+jeder Worker mappt sie read-only ein.
+"""
+
+import atexit
+import shutil
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Literal, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import gymnasium as gym
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecEnv
+
+from solana_rl_bot.environment.trading_env import TradingEnv
+from solana_rl_bot.utils import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+
+def _shm_dir() -> Path:
+    """Temp-Verzeichnis im Shared Memory (Fallback: normales Temp-Verzeichnis)."""
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() else None
+    return Path(tempfile.mkdtemp(prefix="solana_env_", dir=base))
+
+
+def _dump(arr: np.ndarray, path: Path) -> Tuple[str, Tuple[int, ...], str]:
+    """Schreibe Array als memmap Datei, gib (path, shape, dtype) zurück."""
+    mm = np.memmap(path, dtype=arr.dtype, mode="w+", shape=arr.shape)
+    mm[:] = arr
+    mm.flush()
+    return str(path), arr.shape, arr.dtype.str
+
+
+def _load(spec: Tuple[str, Tuple[int, ...], str]) -> np.ndarray:
+    """Mappe eine mit _dump geschriebene Datei read-only ein."""
+    path, shape, dtype = spec
+    return np.memmap(path, dtype=np.dtype(dtype), mode="r", shape=shape)
+
+
+def _make_shared_env(
+    env_cls: type,
+    values: Tuple[str, Tuple[int, ...], str],
+    columns: list,
+    normalized: Tuple[str, Tuple[int, ...], str],
+    features: list,
+    index: pd.Index,
+    env_kwargs: Dict,
+) -> gym.Env:
+    """Baue ein Environment auf den gemappten Arrays (läuft im Worker)."""
+    df = pd.DataFrame(_load(values), index=index, columns=columns, copy=False)
+    df_normalized = pd.DataFrame(_load(normalized), index=index, columns=features, copy=False)
+
+    return env_cls(df=df, df_normalized=df_normalized, **env_kwargs)
+
+
+def _make_worker_env(env_fn: Callable[[], gym.Env], log_level: str) -> gym.Env:
+    """Konfiguriere Logging im Worker-Prozess und baue das Environment."""
+    setup_logging(log_level)
+    return env_fn()
+
+
+def subproc_env_fn(
+    env_fn: Callable[[], gym.Env], log_level: str = "INFO"
+) -> Callable[[], gym.Env]:
+    """
+    Wrappe eine Env-Factory für SubprocVecEnv Worker.
+
+    Frische Worker-Prozesse (forkserver/spawn) rufen setup_logging() auf,
+    bevor sie ihr Environment bauen.
+
+    Args:
+        env_fn: Env-Factory
+        log_level: Log-Level im Worker
+
+    Returns:
+        Picklebare Factory
+    """
+    return partial(_make_worker_env, env_fn, log_level)
+
+
+def make_vec_env(
+    env: Optional[Union[gym.Env, VecEnv]] = None,
+    env_fn: Optional[Callable[[], gym.Env]] = None,
+    n_envs: int = 1,
+    vec_env_cls: Literal["subproc", "dummy"] = "subproc",
+) -> VecEnv:
+    """
+    Wrappe Environment(s) als VecEnv für Stable-Baselines3.
+
+    n_envs > 1 mit "subproc" startet einen Worker-Prozess pro Environment
+    (forkserver: kein Fork des Trainingsprozesses samt Torch-State),
+    sonst laufen alle Environments sequentiell in einem DummyVecEnv.
+    Ein bereits vektorisiertes env wird unverändert zurückgegeben.
+
+    Args:
+        env: Einzelnes Environment (nur für n_envs == 1 ohne env_fn) oder VecEnv
+        env_fn: Factory für ein neues Environment (nötig für n_envs > 1)
+        n_envs: Anzahl paralleler Environments
+        vec_env_cls: "subproc" (SubprocVecEnv) oder "dummy" (DummyVecEnv)
+
+    Returns:
+        VecEnv
+    """
+    if isinstance(env, VecEnv):
+        return env
+
+    if env is None and env_fn is None:
+        raise ValueError("Either env or env_fn must be given")
+
+    if env_fn is None:
+        if n_envs > 1:
+            raise ValueError("env_fn is required for n_envs > 1")
+        return DummyVecEnv([lambda: env])
+
+    if n_envs > 1 and vec_env_cls == "subproc":
+        # Jedes Environment steppt in eigenem Prozess, Rollout läuft parallel
+        return SubprocVecEnv(
+            [subproc_env_fn(env_fn) for _ in range(n_envs)], start_method="forkserver"
+        )
+
+    return DummyVecEnv([env_fn for _ in range(n_envs)])
+
+
+def build_env_fn(
+    df: pd.DataFrame, env_cls: type = TradingEnv, **env_kwargs
+) -> Callable[[], gym.Env]:
+    """
+    Erstelle eine picklebare Env-Factory mit Daten im Shared Memory.
+
+    Die numerischen Spalten (float64) und die normalisierten Features
+    (float32) werden einmal geschrieben; die Factory selbst enthält nur
+    Pfade, Shapes, Spaltennamen und den Index.
+
+    Args:
+        df: DataFrame mit OHLCV + Features
+        env_cls: Environment-Klasse (muss df_normalized akzeptieren)
+        **env_kwargs: Weitere Argumente für env_cls
+
+    Returns:
+        Factory für SubprocVecEnv / DummyVecEnv
+    """
+    data_dir = _shm_dir()
+    atexit.register(shutil.rmtree, data_dir, ignore_errors=True)
+
+    numeric = df.select_dtypes("number")
+    features = env_cls._select_features(numeric, env_kwargs.get("features"))
+    normalized = env_cls.normalize_features(numeric, features)
+
+    values = _dump(numeric.to_numpy(dtype=np.float64), data_dir / "values.dat")
+    normalized_spec = _dump(
+        np.ascontiguousarray(normalized.to_numpy(dtype=np.float32)),
+        data_dir / "normalized.dat",
+    )
+
+    logger.info(f"Env-Daten im Shared Memory: {data_dir} ({numeric.shape[0]} Candles)")
+
+    return partial(
+        _make_shared_env,
+        env_cls,
+        values,
+        list(numeric.columns),
+        normalized_spec,
+        features,
+        df.index,
+        env_kwargs,
+    )
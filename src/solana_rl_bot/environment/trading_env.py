@@ -4,6 +4,7 @@ Solana RL Trading Environment
 Gymnasium-kompatibles Trading Environment für Reinforcement Learning.
 """
 
+from dataclasses import dataclass
 from typing import Dict, Tuple, Optional, Any
 import numpy as np
 import pandas as pd
@@ -16,6 +17,74 @@ from solana_rl_bot.risk import RiskManager, RiskConfig
 
 logger = get_logger(__name__)
 
+# Spaltenweises Trade-Log (side: 1 = BUY, -1 = SELL; profit nur bei SELL)
+TRADE_DTYPE = np.dtype(
+    [
+        ("step", np.int32),
+        ("side", np.int8),
+        ("price", np.float64),
+        ("amount", np.float64),
+        ("profit", np.float64),
+        ("profit_pct", np.float64),
+        ("balance", np.float64),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class TradeStats:
+    """
+    Trade-Statistiken einer Episode.
+
+    Wird mit from_records() spaltenweise aus dem Trade-Log (TRADE_DTYPE)
+    berechnet, ohne Python-Schleife über die einzelnen Trades.
+    """
+
+    n_trades: int = 0             # Alle Trades (BUY + SELL)
+    n_completed: int = 0          # Abgeschlossene Trades (SELL)
+    n_wins: int = 0
+    sum_profit: float = 0.0
+    sum_return: float = 0.0       # Summe der profit_pct
+    sum_sq_return: float = 0.0
+    max_profit: float = 0.0
+    max_loss: float = 0.0
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> "TradeStats":
+        """Berechne die Statistiken aus einem Structured Array (TRADE_DTYPE)."""
+        sells = records[records["side"] == -1]
+        if len(sells) == 0:
+            return cls(n_trades=len(records))
+
+        profits = sells["profit"]
+        returns = sells["profit_pct"]
+
+        return cls(
+            n_trades=len(records),
+            n_completed=len(sells),
+            n_wins=int(np.count_nonzero(profits > 0)),
+            sum_profit=float(profits.sum()),
+            sum_return=float(returns.sum()),
+            sum_sq_return=float(np.dot(returns, returns)),
+            max_profit=float(profits.max()),
+            max_loss=float(profits.min()),
+        )
+
+    @property
+    def win_rate(self) -> float:
+        return self.n_wins / self.n_completed if self.n_completed else 0.0
+
+    @property
+    def mean_return(self) -> float:
+        return self.sum_return / self.n_completed if self.n_completed else 0.0
+
+    @property
+    def std_return(self) -> float:
+        if self.n_completed == 0:
+            return 0.0
+        mean = self.mean_return
+        return float(np.sqrt(max(self.sum_sq_return / self.n_completed - mean * mean, 0.0)))
+
 
 class TradingEnv(gym.Env):
     """
@@ -50,6 +119,7 @@ class TradingEnv(gym.Env):
         reward_type: str = "profit",
         use_risk_management: bool = True,
         risk_config: Optional[RiskConfig] = None,
+        df_normalized: Optional[pd.DataFrame] = None,
     ):
         """
         Initialisiere Trading Environment.
@@ -64,10 +134,10 @@ class TradingEnv(gym.Env):
             reward_type: Typ der Reward Function ('profit', 'sharpe', 'sortino', 'multi', 'incremental')
             use_risk_management: Aktiviere Risk Management (Stop-Loss, Position Sizing, etc.)
             risk_config: Custom RiskConfig (None = Standard SOL-optimiert)
+            df_normalized: Vorberechnete normalize_features(df) (None = hier berechnen)
         """
         super().__init__()
 
-        self.df = df.copy()
         self.initial_balance = initial_balance
         self.commission = commission
         self.window_size = window_size
@@ -80,25 +150,13 @@ class TradingEnv(gym.Env):
 
         logger.info(f"Nutze Reward Function: {self.reward_function}")
 
-        # Bestimme Features
-        if features is None:
-            # Standard: OHLCV + wichtigste Features
-            self.features = [
-                "open", "high", "low", "close", "volume",
-                "rsi_14", "macd", "bbands_upper", "bbands_lower",
-                "returns", "volatility"
-            ]
-        else:
-            self.features = features
-
-        # Filtere verfügbare Features
-        self.features = [f for f in self.features if f in df.columns]
+        # Bestimme verfügbare Features
+        self.features = self._select_features(df, features)
 
         if len(self.features) == 0:
             raise ValueError("Keine gültigen Features gefunden!")
 
-        # Normalize Features
-        self._normalize_data()
+        self._set_data(df, df_normalized)
 
         # Action Space: 0=Hold, 1=Buy, 2=Sell
         self.action_space = spaces.Discrete(3)
@@ -131,7 +189,8 @@ class TradingEnv(gym.Env):
 
         # Statistiken
         self.total_reward = 0.0
-        self.trades = []
+        self._trade_buf = np.empty(256, dtype=TRADE_DTYPE)
+        self._trade_n = 0
         self.portfolio_history = []
         self.risk_events = []  # Track Stop-Loss, Take-Profit, etc.
 
@@ -141,22 +200,93 @@ class TradingEnv(gym.Env):
             f"Initial Balance: ${initial_balance:.2f}"
         )
 
+    @staticmethod
+    def _select_features(df: pd.DataFrame, features: Optional[list] = None) -> list:
+        """Bestimme die im DataFrame verfügbaren Features."""
+        if features is None:
+            # Standard: OHLCV + wichtigste Features
+            features = [
+                "open", "high", "low", "close", "volume",
+                "rsi_14", "macd", "bbands_upper", "bbands_lower",
+                "returns", "volatility"
+            ]
+
+        return [f for f in features if f in df.columns]
+
+    @classmethod
+    def normalize_features(
+        cls, df: pd.DataFrame, features: Optional[list] = None
+    ) -> pd.DataFrame:
+        """
+        Min-Max Normalisierung der Features zu [-1, 1].
+
+        Kann einmal pro DataFrame berechnet und als df_normalized an
+        mehrere Environments übergeben werden.
+
+        Args:
+            df: DataFrame mit OHLCV + Features
+            features: Liste von Feature-Namen (None = Standard-Features)
+
+        Returns:
+            DataFrame mit den normalisierten Feature-Spalten
+        """
+        data = df[cls._select_features(df, features)]
+
+        min_val = data.min()
+        max_val = data.max()
+        span = max_val - min_val
+
+        normalized = 2 * (data - min_val) / span - 1
+
+        # Konstante Features auf 0 setzen
+        normalized.loc[:, ~(span > 0)] = 0
+
+        return normalized
+
     def _normalize_data(self):
         """Normalisiere Features für besseres RL Training."""
-        self.df_normalized = self.df.copy()
+        self.df_normalized = self.normalize_features(self.df, self.features)
+
+    def _set_data(self, df: pd.DataFrame, df_normalized: Optional[pd.DataFrame] = None):
+        """Binde DataFrame und baue die Feature-/Preis-Arrays."""
+        # Kein df.copy(): self.df ist ein Alias auf das DataFrame des Aufrufers,
+        # das Environment schreibt nie in df (nur in eigene Arrays)
+        self.df = df
+
+        # Normalize Features (oder vorberechnete übernehmen)
+        if df_normalized is not None:
+            missing = [f for f in self.features if f not in df_normalized.columns]
+            if missing:
+                raise ValueError(f"df_normalized fehlen Features: {missing}")
+            self.df_normalized = df_normalized
+        else:
+            self._normalize_data()
+
+        # Einmal als zusammenhängende Arrays ablegen: pro Step nur noch
+        # NumPy Slicing statt pandas iloc
+        normalized = self.df_normalized
+        if list(normalized.columns) != self.features:
+            normalized = normalized[self.features]
+        self._feature_arr = np.ascontiguousarray(normalized.to_numpy(dtype=np.float32))
+        self._prices = self.df["close"].to_numpy(dtype=np.float64)
+
+    def set_df(self, df: pd.DataFrame, df_normalized: Optional[pd.DataFrame] = None):
+        """
+        Tausche die Marktdaten aus, ohne das Environment neu zu bauen.
+
+        Features, Spaces, Reward Function und Risk Manager bleiben erhalten;
+        der Trading State wird wie bei reset() zurückgesetzt.
 
-        for feature in self.features:
-            if feature in self.df.columns:
-                # Min-Max Normalisierung zu [-1, 1]
-                min_val = self.df[feature].min()
-                max_val = self.df[feature].max()
+        Args:
+            df: Neues DataFrame mit denselben Feature-Spalten
+            df_normalized: Vorberechnete normalize_features(df) (None = hier berechnen)
+        """
+        missing = [f for f in self.features if f not in df.columns]
+        if missing:
+            raise ValueError(f"df fehlen Features: {missing}")
 
-                if max_val > min_val:
-                    self.df_normalized[feature] = (
-                        2 * (self.df[feature] - min_val) / (max_val - min_val) - 1
-                    )
-                else:
-                    self.df_normalized[feature] = 0
+        self._set_data(df, df_normalized)
+        self.reset()
 
     def reset(
         self, seed: Optional[int] = None, options: Optional[dict] = None
@@ -178,7 +308,7 @@ class TradingEnv(gym.Env):
 
         # Reset Statistiken
         self.total_reward = 0.0
-        self.trades = []
+        self._trade_n = 0  # Buffer bleibt alloziert
         self.portfolio_history = []
         self.risk_events = []
 
@@ -201,8 +331,57 @@ class TradingEnv(gym.Env):
         Returns:
             observation, reward, terminated, truncated, info
         """
+        reward, terminated, truncated = self._advance(action)
+
+        # Nächste Observation
+        observation = self._get_observation()
+        info = self._get_info()
+
+        self.total_reward += reward
+
+        return observation, reward, terminated, truncated, info
+
+    def step_batch(self, actions: np.ndarray) -> Tuple[np.ndarray, bool]:
+        """
+        Führe mehrere Actions hintereinander aus.
+
+        Für Benchmarks/Random Agents, die nur Rewards brauchen: Observation und
+        Info werden nicht pro Step aufgebaut. Stoppt, sobald die Episode endet.
+
+        Args:
+            actions: Array von Actions (0=Hold, 1=Buy, 2=Sell)
+
+        Returns:
+            rewards (float32, ein Eintrag pro ausgeführtem Step), done
+        """
+        rewards = np.empty(len(actions), dtype=np.float32)
+        done = False
+        n = 0
+
+        for action in actions:
+            reward, terminated, truncated = self._advance(int(action))
+            self.total_reward += reward
+            rewards[n] = reward
+            n += 1
+
+            if terminated or truncated:
+                done = True
+                break
+
+        return rewards[:n], done
+
+    def _advance(self, action: int) -> Tuple[float, bool, bool]:
+        """
+        Führe eine Action aus und rücke einen Step vor (ohne Observation/Info).
+
+        Args:
+            action: 0=Hold, 1=Buy, 2=Sell
+
+        Returns:
+            reward, terminated, truncated
+        """
         # Aktuelle Preis-Daten
-        current_price = self.df.iloc[self.current_step]["close"]
+        current_price = self._prices[self.current_step]
         timestamp = self.df.index[self.current_step] if hasattr(self.df.index, '__getitem__') else None
 
         # Portfolio Value VOR Action tracken (für Reward Functions)
@@ -227,7 +406,7 @@ class TradingEnv(gym.Env):
                         "entry_price": self.entry_price,
                         "pnl_pct": (current_price - self.entry_price) / self.entry_price,
                     })
-                    logger.debug(f"Risk Event: {risk_signal} @ ${current_price:.2f}")
+                    logger.debug("Risk Event: {} @ ${:.2f}", risk_signal, current_price)
 
             # Check ob neuer Trade erlaubt ist
             if action == 1 and self.position == 0:
@@ -236,7 +415,7 @@ class TradingEnv(gym.Env):
                 )
                 if not can_trade:
                     action = 0  # Blockiere Trade
-                    logger.debug(f"Trade blockiert: {reason}")
+                    logger.debug("Trade blockiert: {}", reason)
 
         # Führe Action aus
         reward = self._execute_action(action, current_price)
@@ -251,13 +430,7 @@ class TradingEnv(gym.Env):
         terminated = self.current_step >= len(self.df) - 1
         truncated = portfolio_value <= self.initial_balance * 0.2  # 80% Verlust
 
-        # Nächste Observation
-        observation = self._get_observation()
-        info = self._get_info()
-
-        self.total_reward += reward
-
-        return observation, reward, terminated, truncated, info
+        return reward, terminated, truncated
 
     def _execute_action(self, action: int, current_price: float) -> float:
         """
@@ -299,23 +472,19 @@ class TradingEnv(gym.Env):
             if self.risk_manager:
                 self.risk_manager.on_trade_open(current_price, self.current_step)
 
-            self.trades.append(
-                {
-                    "step": self.current_step,
-                    "action": "BUY",
-                    "price": current_price,
-                    "amount": self.holdings,
-                    "balance": self.balance,
-                }
-            )
+            self._record_trade(1, current_price, self.holdings, 0.0, 0.0)
 
             logger.debug(
-                f"Step {self.current_step}: BUY {self.holdings:.4f} SOL @ ${current_price:.2f}"
+                "Step {}: BUY {:.4f} SOL @ ${:.2f}",
+                self.current_step,
+                self.holdings,
+                current_price,
             )
 
         # ACTION 2: SELL (Position schließen)
         elif action == 2 and self.position == 1:
             # Verkaufe alle Holdings
+            sold = self.holdings
             revenue = self.holdings * current_price * (1 - self.commission)
             profit = revenue - (self.holdings * self.entry_price)
             profit_pct = (current_price - self.entry_price) / self.entry_price
@@ -328,20 +497,14 @@ class TradingEnv(gym.Env):
             if self.risk_manager:
                 self.risk_manager.on_trade_close()
 
-            self.trades.append(
-                {
-                    "step": self.current_step,
-                    "action": "SELL",
-                    "price": current_price,
-                    "profit": profit,
-                    "profit_pct": profit_pct,
-                    "balance": self.balance,
-                }
-            )
+            self._record_trade(-1, current_price, sold, profit, profit_pct)
 
             logger.debug(
-                f"Step {self.current_step}: SELL @ ${current_price:.2f}, "
-                f"Profit: ${profit:.2f} ({profit_pct*100:.2f}%)"
+                "Step {}: SELL @ ${:.2f}, Profit: ${:.2f} ({:.2f}%)",
+                self.current_step,
+                current_price,
+                profit,
+                profit_pct * 100,
             )
 
         # Berechne Reward mit Reward Function
@@ -369,13 +532,10 @@ class TradingEnv(gym.Env):
         start = self.current_step - self.window_size
         end = self.current_step
 
-        window_data = self.df_normalized.iloc[start:end]
-
-        # Features extrahieren
-        features_array = window_data[self.features].values.flatten()
+        # Features extrahieren (View auf das vorberechnete Array)
+        features_array = self._feature_arr[start:end].ravel()
 
         # Portfolio Status
-        current_price = self.df.iloc[self.current_step]["close"]
         portfolio_value = self._get_portfolio_value()
 
         portfolio_features = np.array(
@@ -393,7 +553,7 @@ class TradingEnv(gym.Env):
         # Kombiniere alles
         observation = np.concatenate([features_array, portfolio_features])
 
-        return observation.astype(np.float32)
+        return observation.astype(np.float32, copy=False)
 
     def _get_portfolio_value(self) -> float:
         """
@@ -402,10 +562,71 @@ class TradingEnv(gym.Env):
         Returns:
             Total Portfolio Value in USDT
         """
-        current_price = self.df.iloc[self.current_step]["close"]
+        current_price = self._prices[self.current_step]
         holdings_value = self.holdings * current_price
         return self.balance + holdings_value
 
+    def _record_trade(
+        self, side: int, price: float, amount: float, profit: float, profit_pct: float
+    ) -> None:
+        """Schreibe einen Trade ins spaltenweise Trade-Log (Kapazität verdoppelt sich)."""
+        if self._trade_n == len(self._trade_buf):
+            self._trade_buf = np.concatenate([self._trade_buf, np.empty_like(self._trade_buf)])
+
+        self._trade_buf[self._trade_n] = (
+            self.current_step, side, price, amount, profit, profit_pct, self.balance
+        )
+        self._trade_n += 1
+
+    @property
+    def trade_records(self) -> np.ndarray:
+        """
+        Trades der Episode als Structured Array (TRADE_DTYPE).
+
+        Einzige Quelle für trades und trade_stats. Liefert eine View auf den
+        Buffer, der nach reset() überschrieben wird; wer die Trades über die
+        Episode hinaus behält, muss .copy() aufrufen.
+        """
+        return self._trade_buf[: self._trade_n]
+
+    @property
+    def trades(self) -> list:
+        """Trades der Episode als Liste von Dicts (aus trade_records abgeleitet)."""
+        trades = []
+        for step, side, price, amount, profit, profit_pct, balance in self.trade_records.tolist():
+            if side == 1:
+                trades.append(
+                    {
+                        "step": step,
+                        "action": "BUY",
+                        "price": price,
+                        "amount": amount,
+                        "balance": balance,
+                    }
+                )
+            else:
+                trades.append(
+                    {
+                        "step": step,
+                        "action": "SELL",
+                        "price": price,
+                        "profit": profit,
+                        "profit_pct": profit_pct,
+                        "balance": balance,
+                    }
+                )
+        return trades
+
+    @property
+    def trade_stats(self) -> TradeStats:
+        """Trade-Statistiken der Episode (aus trade_records berechnet)."""
+        return TradeStats.from_records(self.trade_records)
+
+    @property
+    def total_return(self) -> float:
+        """Aktueller Return relativ zum Startkapital."""
+        return (self._get_portfolio_value() - self.initial_balance) / self.initial_balance
+
     def _get_info(self) -> Dict:
         """
         Zusätzliche Info für Debugging.
@@ -424,7 +645,7 @@ class TradingEnv(gym.Env):
             "portfolio_value": portfolio_value,
             "total_return": total_return,
             "total_reward": self.total_reward,
-            "num_trades": len(self.trades),
+            "num_trades": self._trade_n,
         }
 
     def render(self, mode="human"):
@@ -447,35 +668,27 @@ class TradingEnv(gym.Env):
         Returns:
             Dictionary mit Statistiken
         """
-        if len(self.trades) == 0:
+        stats = self.trade_stats
+
+        if stats.n_trades == 0:
             return {"total_trades": 0}
 
-        # Filtere nur SELL trades (abgeschlossene Trades)
-        sell_trades = [t for t in self.trades if t["action"] == "SELL"]
-
-        if len(sell_trades) == 0:
-            return {"total_trades": len(self.trades), "completed_trades": 0}
-
-        profits = [t["profit"] for t in sell_trades]
-        profit_pcts = [t["profit_pct"] for t in sell_trades]
-
-        winning_trades = [p for p in profits if p > 0]
-        losing_trades = [p for p in profits if p <= 0]
-
-        stats = {
-            "total_trades": len(self.trades),
-            "completed_trades": len(sell_trades),
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
-            "win_rate": len(winning_trades) / len(sell_trades) if sell_trades else 0,
-            "total_profit": sum(profits),
-            "avg_profit": np.mean(profits),
-            "avg_profit_pct": np.mean(profit_pcts) * 100,
-            "max_profit": max(profits) if profits else 0,
-            "max_loss": min(profits) if profits else 0,
-            "final_portfolio_value": self._get_portfolio_value(),
-            "total_return": (self._get_portfolio_value() - self.initial_balance)
-            / self.initial_balance,
-        }
+        if stats.n_completed == 0:
+            return {"total_trades": stats.n_trades, "completed_trades": 0}
+
+        portfolio_value = self._get_portfolio_value()
 
-        return stats
+        return {
+            "total_trades": stats.n_trades,
+            "completed_trades": stats.n_completed,
+            "winning_trades": stats.n_wins,
+            "losing_trades": stats.n_completed - stats.n_wins,
+            "win_rate": stats.win_rate,
+            "total_profit": stats.sum_profit,
+            "avg_profit": stats.sum_profit / stats.n_completed,
+            "avg_profit_pct": stats.mean_return * 100,
+            "max_profit": stats.max_profit,
+            "max_loss": stats.max_loss,
+            "final_portfolio_value": portfolio_value,
+            "total_return": (portfolio_value - self.initial_balance) / self.initial_balance,
+        }
@@ -7,12 +7,14 @@ from solana_rl_bot.utils.logging import (
     get_logger,
     log_function_call,
     log_performance,
+    logging_disabled,
     PerformanceLogger,
     log_trade,
     log_performance_metric,
     log_error,
     bot_logger,
     initialize_logging,
+    setup_logging,
 )
 
 __all__ = [
@@ -20,10 +22,12 @@ __all__ = [
     "get_logger",
     "log_function_call",
     "log_performance",
+    "logging_disabled",
     "PerformanceLogger",
     "log_trade",
     "log_performance_metric",
     "log_error",
     "bot_logger",
     "initialize_logging",
+    "setup_logging",
 ]
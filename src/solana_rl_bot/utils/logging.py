@@ -14,6 +14,7 @@ from typing import Optional, Any, Dict
 from datetime import datetime
 from loguru import logger
 from functools import wraps
+from contextlib import contextmanager
 import time
 
 from solana_rl_bot.config import get_config
@@ -23,6 +24,8 @@ class LoggerSetup:
     """Setup and configure logging for the application."""
 
     _initialized = False
+    _log_dir: Optional[Path] = None
+    _handler_ids: Dict[str, int] = {}
 
     @classmethod
     def setup(
@@ -60,6 +63,28 @@ class LoggerSetup:
         cls._initialized = True
         logger.info("Logging system initialized")
 
+    @classmethod
+    def set_level(cls, log_level: str) -> None:
+        """Change the minimum log level without re-initializing logging.
+
+        Only the level-dependent sinks (console and main log file) are
+        replaced; the error and trade log files keep their fixed levels.
+
+        Args:
+            log_level: New minimum log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        """
+        if not cls._initialized:
+            cls.setup(log_level=log_level)
+            return
+
+        if "console" in cls._handler_ids:
+            logger.remove(cls._handler_ids.pop("console"))
+            cls._setup_console_logger(log_level)
+
+        if "main_file" in cls._handler_ids:
+            logger.remove(cls._handler_ids.pop("main_file"))
+            cls._setup_main_file_logger(log_level, cls._log_dir)
+
     @classmethod
     def _setup_console_logger(cls, log_level: str) -> None:
         """Setup colored console logger.
@@ -67,7 +92,7 @@ class LoggerSetup:
         Args:
             log_level: Minimum log level
         """
-        logger.add(
+        cls._handler_ids["console"] = logger.add(
             sys.stdout,
             format=(
                 "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
@@ -86,28 +111,19 @@ class LoggerSetup:
     def _setup_file_loggers(cls, log_level: str, log_dir: Path) -> None:
         """Setup file loggers with rotation.
 
+        File sinks are enqueued: the calling thread only puts the record on a
+        queue and a background thread does the formatting and file I/O. loguru
+        drains the queue on interpreter exit.
+
         Args:
             log_level: Minimum log level
             log_dir: Directory for log files
         """
         log_dir.mkdir(parents=True, exist_ok=True)
+        cls._log_dir = log_dir
 
         # Main log file (all messages)
-        logger.add(
-            log_dir / "bot.log",
-            format=(
-                "{time:YYYY-MM-DD HH:mm:ss.SSS} | "
-                "{level: <8} | "
-                "{name}:{function}:{line} | "
-                "{message}"
-            ),
-            level=log_level,
-            rotation="10 MB",
-            retention="30 days",
-            compression="zip",
-            backtrace=True,
-            diagnose=True,
-        )
+        cls._setup_main_file_logger(log_level, log_dir)
 
         # Error log file (errors and critical only)
         logger.add(
@@ -122,6 +138,7 @@ class LoggerSetup:
             rotation="5 MB",
             retention="60 days",
             compression="zip",
+            enqueue=True,
             backtrace=True,
             diagnose=True,
         )
@@ -138,12 +155,38 @@ class LoggerSetup:
             rotation="10 MB",
             retention="90 days",
             compression="zip",
+            enqueue=True,
             filter=lambda record: "TRADE" in record["message"]
             or "trade" in record["extra"].get("category", ""),
         )
 
         logger.debug(f"File loggers configured in: {log_dir}")
 
+    @classmethod
+    def _setup_main_file_logger(cls, log_level: str, log_dir: Path) -> None:
+        """Setup main log file (all messages at or above log_level).
+
+        Args:
+            log_level: Minimum log level
+            log_dir: Directory for log files
+        """
+        cls._handler_ids["main_file"] = logger.add(
+            log_dir / "bot.log",
+            format=(
+                "{time:YYYY-MM-DD HH:mm:ss.SSS} | "
+                "{level: <8} | "
+                "{name}:{function}:{line} | "
+                "{message}"
+            ),
+            level=log_level,
+            rotation="10 MB",
+            retention="30 days",
+            compression="zip",
+            enqueue=True,
+            backtrace=True,
+            diagnose=True,
+        )
+
     @classmethod
     def setup_from_config(cls) -> None:
         """Setup logging from application config.
@@ -194,20 +237,22 @@ def log_function_call(log_args: bool = True, log_result: bool = False):
     """
 
     def decorator(func):
+        func_name = f"{func.__module__}.{func.__name__}"
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            func_name = f"{func.__module__}.{func.__name__}"
-
+            # Positional args keep formatting lazy: loguru only calls repr()
+            # on args/result when a DEBUG record is actually emitted.
             if log_args:
-                logger.debug(f"Calling {func_name} with args={args}, kwargs={kwargs}")
+                logger.debug("Calling {} with args={}, kwargs={}", func_name, args, kwargs)
             else:
-                logger.debug(f"Calling {func_name}")
+                logger.debug("Calling {}", func_name)
 
             try:
                 result = func(*args, **kwargs)
 
                 if log_result:
-                    logger.debug(f"{func_name} returned: {result}")
+                    logger.debug("{} returned: {}", func_name, result)
 
                 return result
 
@@ -256,6 +301,28 @@ def log_performance(func):
     return wrapper
 
 
+@contextmanager
+def logging_disabled(name: str = "solana_rl_bot"):
+    """Context manager to silence all log records emitted from a module tree.
+
+    Useful around hot loops (e.g. thousands of ``env.step()`` calls) where
+    per-step logging would dominate the runtime.
+
+    Args:
+        name: Module prefix to disable (default: whole package)
+
+    Example:
+        >>> with logging_disabled():
+        >>>     for _ in range(n_steps):
+        >>>         env.step(env.action_space.sample())
+    """
+    logger.disable(name)
+    try:
+        yield
+    finally:
+        logger.enable(name)
+
+
 class PerformanceLogger:
     """Context manager for logging performance of code blocks."""
 
@@ -367,5 +434,20 @@ def initialize_logging():
         LoggerSetup.setup(log_level="INFO")
 
 
+def setup_logging(level: str = "INFO") -> None:
+    """Setup console-only logging for training runs and worker processes.
+
+    The environments log every trade at DEBUG. Without setup, loguru's
+    default sink writes DEBUG synchronously to stderr, so each trade becomes
+    a blocking write on the rollout path. Training scripts call this first,
+    and freshly started worker processes (SubprocVecEnv, process pools) call
+    it before building their environment.
+
+    Args:
+        level: Minimum log level for the console sink
+    """
+    LoggerSetup.setup(log_level=level, log_to_file=False)
+
+
 # Export commonly used logger
 bot_logger = logger
@@ -0,0 +1,28 @@
+"""
+Shared pytest fixtures.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def market_df():
+    """Synthetic 5m OHLCV candles with a few feature columns."""
+    n = 300
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=n, freq="5min", tz="UTC"),
+            "open": close,
+            "high": close * 1.002,
+            "low": close * 0.998,
+            "close": close,
+            "volume": rng.uniform(100, 1000, n),
+            "rsi": rng.uniform(20, 80, n),
+            "returns": np.r_[0.0, np.diff(np.log(close))],
+        }
+    )
@@ -0,0 +1,101 @@
+"""
+Tests for AsyncEvalCallback.
+"""
+
+import gymnasium as gym
+import numpy as np
+import pytest
+import torch
+from stable_baselines3 import PPO
+from stable_baselines3.common.monitor import Monitor
+
+from solana_rl_bot.agents.callbacks import AsyncEvalCallback
+
+
+@pytest.fixture
+def model():
+    """Small PPO model on CartPole."""
+    return PPO("MlpPolicy", gym.make("CartPole-v1"), n_steps=64, batch_size=32, seed=0)
+
+
+def make_callback(model, tmp_path, eval_freq: int = 64) -> AsyncEvalCallback:
+    """AsyncEvalCallback writing best model and logs into tmp_path."""
+    callback = AsyncEvalCallback(
+        Monitor(gym.make("CartPole-v1")),
+        eval_freq=eval_freq,
+        n_eval_episodes=2,
+        best_model_save_path=str(tmp_path),
+        log_path=str(tmp_path),
+        verbose=0,
+    )
+    callback.init_callback(model)
+    return callback
+
+
+class TestAsyncEvalCallback:
+    """Tests for AsyncEvalCallback."""
+
+    def test_snapshot_is_independent(self, model, tmp_path):
+        """The snapshot keeps its weights when the live policy changes."""
+        callback = make_callback(model, tmp_path)
+        snapshot = callback._snapshot_policy()
+
+        live_params = dict(model.policy.named_parameters())
+        for name, param in snapshot.named_parameters():
+            assert param.data_ptr() != live_params[name].data_ptr()
+            torch.testing.assert_close(param, live_params[name])
+
+        with torch.no_grad():
+            for param in model.policy.parameters():
+                param.add_(1.0)
+
+        for name, param in snapshot.named_parameters():
+            assert not torch.equal(param, live_params[name])
+        assert not snapshot.training
+
+    def test_snapshot_of_compiled_policy(self, model, tmp_path):
+        """A compiled live policy yields a plain, uncompiled snapshot."""
+        model.policy.mlp_extractor.compile()
+        callback = make_callback(model, tmp_path)
+
+        snapshot = callback._snapshot_policy()
+
+        assert model.policy.mlp_extractor._compiled_call_impl is not None
+        assert snapshot.mlp_extractor._compiled_call_impl is None
+        assert set(snapshot.state_dict()) == set(model.policy.state_dict())
+
+    def test_learn_records_evaluations_in_order(self, model, tmp_path):
+        """Evaluations are processed in timestep order, the last one at training end."""
+        callback = make_callback(model, tmp_path)
+
+        model.learn(total_timesteps=512, callback=callback)
+
+        timesteps = callback.evaluations_timesteps
+        assert len(timesteps) >= 1
+        assert timesteps == sorted(timesteps)
+        assert len(callback.evaluations_results) == len(timesteps)
+        assert (tmp_path / "evaluations.npz").exists()
+
+        saved = np.load(tmp_path / "evaluations.npz")
+        np.testing.assert_array_equal(saved["timesteps"], timesteps)
+
+    def test_best_model_saved(self, model, tmp_path):
+        """The first evaluation always sets a new best and saves the model."""
+        callback = make_callback(model, tmp_path)
+
+        model.learn(total_timesteps=128, callback=callback)
+
+        assert callback.best_mean_reward > -np.inf
+        assert (tmp_path / "best_model.zip").exists()
+        PPO.load(tmp_path / "best_model.zip")
+
+    def test_executor_shut_down_after_training(self, model, tmp_path):
+        """No evaluation is left pending and the worker thread is stopped."""
+        callback = make_callback(model, tmp_path)
+        executor = callback._executor
+
+        model.learn(total_timesteps=256, callback=callback)
+
+        assert callback._pending is None
+        assert callback._executor is None
+        assert executor._shutdown
@@ -0,0 +1,28 @@
+"""
+Tests for the evaluate() stats of the agents.
+"""
+
+import json
+
+import pytest
+
+from solana_rl_bot.agents import DQNAgent, PPOAgent, SACAgent
+from solana_rl_bot.environment import ContinuousTradingEnv, TradingEnv
+
+
+@pytest.mark.parametrize(
+    "agent_cls, env_cls",
+    [(DQNAgent, TradingEnv), (PPOAgent, TradingEnv), (SACAgent, ContinuousTradingEnv)],
+)
+class TestEvaluate:
+    """Tests for the agents' evaluate()."""
+
+    def test_stats_are_python_floats(self, agent_cls, env_cls, market_df):
+        """All stats are plain floats and serialize to JSON."""
+        env = env_cls(df=market_df, window_size=10)
+        agent = agent_cls(env=env)
+
+        stats = agent.evaluate(env, n_episodes=2)
+
+        assert all(type(value) is float for value in stats.values())
+        assert json.loads(json.dumps(stats)) == stats
@@ -0,0 +1,154 @@
+"""
+Tests for MemmapReplayBuffer.
+"""
+
+import gc
+
+import numpy as np
+import pytest
+from gymnasium import spaces
+from stable_baselines3.common.buffers import ReplayBuffer
+
+from solana_rl_bot.agents.replay_buffer import MemmapReplayBuffer, replay_buffer_options
+
+
+OBS_SPACE = spaces.Box(low=-1.0, high=1.0, shape=(4,), dtype=np.float32)
+ACTION_SPACE = spaces.Discrete(3)
+
+
+def fill(buffer, n_steps: int, seed: int = 0) -> None:
+    """Add n_steps random transitions to the buffer."""
+    rng = np.random.default_rng(seed)
+    for _ in range(n_steps):
+        obs = rng.uniform(-1, 1, size=(1, 4)).astype(np.float32)
+        next_obs = rng.uniform(-1, 1, size=(1, 4)).astype(np.float32)
+        action = rng.integers(0, 3, size=(1,))
+        reward = rng.normal(size=(1,)).astype(np.float32)
+        done = rng.random(size=(1,)) < 0.1
+        infos = [{"TimeLimit.truncated": bool(rng.random() < 0.05)}]
+        buffer.add(obs, next_obs, action, reward, done, infos)
+
+
+@pytest.fixture
+def buffers(tmp_path):
+    """A plain SB3 ReplayBuffer and a MemmapReplayBuffer of the same size."""
+    reference = ReplayBuffer(32, OBS_SPACE, ACTION_SPACE, device="cpu")
+    memmap = MemmapReplayBuffer(
+        32, OBS_SPACE, ACTION_SPACE, device="cpu", memmap_dir=str(tmp_path)
+    )
+    return reference, memmap
+
+
+class TestMemmapReplayBuffer:
+    """Tests for MemmapReplayBuffer."""
+
+    def test_add_matches_sb3(self, buffers):
+        """Stored transitions equal those of SB3's ReplayBuffer."""
+        reference, memmap = buffers
+        fill(reference, 20)
+        fill(memmap, 20)
+
+        assert memmap.pos == reference.pos == 20
+        np.testing.assert_array_equal(memmap.observations, reference.observations)
+        np.testing.assert_array_equal(memmap.next_observations, reference.next_observations)
+        np.testing.assert_array_equal(memmap.actions, reference.actions)
+        np.testing.assert_array_equal(memmap.rewards, reference.rewards)
+        np.testing.assert_array_equal(memmap.dones, reference.dones)
+        np.testing.assert_array_equal(memmap.timeouts, reference.timeouts)
+
+    def test_sample_matches_sb3(self, buffers):
+        """Sampling with the same seed yields the same minibatch."""
+        reference, memmap = buffers
+        fill(reference, 20)
+        fill(memmap, 20)
+
+        np.random.seed(42)
+        expected = reference.sample(8)
+        np.random.seed(42)
+        batch = memmap.sample(8)
+
+        for name in ("observations", "next_observations", "actions", "rewards", "dones"):
+            np.testing.assert_array_equal(
+                getattr(batch, name).numpy(), getattr(expected, name).numpy()
+            )
+
+    def test_discrete_actions_use_small_dtype(self, buffers):
+        """Discrete actions are stored in the smallest integer type."""
+        _, memmap = buffers
+        assert memmap.actions.dtype == np.uint8
+
+    def test_wrap_around(self, buffers):
+        """Adding more than buffer_size transitions overwrites the oldest ones."""
+        reference, memmap = buffers
+        fill(reference, 45)
+        fill(memmap, 45)
+
+        assert memmap.full
+        assert memmap.pos == reference.pos == 13
+        np.testing.assert_array_equal(memmap.observations, reference.observations)
+        np.testing.assert_array_equal(memmap.rewards, reference.rewards)
+
+    def test_optimize_memory_usage(self, tmp_path):
+        """Without next_obs storage, next observations come from obs[pos + 1]."""
+        memmap = MemmapReplayBuffer(
+            32,
+            OBS_SPACE,
+            ACTION_SPACE,
+            device="cpu",
+            optimize_memory_usage=True,
+            handle_timeout_termination=False,
+            memmap_dir=str(tmp_path),
+        )
+        obs = np.full((1, 4), 0.25, dtype=np.float32)
+        next_obs = np.full((1, 4), 0.5, dtype=np.float32)
+        memmap.add(obs, next_obs, np.array([1]), np.array([1.0]), np.array([False]), [{}])
+
+        assert not (tmp_path / "next_obs.dat").exists()
+        np.testing.assert_array_equal(memmap.observations[0], obs)
+        np.testing.assert_array_equal(memmap.observations[1], next_obs)
+
+    def test_explicit_dir_is_kept(self, tmp_path):
+        """Files in a caller-provided memmap_dir outlive the buffer."""
+        memmap = MemmapReplayBuffer(
+            32, OBS_SPACE, ACTION_SPACE, device="cpu", memmap_dir=str(tmp_path)
+        )
+        del memmap
+        gc.collect()
+
+        assert (tmp_path / "obs.dat").exists()
+
+    def test_temp_dir_is_removed(self):
+        """The temporary directory is deleted together with the buffer."""
+        memmap = MemmapReplayBuffer(32, OBS_SPACE, ACTION_SPACE, device="cpu")
+        memmap_dir = memmap.memmap_dir
+        assert (memmap_dir / "obs.dat").exists()
+
+        del memmap
+        gc.collect()
+
+        assert not memmap_dir.exists()
+
+
+class TestReplayBufferOptions:
+    """Tests for replay_buffer_options."""
+
+    def test_default_keeps_timeout_handling(self):
+        """Without memory optimization SB3's timeout handling stays on."""
+        assert replay_buffer_options(False) == {"optimize_memory_usage": False}
+
+    def test_optimized_disables_timeout_handling(self):
+        """SB3 only accepts optimize_memory_usage without timeout handling."""
+        options = replay_buffer_options(True)
+
+        assert options["optimize_memory_usage"] is True
+        assert options["replay_buffer_kwargs"] == {"handle_timeout_termination": False}
+
+        # SB3 raises for optimize_memory_usage with timeout handling
+        ReplayBuffer(
+            32,
+            OBS_SPACE,
+            ACTION_SPACE,
+            device="cpu",
+            optimize_memory_usage=True,
+            **options["replay_buffer_kwargs"],
+        )
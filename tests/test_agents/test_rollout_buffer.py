@@ -0,0 +1,85 @@
+"""
+Tests for FastGAERolloutBuffer.
+"""
+
+import numpy as np
+import pytest
+import torch
+from gymnasium import spaces
+from stable_baselines3.common.buffers import RolloutBuffer
+
+from solana_rl_bot.agents.rollout_buffer import FastGAERolloutBuffer
+
+
+OBS_SPACE = spaces.Box(low=-1.0, high=1.0, shape=(3,), dtype=np.float32)
+ACTION_SPACE = spaces.Discrete(3)
+BUFFER_SIZE = 64
+N_ENVS = 4
+
+
+def fill(buffer, seed: int, episode_start_prob: float) -> None:
+    """Add one full rollout of random transitions."""
+    rng = np.random.default_rng(seed)
+    for _ in range(BUFFER_SIZE):
+        buffer.add(
+            rng.uniform(-1, 1, size=(N_ENVS, 3)).astype(np.float32),
+            rng.integers(0, 3, size=(N_ENVS, 1)),
+            rng.normal(size=N_ENVS).astype(np.float32),
+            rng.random(N_ENVS) < episode_start_prob,
+            torch.as_tensor(rng.normal(size=(N_ENVS, 1)), dtype=torch.float32),
+            torch.as_tensor(rng.normal(size=N_ENVS), dtype=torch.float32),
+        )
+
+
+def make_buffer(cls, gamma: float, gae_lambda: float):
+    """Reset rollout buffer of the given class."""
+    buffer = cls(
+        BUFFER_SIZE,
+        OBS_SPACE,
+        ACTION_SPACE,
+        device="cpu",
+        gae_lambda=gae_lambda,
+        gamma=gamma,
+        n_envs=N_ENVS,
+    )
+    buffer.reset()
+    return buffer
+
+
+class TestFastGAERolloutBuffer:
+    """FastGAERolloutBuffer must match SB3's RolloutBuffer exactly."""
+
+    @pytest.mark.parametrize("episode_start_prob", [0.0, 0.1, 1.0])
+    @pytest.mark.parametrize("dones", ["none", "random", "all"])
+    @pytest.mark.parametrize("gamma,gae_lambda", [(0.99, 0.95), (0.9, 1.0), (0.5, 0.0)])
+    def test_matches_sb3(self, episode_start_prob, dones, gamma, gae_lambda):
+        """Advantages and returns equal SB3's for random rollouts."""
+        rng = np.random.default_rng(123)
+        last_values = torch.as_tensor(rng.normal(size=(N_ENVS, 1)), dtype=torch.float32)
+        last_dones = {
+            "none": np.zeros(N_ENVS, dtype=bool),
+            "random": rng.random(N_ENVS) < 0.5,
+            "all": np.ones(N_ENVS, dtype=bool),
+        }[dones]
+
+        reference = make_buffer(RolloutBuffer, gamma, gae_lambda)
+        fast = make_buffer(FastGAERolloutBuffer, gamma, gae_lambda)
+        fill(reference, 0, episode_start_prob)
+        fill(fast, 0, episode_start_prob)
+
+        reference.compute_returns_and_advantage(last_values, last_dones)
+        fast.compute_returns_and_advantage(last_values, last_dones)
+
+        assert fast.advantages.dtype == reference.advantages.dtype
+        np.testing.assert_allclose(fast.advantages, reference.advantages, rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(fast.returns, reference.returns, rtol=1e-5, atol=1e-5)
+
+    def test_last_values_not_modified(self):
+        """The caller's last_values tensor is left untouched."""
+        last_values = torch.ones((N_ENVS, 1))
+        fast = make_buffer(FastGAERolloutBuffer, 0.99, 0.95)
+        fill(fast, 0, 0.1)
+
+        fast.compute_returns_and_advantage(last_values, np.zeros(N_ENVS, dtype=bool))
+
+        assert torch.equal(last_values, torch.ones((N_ENVS, 1)))
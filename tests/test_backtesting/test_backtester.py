@@ -0,0 +1,43 @@
+"""
+Tests for Backtester.
+"""
+
+import numpy as np
+import pytest
+
+from solana_rl_bot.backtesting import Backtester
+from solana_rl_bot.backtesting.backtester import RandomAgent
+from solana_rl_bot.environment import TradingEnv
+
+
+@pytest.fixture
+def backtester(market_df):
+    """Backtester on the synthetic market data."""
+    return Backtester(TradingEnv(df=market_df, window_size=20))
+
+
+class TestRunMultipleBacktests:
+    """Tests for Backtester.run_multiple_backtests."""
+
+    def test_parallel_matches_sequential(self, backtester):
+        """Seeded runs give the same results in worker processes and in-process."""
+        agent = RandomAgent(backtester.env.action_space)
+
+        sequential = backtester.run_multiple_backtests(agent, n_runs=3, n_jobs=1)
+        parallel = backtester.run_multiple_backtests(agent, n_runs=3, n_jobs=2)
+
+        for seq, par in zip(sequential, parallel):
+            assert seq["steps"] == par["steps"]
+            np.testing.assert_array_equal(seq["actions_history"], par["actions_history"])
+            np.testing.assert_allclose(seq["portfolio_history"], par["portfolio_history"])
+
+    def test_unpicklable_agent_runs_sequentially(self, backtester):
+        """A closure agent falls back to the sequential path instead of failing."""
+        action_space = backtester.env.action_space
+
+        def random_agent(observation):
+            return action_space.sample()
+
+        results = backtester.run_multiple_backtests(random_agent, n_runs=2, n_jobs=2)
+
+        assert len(results) == 2
@@ -0,0 +1,87 @@
+"""
+Tests for PerformanceMetrics.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from solana_rl_bot.backtesting import PerformanceMetrics
+
+
+PORTFOLIO_VALUES = np.array([10000.0, 10050.0, 10020.0, 10100.0, 10080.0, 10150.0, 10120.0])
+
+
+def simple_returns(portfolio_values: np.ndarray) -> np.ndarray:
+    """Step returns, computed independently of metrics.py."""
+    return np.array(
+        [(b - a) / a for a, b in zip(portfolio_values[:-1], portfolio_values[1:])]
+    )
+
+
+class TestAnnualization:
+    """Sharpe and volatility scale with the bar frequency."""
+
+    def test_five_minute_bars(self):
+        """5-minute timestamps annualize with sqrt(steps per year)."""
+        timestamps = pd.date_range(
+            "2024-01-01", periods=len(PORTFOLIO_VALUES), freq="5min"
+        ).to_pydatetime().tolist()
+        metrics = PerformanceMetrics(risk_free_rate=0.02)
+
+        result = metrics.calculate_all_metrics(PORTFOLIO_VALUES, [], 10000.0, timestamps)
+
+        returns = simple_returns(PORTFOLIO_VALUES)
+        steps_per_year = 365.25 * 24 * 12
+        rf_per_step = 0.02 / steps_per_year
+        volatility = returns.std()
+
+        assert result["volatility"] == pytest.approx(volatility)
+        assert result["annualized_volatility"] == pytest.approx(
+            volatility * math.sqrt(steps_per_year)
+        )
+        assert result["sharpe_ratio"] == pytest.approx(
+            (returns.mean() - rf_per_step) / volatility * math.sqrt(steps_per_year)
+        )
+
+    def test_without_timestamps_uses_252(self):
+        """Without timestamps returns count as daily (sqrt(252), rf / 252)."""
+        metrics = PerformanceMetrics(risk_free_rate=0.02)
+
+        result = metrics.calculate_all_metrics(PORTFOLIO_VALUES, [], 10000.0)
+
+        returns = simple_returns(PORTFOLIO_VALUES)
+        volatility = returns.std()
+
+        assert result["annualized_volatility"] == pytest.approx(volatility * math.sqrt(252))
+        assert result["sharpe_ratio"] == pytest.approx(
+            (returns.mean() - 0.02 / 252) / volatility * math.sqrt(252)
+        )
+
+
+class TestSortino:
+    """Sortino uses the full-sample downside semideviation."""
+
+    def test_matches_formula(self):
+        """Denominator is sqrt(mean(min(r, 0)^2)) over all returns."""
+        metrics = PerformanceMetrics()
+
+        result = metrics.calculate_all_metrics(PORTFOLIO_VALUES, [], 10000.0)
+
+        returns = simple_returns(PORTFOLIO_VALUES)
+        downside = math.sqrt(sum(min(r, 0.0) ** 2 for r in returns) / len(returns))
+
+        assert result["sortino_ratio"] == pytest.approx(
+            returns.mean() / downside * math.sqrt(252)
+        )
+
+    def test_no_negative_returns_is_inf(self):
+        """Without losing steps the Sortino ratio is infinite."""
+        metrics = PerformanceMetrics()
+        portfolio_values = np.array([10000.0, 10010.0, 10010.0, 10030.0])
+
+        result = metrics.calculate_all_metrics(portfolio_values, [], 10000.0)
+
+        assert result["sortino_ratio"] == float("inf")
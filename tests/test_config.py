@@ -19,6 +19,7 @@ from solana_rl_bot.config import (
     TradingMode,
     PositionSizing,
 )
+from solana_rl_bot.config.loader import _YAML_CACHE, _load_yaml_config, compile_yaml_config
 
 
 @pytest.fixture
@@ -81,6 +82,18 @@ class TestDatabaseConfig:
         assert "postgresql+psycopg2://" in conn_str
         assert "postgres:secret123@localhost:5432/trading_bot" in conn_str
 
+    def test_connection_string_after_model_copy(self):
+        """A copied config connects to its own host."""
+        config = DatabaseConfig().model_copy(update={"host": "otherhost"})
+        assert "@otherhost:5432/trading_bot" in config.get_connection_string()
+
+    def test_connection_string_after_assignment(self):
+        """A changed password shows up in the connection string."""
+        config = DatabaseConfig(password="old")
+        config.get_connection_string()
+        config.password = "new"
+        assert "postgres:new@" in config.get_connection_string()
+
     def test_connection_string_no_password(self):
         """Test connection string without password."""
         config = DatabaseConfig(password="secret123")
@@ -426,6 +439,65 @@ exchange:
         assert "10000" in config_json
 
 
+class TestPrecompiledConfig:
+    """Tests for precompiled YAML configs."""
+
+    @pytest.fixture
+    def yaml_file(self, tmp_path):
+        """Small YAML config; the parse cache is cleared around the test."""
+        config_file = tmp_path / "production.yaml"
+        config_file.write_text("trading:\n  initial_capital: 5000\n")
+        _YAML_CACHE.clear()
+        yield config_file
+        _YAML_CACHE.clear()
+
+    def test_compile_and_load(self, yaml_file):
+        """A compiled config is loaded without parsing the YAML."""
+        compiled_path = compile_yaml_config(yaml_file)
+        assert compiled_path == yaml_file.with_suffix(".marshal")
+
+        with patch("solana_rl_bot.config.loader.yaml.load", side_effect=AssertionError):
+            config = _load_yaml_config(yaml_file, env={})
+
+        assert config == {"trading": {"initial_capital": 5000}}
+
+    def test_stale_compiled_config(self, yaml_file):
+        """A changed YAML file wins over the old compiled config."""
+        compile_yaml_config(yaml_file)
+        yaml_file.write_text("trading:\n  initial_capital: 7000\n")
+
+        config = _load_yaml_config(yaml_file, env={})
+
+        assert config["trading"]["initial_capital"] == 7000
+
+    @pytest.mark.parametrize("content", [b"", b"garbage", b"\xff\x00", b"N"])
+    def test_corrupt_compiled_config(self, yaml_file, content):
+        """An unreadable compiled config falls back to the YAML file."""
+        yaml_file.with_suffix(".marshal").write_bytes(content)
+
+        config = _load_yaml_config(yaml_file, env={})
+
+        assert config["trading"]["initial_capital"] == 5000
+
+    def test_disabled_via_env_snapshot(self, yaml_file):
+        """CONFIG_USE_PRECOMPILED=0 in the env snapshot skips the compiled config."""
+        compile_yaml_config(yaml_file)
+
+        with patch("solana_rl_bot.config.loader.marshal.loads", side_effect=AssertionError):
+            config = _load_yaml_config(yaml_file, env={"CONFIG_USE_PRECOMPILED": "0"})
+
+        assert config["trading"]["initial_capital"] == 5000
+
+    def test_load_config_uses_compiled(self, clean_config, yaml_file):
+        """load_config picks up the compiled config."""
+        compile_yaml_config(yaml_file)
+
+        with patch("solana_rl_bot.config.loader.yaml.load", side_effect=AssertionError):
+            config = load_config(config_path=str(yaml_file))
+
+        assert config.trading.initial_capital == 5000.0
+
+
 class TestConfigIntegration:
     """Integration tests for complete config system."""
 
@@ -0,0 +1,76 @@
+"""
+Tests for the cached feature loader.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from solana_rl_bot.data.processors import load_features
+
+
+@pytest.fixture
+def features_csv(tmp_path):
+    """Small feature CSV with a DatetimeIndex."""
+    index = pd.date_range("2024-01-01", periods=10, freq="h", name="timestamp")
+    df = pd.DataFrame(
+        {"close": np.linspace(100, 110, 10), "rsi": np.linspace(30, 70, 10)}, index=index
+    )
+    path = tmp_path / "features.csv"
+    df.to_csv(path)
+    return path
+
+
+class TestLoadFeatures:
+    """Tests for load_features."""
+
+    def test_matches_csv(self, features_csv, tmp_path):
+        """Loaded frame equals the parsed CSV, with float32 columns."""
+        df = load_features(features_csv, cache_dir=tmp_path / "cache")
+        expected = pd.read_csv(features_csv, index_col=0, parse_dates=True)
+
+        assert (df.dtypes == np.float32).all()
+        pd.testing.assert_frame_equal(df, expected.astype("float32"))
+        assert df.attrs == {}
+
+    def test_cache_written_to_cache_dir(self, features_csv, tmp_path):
+        """The pickle lands in cache_dir, not next to the CSV."""
+        load_features(features_csv, cache_dir=tmp_path / "cache")
+
+        assert (tmp_path / "cache" / "features.pkl").exists()
+        assert not features_csv.with_suffix(".pkl").exists()
+
+    def test_second_load_uses_cache(self, features_csv, tmp_path):
+        """An unchanged CSV is not parsed again."""
+        first = load_features(features_csv, cache_dir=tmp_path / "cache")
+
+        with patch("pandas.read_csv", side_effect=AssertionError("CSV re-read")):
+            second = load_features(features_csv, cache_dir=tmp_path / "cache")
+
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_changed_csv_invalidates_cache(self, features_csv, tmp_path):
+        """A CSV with a new size or mtime is parsed again."""
+        load_features(features_csv, cache_dir=tmp_path / "cache")
+
+        df = pd.read_csv(features_csv, index_col=0, parse_dates=True)
+        df["close"] = df["close"] * 2
+        df.to_csv(features_csv)
+
+        reloaded = load_features(features_csv, cache_dir=tmp_path / "cache")
+        np.testing.assert_allclose(reloaded["close"], df["close"].astype("float32"))
+
+    def test_cache_without_csv(self, features_csv, tmp_path):
+        """Without the CSV the cache is still used."""
+        first = load_features(features_csv, cache_dir=tmp_path / "cache")
+        features_csv.unlink()
+
+        second = load_features(features_csv, cache_dir=tmp_path / "cache")
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_missing_csv_and_cache(self, tmp_path):
+        """Without CSV and cache a FileNotFoundError is raised."""
+        with pytest.raises(FileNotFoundError):
+            load_features(tmp_path / "missing.csv", cache_dir=tmp_path / "cache")
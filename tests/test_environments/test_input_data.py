@@ -0,0 +1,43 @@
+"""
+Tests that the environments leave the caller's DataFrame untouched.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from solana_rl_bot.environment import AdvancedTradingEnv, ContinuousTradingEnv, TradingEnv
+
+
+@pytest.mark.parametrize("env_cls", [TradingEnv, ContinuousTradingEnv, AdvancedTradingEnv])
+class TestInputDataUnchanged:
+    """The envs alias the caller's df instead of copying it, so they must never write to it."""
+
+    def test_episode_leaves_df_unchanged(self, env_cls, market_df):
+        """A full random episode does not modify the parent frame."""
+        expected = market_df.copy(deep=True)
+        env = env_cls(df=market_df, window_size=20)
+        env.action_space.seed(0)
+
+        env.reset(seed=0)
+        done = False
+        while not done:
+            _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+            done = terminated or truncated
+        env.reset(seed=1)
+
+        pd.testing.assert_frame_equal(market_df, expected)
+
+    def test_view_leaves_parent_unchanged(self, env_cls, market_df):
+        """An env on an iloc slice does not write through to the parent frame."""
+        expected = market_df.copy(deep=True)
+        env = env_cls(df=market_df.iloc[50:], window_size=20)
+
+        env.reset(seed=0)
+        for _ in range(100):
+            _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+            if terminated or truncated:
+                break
+
+        pd.testing.assert_frame_equal(market_df, expected)
+        assert np.shares_memory(env.df["close"].to_numpy(), market_df["close"].to_numpy())
@@ -0,0 +1,91 @@
+"""
+Tests for the shared-memory env factories.
+"""
+
+import numpy as np
+import pytest
+
+from solana_rl_bot.environment import (
+    ContinuousTradingEnv,
+    TradingEnv,
+    build_env_fn,
+    make_vec_env,
+)
+
+
+ACTIONS = np.tile([1, 0, 0, 2, 0], 40)
+
+
+@pytest.fixture
+def env_fn(market_df):
+    """Shared-memory factory for TradingEnv on the synthetic market data."""
+    return build_env_fn(market_df, window_size=20)
+
+
+class TestBuildEnvFn:
+    """Envs built from shared memory behave like envs built from the DataFrame."""
+
+    def test_same_data_as_dataframe_env(self, env_fn, market_df):
+        """Features and prices equal those of a directly built TradingEnv."""
+        shared = env_fn()
+        direct = TradingEnv(df=market_df, window_size=20)
+
+        assert shared.features == direct.features
+        np.testing.assert_array_equal(shared._feature_arr, direct._feature_arr)
+        np.testing.assert_array_equal(shared._prices, direct._prices)
+
+    def test_same_episode_as_dataframe_env(self, env_fn, market_df):
+        """Stepping both envs with the same actions yields identical transitions."""
+        shared = env_fn()
+        direct = TradingEnv(df=market_df, window_size=20)
+
+        obs_shared, _ = shared.reset(seed=0)
+        obs_direct, _ = direct.reset(seed=0)
+        np.testing.assert_array_equal(obs_shared, obs_direct)
+
+        for action in ACTIONS:
+            obs_shared, reward_shared, term_shared, trunc_shared, _ = shared.step(action)
+            obs_direct, reward_direct, term_direct, trunc_direct, _ = direct.step(action)
+
+            np.testing.assert_array_equal(obs_shared, obs_direct)
+            assert reward_shared == reward_direct
+            assert (term_shared, trunc_shared) == (term_direct, trunc_direct)
+            if term_direct or trunc_direct:
+                break
+
+    def test_data_is_read_only(self, env_fn):
+        """Workers map the shared arrays read-only."""
+        env = env_fn()
+
+        with pytest.raises(ValueError):
+            env.df["close"].to_numpy()[0] = 0.0
+
+    def test_subproc_vec_env(self, env_fn, market_df):
+        """SubprocVecEnv workers rebuild the env from the pickled factory."""
+        vec_env = make_vec_env(env_fn=env_fn, n_envs=2, vec_env_cls="subproc")
+        try:
+            obs = vec_env.reset()
+        finally:
+            vec_env.close()
+
+        direct_obs, _ = TradingEnv(df=market_df, window_size=20).reset()
+        np.testing.assert_array_equal(obs[0], direct_obs)
+        np.testing.assert_array_equal(obs[1], direct_obs)
+
+    def test_continuous_env(self, market_df):
+        """ContinuousTradingEnv built from shared memory matches the DataFrame env."""
+        shared = build_env_fn(market_df, ContinuousTradingEnv, window_size=20)()
+        direct = ContinuousTradingEnv(df=market_df, window_size=20)
+
+        assert shared.features == direct.features
+        obs_shared, _ = shared.reset(seed=0)
+        obs_direct, _ = direct.reset(seed=0)
+        np.testing.assert_allclose(obs_shared, obs_direct, rtol=1e-6)
+
+        for value in np.tile([0.9, 0.0, -0.9], 20):
+            action = np.array([value], dtype=np.float32)
+            obs_shared, reward_shared, *_ = shared.step(action)
+            obs_direct, reward_direct, *_ = direct.step(action)
+
+            np.testing.assert_allclose(obs_shared, obs_direct, rtol=1e-6)
+            assert reward_shared == pytest.approx(reward_direct)
@@ -0,0 +1,189 @@
+"""
+Tests for TradingEnv.
+"""
+
+import numpy as np
+import pytest
+
+from solana_rl_bot.environment import TradeStats, TradingEnv
+from solana_rl_bot.environment.trading_env import TRADE_DTYPE
+
+
+@pytest.fixture
+def env(market_df):
+    """TradingEnv on the synthetic market data."""
+    return TradingEnv(df=market_df, window_size=20)
+
+
+def random_actions(n: int, seed: int = 0) -> np.ndarray:
+    """Random Hold/Buy/Sell actions."""
+    return np.random.default_rng(seed).integers(0, 3, size=n)
+
+
+def run_episode(env, seed: int = 0) -> None:
+    """Reset env and run a full random episode."""
+    env.reset(seed=seed)
+    env.step_batch(random_actions(len(env.df), seed))
+
+
+class TestStepBatch:
+    """step_batch() must match stepping one action at a time."""
+
+    def test_matches_step(self, env, market_df):
+        """Rewards, final state and trades equal those of step()."""
+        actions = random_actions(len(market_df))
+        reference = TradingEnv(df=market_df, window_size=20)
+
+        env.reset(seed=0)
+        reference.reset(seed=0)
+
+        rewards, done = env.step_batch(actions)
+
+        expected = []
+        for action in actions:
+            _, reward, terminated, truncated, _ = reference.step(action)
+            expected.append(reward)
+            if terminated or truncated:
+                break
+
+        assert done
+        np.testing.assert_allclose(rewards, np.array(expected, dtype=np.float32))
+        assert env.current_step == reference.current_step
+        assert env.balance == reference.balance
+        assert env.total_reward == pytest.approx(reference.total_reward)
+        assert env.trades == reference.trades
+
+    def test_stops_at_episode_end(self, env, market_df):
+        """No actions are executed after the episode ended."""
+        env.reset(seed=0)
+
+        rewards, done = env.step_batch(np.zeros(len(market_df) * 2, dtype=np.int8))
+
+        assert done
+        assert len(rewards) == len(market_df) - env.window_size - 1
+
+    def test_partial_batch(self, env):
+        """A short batch runs all of its actions without ending the episode."""
+        env.reset(seed=0)
+
+        rewards, done = env.step_batch(random_actions(10))
+
+        assert not done
+        assert len(rewards) == 10
+        assert env.current_step == env.window_size + 10
+
+
+class TestTradeLog:
+    """trade_records is the single trade log; trades and statistics derive from it."""
+
+    def test_trades_match_records(self, env):
+        """Each record maps to one BUY or SELL dict with the same values."""
+        run_episode(env)
+        records = env.trade_records
+        trades = env.trades
+
+        assert len(records) > 0
+        assert len(trades) == len(records)
+        for record, trade in zip(records, trades):
+            assert trade["step"] == record["step"]
+            assert trade["price"] == record["price"]
+            assert trade["balance"] == record["balance"]
+            if record["side"] == 1:
+                assert trade["action"] == "BUY"
+                assert trade["amount"] == record["amount"]
+            else:
+                assert trade["action"] == "SELL"
+                assert trade["profit"] == record["profit"]
+                assert trade["profit_pct"] == record["profit_pct"]
+
+    def test_trades_alternate(self, env):
+        """A long-only env alternates BUY and SELL."""
+        run_episode(env)
+        sides = env.trade_records["side"]
+
+        np.testing.assert_array_equal(sides[::2], 1)
+        np.testing.assert_array_equal(sides[1::2], -1)
+
+    def test_statistics_match_trade_dicts(self, env):
+        """get_trade_statistics() equals a computation over the trade dicts."""
+        run_episode(env)
+        trades = env.trades
+        profits = [t["profit"] for t in trades if t["action"] == "SELL"]
+        profit_pcts = [t["profit_pct"] for t in trades if t["action"] == "SELL"]
+        wins = [p for p in profits if p > 0]
+
+        stats = env.get_trade_statistics()
+
+        assert stats["total_trades"] == len(trades)
+        assert stats["completed_trades"] == len(profits)
+        assert stats["winning_trades"] == len(wins)
+        assert stats["losing_trades"] == len(profits) - len(wins)
+        assert stats["win_rate"] == pytest.approx(len(wins) / len(profits))
+        assert stats["total_profit"] == pytest.approx(sum(profits))
+        assert stats["avg_profit"] == pytest.approx(np.mean(profits))
+        assert stats["avg_profit_pct"] == pytest.approx(np.mean(profit_pcts) * 100)
+        assert stats["max_profit"] == max(profits)
+        assert stats["max_loss"] == min(profits)
+        assert stats["total_return"] == pytest.approx(env.total_return)
+        assert env.trade_stats.std_return == pytest.approx(np.std(profit_pcts))
+
+    def test_info_counts_trades(self, env):
+        """info["num_trades"] counts the records."""
+        env.reset(seed=0)
+        _, _, _, _, info = env.step(1)
+
+        assert info["num_trades"] == len(env.trade_records) == 1
+
+    def test_reset_clears_log(self, env):
+        """After reset() no trades are left."""
+        run_episode(env)
+        env.reset()
+
+        assert len(env.trade_records) == 0
+        assert env.trades == []
+        assert env.get_trade_statistics() == {"total_trades": 0}
+
+    def test_records_view_is_overwritten_after_reset(self, env):
+        """trade_records is a view into the reused buffer; copies stay valid."""
+        run_episode(env, seed=0)
+        view = env.trade_records
+        kept = env.trade_records.copy()
+        first_trades = env.trades
+
+        run_episode(env, seed=1)
+
+        assert np.shares_memory(view, env.trade_records)
+        assert not np.array_equal(view, kept)
+        assert [r["step"] for r in kept] == [t["step"] for t in first_trades]
+
+    def test_buffer_grows(self, env):
+        """Trades beyond the initial capacity are kept."""
+        env.reset(seed=0)
+        env._trade_buf = np.empty(2, dtype=TRADE_DTYPE)
+
+        env.step_batch(np.tile([1, 2], 20))
+
+        assert len(env.trade_records) > 2
+        assert len(env.trades) == len(env.trade_records)
+
+
+class TestTradeStats:
+    """Tests for TradeStats.from_records."""
+
+    def test_empty(self):
+        """No trades give zeroed statistics."""
+        stats = TradeStats.from_records(np.empty(0, dtype=TRADE_DTYPE))
+
+        assert stats == TradeStats()
+        assert stats.win_rate == 0.0
+        assert stats.std_return == 0.0
+
+    def test_only_buys(self):
+        """Open positions count as trades but not as completed trades."""
+        records = np.zeros(1, dtype=TRADE_DTYPE)
+        records["side"] = 1
+
+        stats = TradeStats.from_records(records)
+
+        assert stats.n_trades == 1
+        assert stats.n_completed == 0